@@ -13,6 +13,11 @@ from mercearia.infra.database import Base # <--- Ajuste seu caminho aqui!
 from mercearia.infra.models.favoritos_model import FavoritoModel # <--- Ajuste seu caminho aqui!
 from mercearia.infra.models.produto_model import ProdutoModel # <--- Ajuste seu caminho aqui! 
 from mercearia.infra.models.user_model import UserModel # <--- Ajuste seu caminho aqui!
+from mercearia.infra.models.refresh_token_model import RefreshTokenModel
+from mercearia.infra.models.produto_tombstone_model import ProdutoTombstoneModel
+from mercearia.infra.models.categoria_model import CategoriaModel
+from mercearia.infra.models.marca_model import MarcaModel
+from mercearia.infra.models.produto_facet_model import ProdutoFacetCountModel
 
 config = context.config
 if config.config_file_name is not None:
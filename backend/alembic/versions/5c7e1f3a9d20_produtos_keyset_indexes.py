@@ -0,0 +1,30 @@
+"""produtos_keyset_indexes
+
+Revision ID: 5c7e1f3a9d20
+Revises: 8b2e4d7c9a10
+Create Date: 2026-10-18 11:20:35.771023
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c7e1f3a9d20'
+down_revision: Union[str, Sequence[str], None] = '8b2e4d7c9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_produtos_nome_id', 'produtos', ['nome', 'id'], unique=False)
+    op.create_index('ix_produtos_preco_id', 'produtos', ['preco', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_produtos_preco_id', table_name='produtos')
+    op.drop_index('ix_produtos_nome_id', table_name='produtos')
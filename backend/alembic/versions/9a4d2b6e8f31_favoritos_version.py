@@ -0,0 +1,31 @@
+"""favoritos_version
+
+Revision ID: 9a4d2b6e8f31
+Revises: 5c7e1f3a9d20
+Create Date: 2026-10-18 12:05:52.430118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d2b6e8f31'
+down_revision: Union[str, Sequence[str], None] = '5c7e1f3a9d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('favoritos_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'favoritos_version')
@@ -0,0 +1,47 @@
+"""produtos_favoritos_count
+
+Revision ID: a7d3e9f1c5b2
+Revises: e5b9c2f4a6d8
+Create Date: 2026-10-18 16:02:11.583904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9f1c5b2'
+down_revision: Union[str, Sequence[str], None] = 'e5b9c2f4a6d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'produtos',
+        sa.Column('favoritos_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE produtos p
+        SET favoritos_count = c.total
+        FROM (
+            SELECT produto_id, count(*) AS total
+            FROM favoritos
+            GROUP BY produto_id
+        ) c
+        WHERE c.produto_id = p.id
+        """
+    )
+    op.create_index(
+        'ix_produtos_favoritos_count_id', 'produtos', ['favoritos_count', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_produtos_favoritos_count_id', table_name='produtos')
+    op.drop_column('produtos', 'favoritos_count')
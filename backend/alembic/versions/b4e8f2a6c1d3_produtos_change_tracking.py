@@ -0,0 +1,131 @@
+"""produtos_change_tracking
+
+Revision ID: b4e8f2a6c1d3
+Revises: a7d3e9f1c5b2
+Create Date: 2026-10-18 17:20:44.107325
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8f2a6c1d3'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9f1c5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('produtos_change_seq')))
+    op.add_column(
+        'produtos',
+        sa.Column('change_version', sa.BigInteger(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'produtos',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    # Produtos existentes recebem versões antes dos triggers existirem
+    op.execute(
+        """
+        UPDATE produtos p
+        SET change_version = v.version
+        FROM (
+            SELECT id, nextval('produtos_change_seq') AS version
+            FROM (SELECT id FROM produtos ORDER BY id) ordered
+        ) v
+        WHERE v.id = p.id
+        """
+    )
+    op.create_index(
+        'ix_produtos_change_version', 'produtos', ['change_version'], unique=False
+    )
+    op.create_table(
+        'produtos_tombstones',
+        sa.Column('produto_id', sa.String(), nullable=False),
+        sa.Column('change_version', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('produto_id'),
+    )
+    op.create_index(
+        op.f('ix_produtos_tombstones_change_version'),
+        'produtos_tombstones',
+        ['change_version'],
+        unique=False,
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION produtos_track_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('produtos_change_seq'));
+            NEW.change_version := nextval('produtos_change_seq');
+            NEW.updated_at := now();
+            IF TG_OP = 'INSERT' THEN
+                DELETE FROM produtos_tombstones WHERE produto_id = NEW.id;
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION produtos_track_delete() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('produtos_change_seq'));
+            INSERT INTO produtos_tombstones (produto_id, change_version, deleted_at)
+            VALUES (OLD.id, nextval('produtos_change_seq'), now())
+            ON CONFLICT (produto_id) DO UPDATE
+            SET change_version = EXCLUDED.change_version, deleted_at = EXCLUDED.deleted_at;
+            RETURN OLD;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_track_insert BEFORE INSERT ON produtos
+        FOR EACH ROW EXECUTE FUNCTION produtos_track_change()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_track_update BEFORE UPDATE ON produtos
+        FOR EACH ROW
+        WHEN ((OLD.nome, OLD.descricao, OLD.preco, OLD.imagem)
+            IS DISTINCT FROM (NEW.nome, NEW.descricao, NEW.preco, NEW.imagem))
+        EXECUTE FUNCTION produtos_track_change()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_track_delete AFTER DELETE ON produtos
+        FOR EACH ROW EXECUTE FUNCTION produtos_track_delete()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER produtos_track_delete ON produtos')
+    op.execute('DROP TRIGGER produtos_track_update ON produtos')
+    op.execute('DROP TRIGGER produtos_track_insert ON produtos')
+    op.execute('DROP FUNCTION produtos_track_delete()')
+    op.execute('DROP FUNCTION produtos_track_change()')
+    op.drop_index(
+        op.f('ix_produtos_tombstones_change_version'), table_name='produtos_tombstones'
+    )
+    op.drop_table('produtos_tombstones')
+    op.drop_index('ix_produtos_change_version', table_name='produtos')
+    op.drop_column('produtos', 'updated_at')
+    op.drop_column('produtos', 'change_version')
+    op.execute(sa.schema.DropSequence(sa.Sequence('produtos_change_seq')))
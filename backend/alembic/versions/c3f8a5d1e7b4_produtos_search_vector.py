@@ -0,0 +1,51 @@
+"""produtos_search_vector
+
+Revision ID: c3f8a5d1e7b4
+Revises: 9a4d2b6e8f31
+Create Date: 2026-10-18 13:10:27.905412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a5d1e7b4'
+down_revision: Union[str, Sequence[str], None] = '9a4d2b6e8f31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'produtos',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('portuguese', coalesce(nome, '')), 'A') || "
+                "setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_produtos_search_vector',
+        'produtos',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_produtos_search_vector', table_name='produtos', postgresql_using='gin'
+    )
+    op.drop_column('produtos', 'search_vector')
@@ -0,0 +1,175 @@
+"""categorias_marcas_facetas
+
+Revision ID: d8a2c6e4f0b9
+Revises: b4e8f2a6c1d3
+Create Date: 2026-10-18 18:41:09.662871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a2c6e4f0b9'
+down_revision: Union[str, Sequence[str], None] = 'b4e8f2a6c1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'categorias',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('nome', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'marcas',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('nome', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.add_column('produtos', sa.Column('categoria_id', sa.String(), nullable=True))
+    op.add_column('produtos', sa.Column('marca_id', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'produtos_categoria_id_fkey', 'produtos', 'categorias',
+        ['categoria_id'], ['id'], ondelete='SET NULL',
+    )
+    op.create_foreign_key(
+        'produtos_marca_id_fkey', 'produtos', 'marcas',
+        ['marca_id'], ['id'], ondelete='SET NULL',
+    )
+    op.create_index(
+        'ix_produtos_categoria_nome_id', 'produtos', ['categoria_id', 'nome', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_produtos_marca_nome_id', 'produtos', ['marca_id', 'nome', 'id'], unique=False
+    )
+    op.create_table(
+        'produto_facet_counts',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column('categoria_id', sa.String(), nullable=True),
+        sa.Column('marca_id', sa.String(), nullable=True),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'categoria_id', 'marca_id',
+            name='uq_produto_facet_counts_par',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        'ix_produto_facet_counts_marca_id', 'produto_facet_counts', ['marca_id'], unique=False
+    )
+    # Produtos existentes entram todos no par (NULL, NULL)
+    op.execute(
+        """
+        INSERT INTO produto_facet_counts (categoria_id, marca_id, total)
+        SELECT categoria_id, marca_id, count(*)
+        FROM produtos
+        GROUP BY categoria_id, marca_id
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION produtos_facet_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+                SELECT categoria_id, marca_id, count(*) FROM new_rows
+                GROUP BY categoria_id, marca_id
+                ON CONFLICT (categoria_id, marca_id)
+                DO UPDATE SET total = f.total + EXCLUDED.total;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+                SELECT categoria_id, marca_id, -count(*) FROM old_rows
+                GROUP BY categoria_id, marca_id
+                ON CONFLICT (categoria_id, marca_id)
+                DO UPDATE SET total = f.total + EXCLUDED.total;
+            ELSE
+                INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+                SELECT categoria_id, marca_id, sum(delta)
+                FROM (
+                    SELECT o.categoria_id, o.marca_id, -1 AS delta, n.categoria_id AS nc,
+                        n.marca_id AS nm
+                    FROM old_rows o JOIN new_rows n ON n.id = o.id
+                    UNION ALL
+                    SELECT n.categoria_id, n.marca_id, 1, o.categoria_id, o.marca_id
+                    FROM old_rows o JOIN new_rows n ON n.id = o.id
+                ) d
+                WHERE (categoria_id, marca_id) IS DISTINCT FROM (nc, nm)
+                GROUP BY categoria_id, marca_id
+                ON CONFLICT (categoria_id, marca_id)
+                DO UPDATE SET total = f.total + EXCLUDED.total;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_facets_insert AFTER INSERT ON produtos
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_facets_update AFTER UPDATE ON produtos
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER produtos_facets_delete AFTER DELETE ON produtos
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+        """
+    )
+    # Mudar de categoria/marca (inclusive pelo ON DELETE SET NULL) também
+    # gera versão, para GET /produtos/changes informar o produto
+    op.execute('DROP TRIGGER produtos_track_update ON produtos')
+    op.execute(
+        """
+        CREATE TRIGGER produtos_track_update BEFORE UPDATE ON produtos
+        FOR EACH ROW
+        WHEN ((OLD.nome, OLD.descricao, OLD.preco, OLD.imagem,
+               OLD.categoria_id, OLD.marca_id)
+            IS DISTINCT FROM (NEW.nome, NEW.descricao, NEW.preco, NEW.imagem,
+                              NEW.categoria_id, NEW.marca_id))
+        EXECUTE FUNCTION produtos_track_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER produtos_track_update ON produtos')
+    op.execute(
+        """
+        CREATE TRIGGER produtos_track_update BEFORE UPDATE ON produtos
+        FOR EACH ROW
+        WHEN ((OLD.nome, OLD.descricao, OLD.preco, OLD.imagem)
+            IS DISTINCT FROM (NEW.nome, NEW.descricao, NEW.preco, NEW.imagem))
+        EXECUTE FUNCTION produtos_track_change()
+        """
+    )
+    op.execute('DROP TRIGGER produtos_facets_delete ON produtos')
+    op.execute('DROP TRIGGER produtos_facets_update ON produtos')
+    op.execute('DROP TRIGGER produtos_facets_insert ON produtos')
+    op.execute('DROP FUNCTION produtos_facet_counts()')
+    op.drop_index('ix_produto_facet_counts_marca_id', table_name='produto_facet_counts')
+    op.drop_table('produto_facet_counts')
+    op.drop_index('ix_produtos_marca_nome_id', table_name='produtos')
+    op.drop_index('ix_produtos_categoria_nome_id', table_name='produtos')
+    op.drop_constraint('produtos_marca_id_fkey', 'produtos', type_='foreignkey')
+    op.drop_constraint('produtos_categoria_id_fkey', 'produtos', type_='foreignkey')
+    op.drop_column('produtos', 'marca_id')
+    op.drop_column('produtos', 'categoria_id')
+    op.drop_table('marcas')
+    op.drop_table('categorias')
@@ -0,0 +1,43 @@
+"""produtos_preco_numeric
+
+Revision ID: e5b9c2f4a6d8
+Revises: c3f8a5d1e7b4
+Create Date: 2026-10-18 14:02:19.612530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9c2f4a6d8'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a5d1e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Arredonda para centavos; o índice (preco, id) é reconstruído junto
+    op.alter_column(
+        'produtos',
+        'preco',
+        existing_type=sa.Float(),
+        type_=sa.Numeric(precision=10, scale=2),
+        existing_nullable=False,
+        postgresql_using='round(preco::numeric, 2)',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'produtos',
+        'preco',
+        existing_type=sa.Numeric(precision=10, scale=2),
+        type_=sa.Float(),
+        existing_nullable=False,
+        postgresql_using='preco::double precision',
+    )
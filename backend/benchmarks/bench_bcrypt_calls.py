@@ -0,0 +1,96 @@
+"""Conta as operações bcrypt por requisição nos caminhos de autenticação.
+
+Uso: make bench  (ou ``python -m benchmarks.bench_bcrypt_calls``)
+
+- leitura autenticada: carregar o usuário do banco (UserModel.to_entity),
+  como faz deps.get_current_user -> 0 operações bcrypt esperadas;
+- login: LoginUser + SQLAlchemyUserRepository.login -> exatamente 1.
+"""
+
+import asyncio
+import time
+from mercearia.api import security
+from mercearia.api.password_hasher import password_hasher
+from mercearia.infra.models.favoritos_model import FavoritoModel  # noqa: F401
+from mercearia.infra.models.produto_model import ProdutoModel  # noqa: F401
+from mercearia.infra.models.user_model import UserModel
+from mercearia.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from mercearia.usecases.user.login_user import LoginUser
+
+REQUESTS = 20
+calls = {"hash": 0, "verify": 0}
+
+
+def _install_counters() -> None:
+    original_hash = security.pwd_context.hash
+    original_verify = security.pwd_context.verify
+
+    def counting_hash(*args, **kwargs):
+        calls["hash"] += 1
+        return original_hash(*args, **kwargs)
+
+    def counting_verify(*args, **kwargs):
+        calls["verify"] += 1
+        return original_verify(*args, **kwargs)
+
+    security.pwd_context.hash = counting_hash  # type: ignore[method-assign]
+    security.pwd_context.verify = counting_verify  # type: ignore[method-assign]
+
+
+class _Result:
+    def __init__(self, model):
+        self._model = model
+
+    def scalar_one_or_none(self):
+        return self._model
+
+
+class _Session:
+    """Sessão mínima que devolve sempre o mesmo usuário, sem banco."""
+
+    def __init__(self, model):
+        self._model = model
+
+    async def execute(self, stmt):
+        return _Result(self._model)
+
+
+def _report(label: str, elapsed: float) -> None:
+    total = calls["hash"] + calls["verify"]
+    print(
+        f"{label:<22} bcrypt/req={total / REQUESTS:.2f} "
+        f"(hash={calls['hash']}, verify={calls['verify']}) "
+        f"latência média={elapsed / REQUESTS * 1000:.2f} ms"
+    )
+
+
+async def main() -> None:
+    model = UserModel(
+        id="1",
+        name="Miguel Ferrari",
+        email="admin@merceariaferrari.com",
+        password=security.get_password_hash("Admin@123"),
+        role="admin",
+    )
+    _install_counters()
+
+    calls.update(hash=0, verify=0)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        model.to_entity()
+    _report("leitura autenticada", time.perf_counter() - start)
+
+    calls.update(hash=0, verify=0)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        repo = SQLAlchemyUserRepository(_Session(model))  # type: ignore[arg-type]
+        await LoginUser(repo).execute("admin@merceariaferrari.com", "Admin@123")
+    _report("login", time.perf_counter() - start)
+
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Custo de construção e memória das entidades de domínio.
+
+Uso: make bench  (ou ``python -m benchmarks.bench_entities``)
+
+Compara listas de 100k Produto/Favorito com classes equivalentes sem
+``__slots__`` (como eram antes), medindo o pico de alocação com tracemalloc
+e o tempo de construção.
+"""
+
+import time
+import tracemalloc
+import uuid
+from decimal import Decimal
+from typing import Callable
+from mercearia.domain.entities.favorito import Favorito
+from mercearia.domain.entities.produto import Produto
+
+N = 100_000
+
+
+class DictProduto:
+    # Mesmos atributos e conversão de preço de Produto: só muda o __slots__
+    def __init__(
+        self,
+        id: str,
+        nome: str,
+        descricao: str,
+        preco: Decimal | float,
+        imagem: str,
+        categoria_id: str | None = None,
+        marca_id: str | None = None,
+    ):
+        self.id = id
+        self.nome = nome
+        self.descricao = descricao
+        self.preco = preco if isinstance(preco, Decimal) else Decimal(str(preco))
+        self.imagem = imagem
+        self.categoria_id = categoria_id
+        self.marca_id = marca_id
+
+
+class DictFavorito:
+    def __init__(self, user_id: str, produto_id: str, id: str | None = None):
+        self.id = id or str(uuid.uuid4())
+        self.user_id = user_id
+        self.produto_id = produto_id
+        self.produto = None
+
+
+def _produtos(cls) -> list:
+    return [
+        cls(id=str(i), nome="Arroz", descricao="Tipo 1", preco=5.99, imagem="a.jpg")
+        for i in range(N)
+    ]
+
+
+def _favoritos(cls) -> list:
+    return [cls(user_id="u1", produto_id=str(i)) for i in range(N)]
+
+
+def _measure(build: Callable[[], list]) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return elapsed * 1000, peak / 1024 / 1024
+
+
+def main() -> None:
+    cases = [
+        ("Produto (dict)", lambda: _produtos(DictProduto)),
+        ("Produto (slots)", lambda: _produtos(Produto)),
+        ("Favorito (dict + uuid4)", lambda: _favoritos(DictFavorito)),
+        ("Favorito (slots, id lazy)", lambda: _favoritos(Favorito)),
+    ]
+    print(f"{N} objetos por caso")
+    for name, build in cases:
+        ms, mib = _measure(build)
+        print(f"{name:<28} {ms:8.1f} ms  pico {mib:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
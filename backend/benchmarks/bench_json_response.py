@@ -0,0 +1,70 @@
+"""Throughput de uma listagem de 10k produtos: Pydantic vs. encoder direto.
+
+Uso: make bench  (ou ``python -m benchmarks.bench_json_response``)
+
+Monta um app FastAPI mínimo com as duas formas de responder e mede
+requisições/s via ASGITransport (sem rede e sem banco), isolando o custo de
+montar modelos + validar ``response_model`` versus codificar as entidades
+direto em bytes com orjson.
+"""
+
+import asyncio
+import time
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from mercearia.api.encoders import encode_produtos
+from mercearia.api.json_response import FastJSONResponse
+from mercearia.api.schemas.produto_schema import ProdutoResponse
+from mercearia.domain.entities.produto import Produto
+
+N = 10_000
+REQUESTS = 30
+
+produtos = [
+    Produto(
+        id=f"{i:08d}",
+        nome=f"Produto {i}",
+        descricao="Descrição do produto",
+        preco=1 + i / 100,
+        imagem=f"produto-{i}.png",
+    )
+    for i in range(N)
+]
+app = FastAPI()
+
+
+@app.get("/pydantic", response_model=list[ProdutoResponse])
+async def pydantic_route():
+    # Caminho anterior: modelo por item + validação/serialização do response_model
+    return [
+        ProdutoResponse(
+            id=p.id, nome=p.nome, descricao=p.descricao, preco=p.preco, imagem=p.imagem
+        )
+        for p in produtos
+    ]
+
+
+@app.get("/fast", response_model=list[ProdutoResponse], response_class=FastJSONResponse)
+async def fast_route():
+    return FastJSONResponse(encode_produtos(produtos))
+
+
+async def measure(client: AsyncClient, path: str) -> tuple[float, int]:
+    size = len((await client.get(path)).content)  # aquecimento
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await client.get(path)
+    return REQUESTS / (time.perf_counter() - start), size
+
+
+async def main() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{N} produtos, {REQUESTS} requisições por caso")
+        for name, path in [("pydantic", "/pydantic"), ("orjson direto", "/fast")]:
+            rps, size = await measure(client, path)
+            print(f"{name:<14} {rps:8.1f} req/s  ({size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+import hashlib
+from fastapi import Request, Response
+
+
+def make_etag(*parts: object) -> str:
+    """ETag forte a partir das partes que definem a representação."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(p) for p in parts).encode(), digest_size=16
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+class ConditionalRequest:
+    """Dependência para GETs com If-None-Match.
+
+    Uso na rota::
+
+        if conditional.matches(etag):
+            return conditional.not_modified(etag)
+    """
+
+    # Respostas autenticadas: o navegador pode guardar, mas sempre revalida
+    cache_control = "private, no-cache"
+
+    def __init__(self, request: Request):
+        header = request.headers.get("if-none-match")
+        self._tags = (
+            {tag.strip().removeprefix("W/") for tag in header.split(",")}
+            if header
+            else set()
+        )
+
+    def matches(self, etag: str) -> bool:
+        # If-None-Match usa comparação fraca (RFC 9110, 13.1.2)
+        return "*" in self._tags or etag in self._tags
+
+    def headers(self, etag: str) -> dict[str, str]:
+        return {"ETag": etag, "Cache-Control": self.cache_control}
+
+    def not_modified(self, etag: str) -> Response:
+        return Response(status_code=304, headers=self.headers(etag))
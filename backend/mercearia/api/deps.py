@@ -1,7 +1,9 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
 from mercearia.api.settings import settings
+from mercearia.api.security import decode_token
+from mercearia.api.principal import user_from_claims
 from mercearia.domain.repositories.user_repository import UserRepository
 from mercearia.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
@@ -12,8 +14,12 @@ from mercearia.infra.repositories.sqlalchemy.sqlalchemy_produto_repository impor
 from mercearia.infra.repositories.sqlalchemy.sqlalchemy_favorito_repository import (
     SQLAlchemyFavoritoRepository,
 )
+from mercearia.infra.repositories.sqlalchemy.sqlalchemy_refresh_token_repository import (
+    SQLAlchemyRefreshTokenRepository,
+)
 from mercearia.domain.entities.user import User
 from mercearia.infra.database import async_session
+from mercearia.infra.cache.token_version_cache import token_version_cache
 import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncSession
 from collections.abc import AsyncGenerator
@@ -44,10 +50,25 @@ async def get_favorito_repository(
     return SQLAlchemyFavoritoRepository(db)
 
 
+async def get_refresh_token_repository(
+    db: AsyncSession = Depends(get_db_session),
+) -> SQLAlchemyRefreshTokenRepository:
+    return SQLAlchemyRefreshTokenRepository(db)
+
+
 # Autenticação OAuth2
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 
 
+async def _current_token_version(user_id: str, user_repo: UserRepository) -> int | None:
+    version = token_version_cache.get(user_id)
+    if version is None:
+        version = await user_repo.get_token_version(user_id)
+        if version is not None:
+            token_version_cache.set(user_id, version)
+    return version
+
+
 # Obter o usuário logado a partir do token JWT
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -59,21 +80,43 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    user: User | None
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str = str(payload.get("sub"))
-        if user_id is None:
-            raise credentials_exception
-        user = await user_repo.get_by_id(user_id)
-        if user is None:
+        payload = decode_token(token)
+        if payload.get("sub") is None:
             raise credentials_exception
+        user_id = str(payload["sub"])
+        token_version = int(payload.get("tv", 0))
+
+        if settings.AUTH_CLAIMS_ONLY and "role" in payload:
+            # Caminho rápido: usuário vem das claims, só a versão é conferida
+            current_version = await _current_token_version(user_id, user_repo)
+            if current_version != token_version:
+                raise credentials_exception
+            user = user_from_claims(payload)
+        else:
+            # O registro pode vir do cache de usuários; a revogação é
+            # conferida pela versão do token, de vida mais curta
+            user = await user_repo.get_by_id(user_id)
+            if user is None or user.token_version != token_version:
+                raise credentials_exception
+            if await _current_token_version(user_id, user_repo) != token_version:
+                raise credentials_exception
         await user_repo.set_current_user(user)
-    except JWTError:
+    except (JWTError, ValueError):
         raise credentials_exception
 
     user = await user_repo.get_current_user()
     if user is None:
         raise credentials_exception
     return user
+
+
+# Restringe a rota a usuários administradores
+async def get_current_admin(user: User = Depends(get_current_user)) -> User:
+    if user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso restrito a administradores",
+        )
+    return user
@@ -0,0 +1,50 @@
+import orjson
+from typing import Iterable
+from mercearia.domain.entities.favorito import Favorito
+from mercearia.domain.entities.produto import Produto
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+from mercearia.infra.static.image_store import image_url
+
+# Codificação direta entidade -> JSON, sem passar pelos modelos Pydantic.
+# O formato deve ser idêntico ao de ProdutoResponse/FavoritoResponse
+# (verificado em tests/api/test_encoders.py).
+
+
+def produto_dict(produto: Produto) -> dict:
+    return {
+        "id": produto.id,
+        "nome": produto.nome,
+        "descricao": produto.descricao,
+        "preco": float(produto.preco),
+        "imagem": image_url(produto.imagem),
+        "categoria_id": produto.categoria_id,
+        "marca_id": produto.marca_id,
+    }
+
+
+def encode_produtos(produtos: Iterable[Produto]) -> bytes:
+    return orjson.dumps([produto_dict(p) for p in produtos])
+
+
+def encode_favoritos(favoritos: Iterable[Favorito]) -> bytes:
+    return orjson.dumps(
+        [
+            {"id": f.user_id, "produto": produto_dict(f.produto)}
+            for f in favoritos
+            if f.produto is not None
+        ]
+    )
+
+
+def encode_changes(
+    changes: Iterable[ProdutoChange], version: int, has_more: bool
+) -> bytes:
+    changes = list(changes)
+    return orjson.dumps(
+        {
+            "version": version,
+            "has_more": has_more,
+            "produtos": [produto_dict(c.produto) for c in changes if c.produto],
+            "removidos": [c.produto_id for c in changes if c.produto is None],
+        }
+    )
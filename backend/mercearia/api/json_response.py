@@ -0,0 +1,20 @@
+import orjson
+from typing import Any
+from fastapi.responses import Response
+
+
+class FastJSONResponse(Response):
+    """Resposta JSON serializada com orjson.
+
+    Aceita bytes já codificados (ex.: ``encoders.encode_produtos``) sem
+    reprocessá-los. Rotas que a retornam continuam declarando
+    ``response_model`` para manter o schema no OpenAPI; a validação de saída
+    do FastAPI não roda porque a rota já devolve uma Response.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
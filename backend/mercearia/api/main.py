@@ -1,16 +1,39 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from mercearia.api.routes import user_route, produto_route, favorito_route
+from mercearia.api.routes import (
+    user_route,
+    produto_route,
+    favorito_route,
+    metrics_route,
+    imagem_route,
+    health_route,
+)
 from mercearia.api.openapi_tags import openapi_tags
-from mercearia.api.security import get_password_hash
+from mercearia.api.password_hasher import password_hasher
+from mercearia.api.rate_limit import login_throttle
+from mercearia.api.security import calibrate_bcrypt_rounds, configure_bcrypt_rounds
+from mercearia.api.settings import settings
+from mercearia.api.warmup import (
+    catalog_refresh_task,
+    readiness,
+    warm_up,
+    warm_up_retry_task,
+)
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 import uuid
+from decimal import Decimal
 import sqlalchemy as sa
 from mercearia.infra.database import engine, async_session, Base
 from mercearia.infra.models.produto_model import ProdutoModel
 from mercearia.infra.models.user_model import UserModel
+from mercearia.infra.cache.user_cache import user_cache
+from mercearia.infra.cache.token_version_cache import token_version_cache
+from mercearia.infra.cache.catalog_cache import catalog_cache
+from mercearia.infra.static.image_store import get_image_store
+from mercearia.infra.tasks.favoritos_count import favoritos_count_task
 
 
 @asynccontextmanager
@@ -20,6 +43,30 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     print("Tabelas do banco criadas/verificadas.")
 
+    # Calibra o custo do bcrypt para a latência alvo deste hardware
+    if settings.BCRYPT_TARGET_MS:
+        rounds, estimated_ms = await asyncio.get_running_loop().run_in_executor(
+            None,
+            calibrate_bcrypt_rounds,
+            settings.BCRYPT_TARGET_MS,
+            settings.BCRYPT_MIN_ROUNDS,
+            settings.BCRYPT_MAX_ROUNDS,
+        )
+        configure_bcrypt_rounds(rounds)
+        print(f"Custo do bcrypt calibrado: {rounds} rounds (~{estimated_ms:.0f} ms).")
+
+    # Caches do processo não podem sobreviver a um banco recriado/repopulado
+    user_cache.clear()
+    token_version_cache.clear()
+    catalog_cache.invalidate()
+    await login_throttle.reset()
+
+    # Manifesto de hashes das imagens, usado nas URLs de ProdutoResponse.imagem
+    image_store = get_image_store()
+    if image_store is not None:
+        total = await asyncio.to_thread(image_store.scan)
+        print(f"Imagens indexadas: {total}.")
+
     # Popular dados
     async with async_session() as db:
         try:
@@ -76,16 +123,21 @@ async def lifespan(app: FastAPI):
                     },
                 ]
 
-                for p in produtos_mock:
-                    await db.execute(
-                        sa.insert(ProdutoModel).values(
-                            id=str(uuid.uuid4()),
-                            nome=p["nome"],
-                            preco=p["preco"],
-                            imagem=p["imagem"],
-                            descricao=p["descricao"],
-                        )
-                    )
+                # Um único executemany; catálogos grandes usam o importador
+                # (python -m mercearia.cli.import_produtos)
+                await db.execute(
+                    sa.insert(ProdutoModel),
+                    [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "nome": p["nome"],
+                            "preco": Decimal(str(p["preco"])),
+                            "imagem": p["imagem"],
+                            "descricao": p["descricao"],
+                        }
+                        for p in produtos_mock
+                    ],
+                )
                 print("Produtos inseridos com sucesso.")
 
             # Verificar e popular usuários
@@ -112,7 +164,7 @@ async def lifespan(app: FastAPI):
                 ]
 
                 for u in users_mock:
-                    hashed_password = get_password_hash(u["password"])
+                    hashed_password = await password_hasher.hash(u["password"])
                     await db.execute(
                         sa.insert(UserModel).values(
                             id=str(uuid.uuid4()),
@@ -125,14 +177,35 @@ async def lifespan(app: FastAPI):
                 print("Usuários inseridos com sucesso.")
 
             await db.commit()
+            catalog_cache.invalidate()
 
         except Exception as e:
             print(f"Erro ao popular dados iniciais: {e}")
             await db.rollback()
 
+    # Conexões do pool e página padrão do catálogo antes do primeiro request;
+    # /health/ready só responde 200 depois disso
+    report = await warm_up()
+    print(f"Aquecimento concluído em {report['duration_ms']:.0f} ms.")
+    if not readiness.ready:
+        warm_up_retry_task.start()
+    if settings.CATALOG_REFRESH_SECONDS:
+        catalog_refresh_task.start()
+
+    # Reconciliação periódica de produtos.favoritos_count
+    if settings.FAVORITOS_COUNT_RECONCILE_SECONDS:
+        favoritos_count_task.start()
+
     yield  # Permite que a aplicação FastAPI inicie normalmente
 
-    # Finalização: dispose do engine
+    # Finalização: para as tarefas que marcam o worker pronto, sai do
+    # balanceador, encerra o pool de bcrypt e faz dispose do engine
+    await warm_up_retry_task.stop()
+    await catalog_refresh_task.stop()
+    readiness.mark_not_ready()
+    await favoritos_count_task.stop()
+    await catalog_cache.close()
+    password_hasher.shutdown()
     await engine.dispose()
     print("Engine do banco desconectado no shutdown.")
 
@@ -164,6 +237,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 
@@ -177,3 +251,8 @@ def root():
 app.include_router(user_route.router, prefix="/user", tags=["Usuários"])
 app.include_router(produto_route.router, prefix="/produtos", tags=["Produtos"])
 app.include_router(favorito_route.router, prefix="/favoritos", tags=["Favoritos"])
+app.include_router(metrics_route.router, prefix="/metrics", tags=["Métricas"])
+app.include_router(
+    imagem_route.router, prefix=settings.IMAGES_URL_PREFIX, tags=["Imagens"]
+)
+app.include_router(health_route.router, prefix="/health", tags=["Saúde"])
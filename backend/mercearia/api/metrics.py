@@ -0,0 +1,12 @@
+from typing import Callable
+
+# Fontes de métricas em memória do processo, expostas em GET /metrics
+_sources: dict[str, Callable[[], dict]] = {}
+
+
+def register_metrics(name: str, source: Callable[[], dict]) -> None:
+    _sources[name] = source
+
+
+def collect_metrics() -> dict[str, dict]:
+    return {name: source() for name, source in _sources.items()}
@@ -11,4 +11,16 @@ openapi_tags = [
         "name": "Favoritos",
         "description": "Ações para favoritar, desfavoritar e listar produtos favoritos.",
     },
+    {
+        "name": "Métricas",
+        "description": "Contadores internos de desempenho (somente administradores).",
+    },
+    {
+        "name": "Imagens",
+        "description": "Fotos dos produtos, com cache imutável para URLs com hash.",
+    },
+    {
+        "name": "Saúde",
+        "description": "Liveness e readiness (pronto só após o aquecimento).",
+    },
 ]
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Callable, TypeVar
+from mercearia.api import security
+from mercearia.api.metrics import register_metrics
+from mercearia.api.settings import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasherSaturatedError(Exception):
+    pass
+
+
+@dataclass
+class PasswordHasherMetrics:
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    queue_wait_total_ms: float = 0.0
+    queue_wait_max_ms: float = 0.0
+    service_total_ms: float = 0.0
+
+    @property
+    def service_avg_ms(self) -> float:
+        return self.service_total_ms / self.completed if self.completed else 0.0
+
+    def snapshot(self) -> dict:
+        data: dict = asdict(self)
+        data["queue_wait_avg_ms"] = (
+            self.queue_wait_total_ms / self.completed if self.completed else 0.0
+        )
+        data["service_avg_ms"] = self.service_avg_ms
+        return data
+
+
+def _timed_call(fn: Callable[..., T], *args) -> tuple[float, float, T]:
+    # Executado no worker: registra quando o job saiu da fila e quanto durou
+    started_at = time.monotonic()
+    result = fn(*args)
+    return started_at, time.monotonic() - started_at, result
+
+
+class PasswordHasher:
+    """Executa bcrypt num pool limitado para não bloquear o event loop.
+
+    Quando há mais de ``max_queue`` jobs aguardando um worker livre, novas
+    requisições são rejeitadas imediatamente com PasswordHasherSaturatedError.
+    """
+
+    def __init__(
+        self, max_workers: int = 2, max_queue: int = 32, use_processes: bool = False
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior que zero")
+        if max_queue < 0:
+            raise ValueError("max_queue não pode ser negativo")
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._use_processes = use_processes
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self.metrics = PasswordHasherMetrics()
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._in_flight - self._max_workers)
+
+    def _get_executor(self) -> Executor:
+        # Criado sob demanda para não subir processos no import do módulo
+        if self._executor is None:
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(
+            security.get_password_hash, password, security.bcrypt_rounds()
+        )
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(
+            security.verify_password, plain_password, hashed_password
+        )
+
+    async def _submit(self, fn: Callable[..., T], *args) -> T:
+        if self._in_flight >= self._max_workers + self._max_queue:
+            self.metrics.rejected += 1
+            raise PasswordHasherSaturatedError(
+                "Serviço de autenticação sobrecarregado, tente novamente"
+            )
+
+        self._in_flight += 1
+        self.metrics.submitted += 1
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.monotonic()
+        try:
+            started_at, service_s, result = await loop.run_in_executor(
+                self._get_executor(), _timed_call, fn, *args
+            )
+        finally:
+            self._in_flight -= 1
+
+        wait_ms = max(0.0, started_at - enqueued_at) * 1000
+        self.metrics.completed += 1
+        self.metrics.queue_wait_total_ms += wait_ms
+        self.metrics.queue_wait_max_ms = max(self.metrics.queue_wait_max_ms, wait_ms)
+        self.metrics.service_total_ms += service_s * 1000
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def metrics_snapshot(self) -> dict:
+        return {**self.metrics.snapshot(), "queue_depth": self.queue_depth}
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+)
+register_metrics("password_hasher", password_hasher.metrics_snapshot)
@@ -0,0 +1,28 @@
+from mercearia.domain.entities.user import User
+from mercearia.domain.value_objects.email_vo import Email
+
+
+# Claims do principal embutidas no access token
+def user_claims(user: User) -> dict:
+    return {
+        "sub": user.id,
+        "name": user.name,
+        "email": str(user.email),
+        "role": user.role,
+        "tv": user.token_version,
+    }
+
+
+# Reconstrói o usuário a partir de claims já verificadas (sem senha)
+def user_from_claims(payload: dict) -> User:
+    try:
+        return User(
+            id=str(payload["sub"]),
+            name=payload["name"],
+            email=Email(payload["email"]),
+            password=None,
+            role=payload["role"],
+            token_version=int(payload.get("tv", 0)),
+        )
+    except KeyError as e:
+        raise ValueError(f"Claim ausente no token: {e}")
@@ -0,0 +1,145 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Callable
+from mercearia.api.metrics import register_metrics
+from mercearia.api.password_hasher import password_hasher
+from mercearia.api.settings import settings
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__("Muitas tentativas, tente novamente mais tarde")
+        self.retry_after = retry_after
+
+
+class RateLimitStore(ABC):
+    """Armazena os buckets; implementações compartilhadas (Redis, Postgres)
+    permitem aplicar o mesmo limite entre vários workers."""
+
+    @abstractmethod
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0
+    ) -> float:
+        """Consumes `cost` tokens; returns 0 if allowed or the seconds to wait"""
+        ...
+
+    @abstractmethod
+    async def reset(self) -> None: ...
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ):
+        self._max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(
+        self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0
+    ) -> float:
+        now = self._clock()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+        if tokens >= cost:
+            tokens -= cost
+            retry_after = 0.0
+        else:
+            retry_after = (cost - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        # Descarta os buckets mais antigos (já estariam cheios de novo)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+
+class TokenBucketLimiter:
+    def __init__(
+        self,
+        store: RateLimitStore,
+        prefix: str,
+        capacity: float,
+        refill_per_second: float,
+    ):
+        self._store = store
+        self._prefix = prefix
+        self._capacity = capacity
+        self._refill_per_second = refill_per_second
+
+    async def take(self, key: str) -> float:
+        return await self._store.take(
+            f"{self._prefix}:{key}", self._capacity, self._refill_per_second
+        )
+
+
+@dataclass
+class ThrottleMetrics:
+    allowed: int = 0
+    throttled_ip: int = 0
+    throttled_email: int = 0
+
+
+class LoginThrottle:
+    """Admissão para rotas que executam bcrypt: limita por IP e por email."""
+
+    def __init__(
+        self, store: RateLimitStore, ip: TokenBucketLimiter, email: TokenBucketLimiter
+    ):
+        self._store = store
+        self._ip = ip
+        self._email = email
+        self.metrics = ThrottleMetrics()
+
+    async def check(self, client_ip: str | None, email: str) -> None:
+        retry_after = await self._ip.take(client_ip or "desconhecido")
+        if retry_after:
+            self.metrics.throttled_ip += 1
+            raise RateLimitExceeded(retry_after)
+
+        retry_after = await self._email.take(email.lower())
+        if retry_after:
+            self.metrics.throttled_email += 1
+            raise RateLimitExceeded(retry_after)
+
+        self.metrics.allowed += 1
+
+    async def reset(self) -> None:
+        await self._store.reset()
+
+    def metrics_snapshot(self) -> dict:
+        throttled = self.metrics.throttled_ip + self.metrics.throttled_email
+        return {
+            **asdict(self.metrics),
+            # Cada tentativa barrada deixou de executar um bcrypt
+            "cpu_saved_ms_estimate": throttled * password_hasher.metrics.service_avg_ms,
+        }
+
+
+def build_login_throttle(store: RateLimitStore) -> LoginThrottle:
+    return LoginThrottle(
+        store,
+        ip=TokenBucketLimiter(
+            store,
+            "login-ip",
+            capacity=settings.LOGIN_RATE_LIMIT_IP_BURST,
+            refill_per_second=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE / 60,
+        ),
+        email=TokenBucketLimiter(
+            store,
+            "login-email",
+            capacity=settings.LOGIN_RATE_LIMIT_EMAIL_BURST,
+            refill_per_second=settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE / 60,
+        ),
+    )
+
+
+login_throttle = build_login_throttle(InMemoryRateLimitStore())
+register_metrics("login_throttle", login_throttle.metrics_snapshot)
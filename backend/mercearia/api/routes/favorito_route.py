@@ -1,5 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends
+from mercearia.api.conditional import ConditionalRequest, make_etag
+from mercearia.api.encoders import encode_favoritos
+from mercearia.api.json_response import FastJSONResponse
 from mercearia.api.schemas.favorito_schema import FavoritoRequest, FavoritoResponse
+from mercearia.infra.static.image_store import images_version
 from mercearia.domain.entities.produto import Produto
 from mercearia.infra.repositories.sqlalchemy.sqlalchemy_favorito_repository import (
     SQLAlchemyFavoritoRepository,
@@ -9,6 +13,7 @@ from mercearia.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
 )
 from mercearia.usecases.favorito.add_favorito import AddFavorito
 from mercearia.usecases.favorito.get_user_favoritos import GetUserFavoritos
+from mercearia.usecases.favorito.get_favoritos_version import GetFavoritosVersion
 from mercearia.usecases.favorito.remove_favorito import RemoveFavorito
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from mercearia.api.deps import get_db_session, get_current_user, get_favorito_repository
@@ -20,18 +25,36 @@ router = APIRouter()
 security = HTTPBearer()
 
 
-@router.get("/", response_model=list[FavoritoResponse], summary="Listar favoritos")
+@router.get(
+    "/",
+    response_model=list[FavoritoResponse],
+    response_class=FastJSONResponse,
+    summary="Listar favoritos",
+)
 async def listar_favoritos(
     session: AsyncSession = Depends(get_db_session),
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user=Depends(get_current_user),
     repo: FavoritoRepository = Depends(get_favorito_repository),
+    conditional: ConditionalRequest = Depends(),
 ):
     try:
+        # Só as versões são lidas antes: se o cliente já tem esta lista, 304.
+        # Catálogo e manifesto de imagens entram porque a lista mostra os
+        # produtos (nome, preço, URL da imagem, categoria e marca).
+        version, catalog_version = await GetFavoritosVersion(repo).execute(user.id)
+        etag = make_etag(
+            "favoritos", user.id, version, catalog_version, images_version()
+        )
+        if conditional.matches(etag):
+            return conditional.not_modified(etag)
+
         usecase = GetUserFavoritos(repo)
 
         favoritos = await usecase.execute(user.id)
-        return [FavoritoResponse.from_entity(f) for f in favoritos]
+        return FastJSONResponse(
+            encode_favoritos(favoritos), headers=conditional.headers(etag)
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
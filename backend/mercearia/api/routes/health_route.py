@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from mercearia.api.warmup import readiness
+
+router = APIRouter()
+
+
+@router.get("/live", summary="Processo no ar")
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get(
+    "/ready",
+    summary="Pronto para receber tráfego",
+    responses={503: {"description": "Aquecendo ou encerrando"}},
+)
+async def readiness_check():
+    if not readiness.ready:
+        return JSONResponse(
+            status_code=503, content={"status": "aquecendo", **readiness.snapshot()}
+        )
+    return {"status": "pronto", **readiness.snapshot()}
@@ -0,0 +1,49 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from mercearia.api.conditional import ConditionalRequest
+from mercearia.infra.static.image_store import get_image_store
+
+router = APIRouter()
+
+# URL com hash do conteúdo nunca muda: o navegador não precisa revalidar
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Nome simples (ou hash antigo): pode mudar, então sempre revalida via ETag
+REVALIDATE = "public, no-cache"
+
+
+@router.get(
+    "/{nome}",
+    summary="Imagem de produto",
+    response_class=Response,
+    responses={304: {"description": "Não modificada"}, 404: {}},
+)
+async def servir_imagem(nome: str, request: Request):
+    store = get_image_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Imagem não encontrada")
+
+    # stat (e hash, se o arquivo mudou) fora do event loop
+    info, versioned = await asyncio.to_thread(store.resolve, nome)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Imagem não encontrada")
+
+    headers = {
+        "ETag": info.etag,
+        "Cache-Control": IMMUTABLE if versioned else REVALIDATE,
+        "Accept-Ranges": "bytes",
+    }
+    if ConditionalRequest(request).matches(info.etag):
+        return Response(status_code=304, headers=headers)
+
+    # Arquivos pequenos saem da memória; Range e arquivos grandes vão pelo
+    # FileResponse (envio zero-copy via pathsend quando o servidor suporta)
+    if "range" not in request.headers and store.cacheable(info):
+        body = store.cached(info)
+        if body is None:
+            # Falta de cache: a leitura do disco também sai do event loop
+            body = await asyncio.to_thread(store.read_small, info)
+        return Response(body, media_type=info.media_type, headers=headers)
+    return FileResponse(
+        info.path, media_type=info.media_type, headers=headers, stat_result=info.stat
+    )
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Depends
+from mercearia.api.deps import get_current_admin
+from mercearia.api.metrics import collect_metrics
+
+router = APIRouter()
+
+
+@router.get("/", summary="Métricas internas do processo")
+async def listar_metricas(admin=Depends(get_current_admin)):
+    return collect_metrics()
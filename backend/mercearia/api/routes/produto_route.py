@@ -1,30 +1,373 @@
-from fastapi import APIRouter, Depends
-from mercearia.api.schemas.produto_schema import ProdutoResponse
-from mercearia.domain.entities.produto import Produto
+from decimal import Decimal
+from typing import NamedTuple
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from mercearia.api.conditional import ConditionalRequest
+from mercearia.api.encoders import encode_changes, encode_produtos
+from mercearia.api.json_response import FastJSONResponse
+from mercearia.api.schemas.produto_schema import (
+    ProdutoBatchRequest,
+    ProdutoBatchResponse,
+    ProdutoChangesResponse,
+    ProdutoFacetsResponse,
+    ProdutoImportResponse,
+    ProdutoPopularResponse,
+    ProdutoResponse,
+)
+from mercearia.api.settings import settings
+from mercearia.domain.value_objects.produto_cursor import ProdutoSort
+from mercearia.infra.cache.catalog_cache import CatalogEntry, catalog_cache
+from mercearia.infra.database import async_session
 from mercearia.infra.repositories.sqlalchemy.sqlalchemy_produto_repository import (
     SQLAlchemyProdutoRepository,
 )
-from mercearia.usecases.produto.get_all_produtos import GetAllProdutos
+from mercearia.usecases.produto.list_produtos import ListProdutos
+from mercearia.usecases.produto.search_produtos import SearchProdutos
+from mercearia.usecases.produto.get_produto import GetProduto
+from mercearia.usecases.produto.get_produtos_by_ids import GetProdutosByIds
+from mercearia.usecases.produto.list_produtos_populares import ListProdutosPopulares
+from mercearia.usecases.produto.list_produto_changes import ListProdutoChanges
+from mercearia.usecases.produto.get_produto_facets import GetProdutoFacets
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from mercearia.api.deps import get_db_session
-import sqlalchemy
+from mercearia.api.deps import get_current_admin, get_db_session
+from mercearia.infra.importers.produto_importer import FORMATS, ProdutoImporter
+from mercearia.infra.exporters.produto_exporter import (
+    MEDIA_TYPES,
+    ProdutoExporter,
+    gzip_chunks,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 security = HTTPBearer()
 
 
-@router.get("/", response_model=list[ProdutoResponse], summary="Listar produtos")
+class _PageParams(NamedTuple):
+    # Também é a chave da página no cache do catálogo
+    limit: int
+    ordenar: str
+    after: str | None
+    min_preco: Decimal | None
+    max_preco: Decimal | None
+    categoria: str | None
+    marca: str | None
+
+
+async def _render_page(
+    session: AsyncSession, params: _PageParams
+) -> tuple[bytes, str | None]:
+    repo = SQLAlchemyProdutoRepository(session)
+    produtos, next_cursor = await ListProdutos(repo).execute(
+        params.limit,
+        params.ordenar,
+        params.after,
+        min_preco=params.min_preco,
+        max_preco=params.max_preco,
+        categoria=params.categoria,
+        marca=params.marca,
+    )
+    return encode_produtos(produtos), next_cursor
+
+
+async def _render_page_new_session(params: _PageParams) -> tuple[bytes, str | None]:
+    # A sessão da requisição já terá sido fechada quando o refresh rodar
+    async with async_session() as session:
+        return await _render_page(session, params)
+
+
+# Página padrão de GET /produtos, a mais pedida: aquecida no startup e
+# reconstruída periodicamente (mercearia.api.warmup)
+DEFAULT_PAGE = _PageParams(
+    settings.PRODUTOS_PAGE_SIZE, "nome", None, None, None, None, None
+)
+
+
+async def prewarm_catalog() -> None:
+    await catalog_cache.load(
+        DEFAULT_PAGE, lambda: _render_page_new_session(DEFAULT_PAGE)
+    )
+
+
+def _catalog_response(entry: CatalogEntry, conditional: ConditionalRequest) -> Response:
+    # O corpo continua sendo a lista; o cursor da próxima página vai no header
+    if conditional.matches(entry.etag):
+        return conditional.not_modified(entry.etag)
+    headers = conditional.headers(entry.etag)
+    if entry.next_cursor is not None:
+        headers["X-Next-Cursor"] = entry.next_cursor
+    return FastJSONResponse(entry.body, headers=headers)
+
+
+@router.get(
+    "/",
+    response_model=list[ProdutoResponse],
+    response_class=FastJSONResponse,
+    summary="Listar produtos",
+)
 async def listar_produtos(
+    limit: int = Query(
+        settings.PRODUTOS_PAGE_SIZE,
+        ge=1,
+        le=settings.PRODUTOS_MAX_PAGE_SIZE,
+        description="Quantidade máxima de produtos na página",
+    ),
+    after: str | None = Query(
+        None, description="Cursor recebido no header X-Next-Cursor"
+    ),
+    ordenar: ProdutoSort = Query("nome", description="Campo de ordenação"),
+    min_preco: Decimal | None = Query(None, ge=0, description="Preço mínimo"),
+    max_preco: Decimal | None = Query(None, ge=0, description="Preço máximo"),
+    categoria: str | None = Query(None, description="ID (slug) da categoria"),
+    marca: str | None = Query(None, description="ID (slug) da marca"),
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    conditional: ConditionalRequest = Depends(),
+):
+    # Páginas servidas do cache não tocam no banco nem no Pydantic
+    params = _PageParams(limit, ordenar, after, min_preco, max_preco, categoria, marca)
+    entry = catalog_cache.get(params)
+    if entry is None:
+        try:
+            entry = await catalog_cache.load(
+                params, lambda: _render_page(session, params)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    elif catalog_cache.is_stale(entry):
+        catalog_cache.refresh_in_background(
+            params, lambda: _render_page_new_session(params)
+        )
+    return _catalog_response(entry, conditional)
+
+
+# Declarada antes de rotas com parâmetro no caminho para não ser capturada por elas
+@router.get(
+    "/search",
+    response_model=list[ProdutoResponse],
+    response_class=FastJSONResponse,
+    summary="Buscar produtos",
+)
+async def buscar_produtos(
+    q: str = Query(..., min_length=1, description="Termos da busca"),
+    limit: int = Query(
+        settings.PRODUTOS_PAGE_SIZE,
+        ge=1,
+        le=settings.PRODUTOS_MAX_PAGE_SIZE,
+        description="Quantidade máxima de produtos na página",
+    ),
+    after: str | None = Query(
+        None, description="Cursor recebido no header X-Next-Cursor"
+    ),
     session: AsyncSession = Depends(get_db_session),
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     repo = SQLAlchemyProdutoRepository(session)
-    usecase = GetAllProdutos(repo)
-    produtos = await usecase.execute()
-    return [
-        ProdutoResponse(
-            id=p.id, nome=p.nome, descricao=p.descricao, preco=p.preco, imagem=p.imagem
+    try:
+        produtos, next_cursor = await SearchProdutos(repo).execute(q, limit, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor is not None else None
+    return FastJSONResponse(encode_produtos(produtos), headers=headers)
+
+
+@router.get(
+    "/facets",
+    response_model=ProdutoFacetsResponse,
+    summary="Contagem de produtos por categoria e marca",
+)
+async def listar_facetas(
+    categoria: str | None = Query(None, description="Filtro de categoria atual"),
+    marca: str | None = Query(None, description="Filtro de marca atual"),
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    # Lidas do agregado mantido por trigger: custo proporcional ao número de
+    # pares (categoria, marca), não ao de produtos
+    repo = SQLAlchemyProdutoRepository(session)
+    facets = await GetProdutoFacets(repo).execute(categoria, marca)
+    return ProdutoFacetsResponse.from_facets(facets)
+
+
+@router.get(
+    "/changes",
+    response_model=ProdutoChangesResponse,
+    response_class=FastJSONResponse,
+    summary="Alterações do catálogo desde uma versão",
+)
+async def listar_alteracoes(
+    since: int = Query(
+        0, ge=0, description="Última versão aplicada pelo cliente (0 = tudo)"
+    ),
+    limit: int = Query(
+        settings.PRODUTOS_CHANGES_MAX_LIMIT,
+        ge=1,
+        le=settings.PRODUTOS_CHANGES_MAX_LIMIT,
+        description="Quantidade máxima de alterações na resposta",
+    ),
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    # O cliente aplica o delta e repete com since=version enquanto has_more
+    repo = SQLAlchemyProdutoRepository(session)
+    try:
+        changes, version, has_more = await ListProdutoChanges(repo).execute(
+            since, limit
         )
-        for p in produtos
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(encode_changes(changes, version, has_more))
+
+
+@router.get(
+    "/populares",
+    response_model=list[ProdutoPopularResponse],
+    summary="Produtos mais favoritados",
+)
+async def listar_produtos_populares(
+    limit: int = Query(
+        settings.PRODUTOS_POPULARES_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PRODUTOS_MAX_PAGE_SIZE,
+        description="Quantidade de produtos no ranking",
+    ),
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    repo = SQLAlchemyProdutoRepository(session)
+    try:
+        ranking = await ListProdutosPopulares(repo).execute(limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [
+        ProdutoPopularResponse.from_ranking(produto, favoritos)
+        for produto, favoritos in ranking
     ]
+
+
+@router.post(
+    "/batch",
+    response_model=ProdutoBatchResponse,
+    summary="Buscar vários produtos por id",
+)
+async def buscar_produtos_por_ids(
+    data: ProdutoBatchRequest,
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    repo = SQLAlchemyProdutoRepository(session)
+    try:
+        produtos, missing = await GetProdutosByIds(repo).execute(data.ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProdutoBatchResponse(
+        produtos=[ProdutoResponse.from_entity(p) for p in produtos], missing=missing
+    )
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+async def _export_body(formato: str, gzip: bool):
+    # Sessão própria: precisa durar enquanto o corpo é enviado
+    async with async_session() as session:
+        exporter = ProdutoExporter(session, settings.PRODUTOS_EXPORT_CHUNK_SIZE)
+        chunks = exporter.iter_chunks(formato)
+        if gzip:
+            chunks = gzip_chunks(chunks)
+        async for chunk in chunks:
+            yield chunk
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Exportar catálogo (NDJSON ou CSV)",
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+async def exportar_produtos(
+    request: Request,
+    formato: str = Query("ndjson", description="ndjson ou csv"),
+    admin=Depends(get_current_admin),
+):
+    if formato not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Formato não suportado: {formato}")
+
+    # Corpo em blocos vindos de um cursor no servidor: memória constante,
+    # seja qual for o tamanho do catálogo. gzip se o cliente aceitar.
+    gzip = _accepts_gzip(request)
+    headers = {
+        "Content-Disposition": f'attachment; filename="produtos.{formato}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        _export_body(formato, gzip), media_type=MEDIA_TYPES[formato], headers=headers
+    )
+
+
+@router.post(
+    "/import",
+    response_model=ProdutoImportResponse,
+    summary="Importar catálogo (CSV ou NDJSON)",
+)
+async def importar_produtos(
+    arquivo: UploadFile = File(
+        ...,
+        description=(
+            "Catálogo em CSV ou NDJSON. Campos: id, nome, preco (obrigatórios), "
+            "descricao, imagem, categoria, marca (nomes; vazios mantêm os atuais)"
+        ),
+    ),
+    formato: str | None = Query(
+        None, description="csv ou ndjson; padrão: deduzido do nome do arquivo"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+    admin=Depends(get_current_admin),
+):
+    nome = arquivo.filename or ""
+    formato = formato or ("ndjson" if nome.endswith((".ndjson", ".jsonl")) else "csv")
+    if formato not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Formato não suportado: {formato}")
+
+    # UploadFile já é um arquivo temporário em disco acima de 1 MB: o
+    # importador lê em lotes sem carregar o catálogo na memória
+    importer = ProdutoImporter(
+        session,
+        batch_size=settings.PRODUTOS_IMPORT_BATCH_SIZE,
+        max_errors=settings.PRODUTOS_IMPORT_MAX_ERRORS,
+    )
+    try:
+        report = await importer.run(arquivo.file, formato)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProdutoImportResponse.from_report(report)
+
+
+@router.get("/{id}", response_model=ProdutoResponse, summary="Obter produto")
+async def obter_produto(
+    id: str,
+    session: AsyncSession = Depends(get_db_session),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    repo = SQLAlchemyProdutoRepository(session)
+    try:
+        produto = await GetProduto(repo).execute(id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return ProdutoResponse.from_entity(produto)
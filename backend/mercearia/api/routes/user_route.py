@@ -1,58 +1,136 @@
-from fastapi import APIRouter, HTTPException, Depends
+import math
+from datetime import timedelta
+from fastapi import APIRouter, HTTPException, Depends, Request
 from mercearia.api.schemas.user_schema import (
     LoginRequest,
+    RefreshTokenRequest,
     UpdatePasswordRequest,
     UserResponse,
     TokenResponse,
 )
 from mercearia.domain.entities.user import User
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
 from mercearia.domain.repositories.user_repository import UserRepository
 from mercearia.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
+from mercearia.usecases.user.issue_refresh_token import IssueRefreshToken
 from mercearia.usecases.user.login_user import LoginUser
+from mercearia.usecases.user.refresh_session import RefreshSession
+from mercearia.usecases.user.revoke_refresh_token import RevokeRefreshToken
 from mercearia.usecases.user.update_password import UpdatePassword
 import sqlalchemy
 from typing import cast, Literal
 from mercearia.api.security import create_access_token
+from mercearia.api.principal import user_claims
+from mercearia.api.password_hasher import PasswordHasherSaturatedError
+from mercearia.api.rate_limit import RateLimitExceeded, login_throttle
+from mercearia.api.settings import settings
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from mercearia.api.deps import get_db_session, get_user_repository
+from mercearia.api.deps import (
+    get_db_session,
+    get_refresh_token_repository,
+    get_user_repository,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 security = HTTPBearer()
 
+refresh_token_ttl = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+# Barra rajadas antes de gastar CPU com bcrypt
+async def _admit(request: Request, email: str) -> None:
+    client_ip = request.client.host if request.client else None
+    try:
+        await login_throttle.check(client_ip, email)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
+
+
+def _token_response(user: User, refresh_token: str) -> TokenResponse:
+    return TokenResponse(
+        access_token=create_access_token(data=user_claims(user)),
+        token_type="bearer",
+        refresh_token=refresh_token,
+        user=UserResponse(
+            nome=user.name,
+            email=str(user.email),
+            tipo=cast(Literal["user", "admin"], user.role),
+        ),
+    )
+
 
 @router.post("/login", response_model=TokenResponse, summary="Login de usuário")
 async def login(
-    data: LoginRequest, repo: UserRepository = Depends(get_user_repository)
+    data: LoginRequest,
+    request: Request,
+    repo: UserRepository = Depends(get_user_repository),
+    refresh_repo: RefreshTokenRepository = Depends(get_refresh_token_repository),
 ):
+    await _admit(request, data.email)
     try:
         usecase = LoginUser(repo)
         user: User = await usecase.execute(data.email, data.password)
-        token = create_access_token(data={"sub": user.id})
-        return TokenResponse(
-            access_token=token,
-            token_type="bearer",
-            user=UserResponse(
-                nome=user.name,
-                email=str(user.email),
-                tipo=cast(Literal["user", "admin"], user.role),
-            ),
+        refresh_token = await IssueRefreshToken(
+            refresh_repo, refresh_token_ttl
+        ).execute(user)
+        return _token_response(user, refresh_token)
+    except PasswordHasherSaturatedError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
         )
     except Exception as e:
         raise HTTPException(status_code=401, detail=str(e))
 
 
+@router.post(
+    "/refresh", response_model=TokenResponse, summary="Renovar sessão sem senha"
+)
+async def refresh(
+    data: RefreshTokenRequest,
+    repo: UserRepository = Depends(get_user_repository),
+    refresh_repo: RefreshTokenRepository = Depends(get_refresh_token_repository),
+):
+    try:
+        usecase = RefreshSession(refresh_repo, repo, refresh_token_ttl)
+        user, refresh_token = await usecase.execute(data.refresh_token)
+        return _token_response(user, refresh_token)
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.post("/logout", summary="Revogar o refresh token da sessão")
+async def logout(
+    data: RefreshTokenRequest,
+    refresh_repo: RefreshTokenRepository = Depends(get_refresh_token_repository),
+):
+    await RevokeRefreshToken(refresh_repo).execute(data.refresh_token)
+    return {"message": "Sessão encerrada com sucesso"}
+
+
 @router.put("/update-password", summary="Atualizar senha do usuário")
 async def update_password(
     data: UpdatePasswordRequest,
+    request: Request,
     session: AsyncSession = Depends(get_db_session),
     repo: UserRepository = Depends(get_user_repository),
 ):
+    await _admit(request, data.email)
     try:
         usecase = UpdatePassword(repo)
         await usecase.execute(data.email, data.new_password)
         return {"message": "Senha atualizada com sucesso"}
+    except PasswordHasherSaturatedError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
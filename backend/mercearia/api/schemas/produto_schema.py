@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from mercearia.infra.static.image_store import image_url
 
 
 class ProdutoResponse(BaseModel):
@@ -7,6 +8,8 @@ class ProdutoResponse(BaseModel):
     descricao: str = Field(..., description="Descrição do produto")
     preco: float = Field(..., gt=0, description="Preço do produto")
     imagem: str = Field(..., description="URL da foto do produto")
+    categoria_id: str | None = Field(None, description="ID (slug) da categoria")
+    marca_id: str | None = Field(None, description="ID (slug) da marca")
 
     @classmethod
     def from_entity(cls, produto):
@@ -15,5 +18,99 @@ class ProdutoResponse(BaseModel):
             nome=produto.nome,
             descricao=produto.descricao,
             preco=produto.preco,
-            imagem=produto.imagem,
+            imagem=image_url(produto.imagem),
+            categoria_id=produto.categoria_id,
+            marca_id=produto.marca_id,
+        )
+
+
+class ProdutoPopularResponse(ProdutoResponse):
+    favoritos: int = Field(..., description="Quantos usuários favoritaram")
+
+    @classmethod
+    def from_ranking(cls, produto, favoritos: int):
+        return cls(
+            **ProdutoResponse.from_entity(produto).model_dump(), favoritos=favoritos
+        )
+
+
+class ProdutoChangesResponse(BaseModel):
+    version: int = Field(..., description="Versão a enviar em since na próxima chamada")
+    has_more: bool = Field(..., description="Se há mais alterações após version")
+    produtos: list[ProdutoResponse] = Field(
+        ..., description="Produtos criados ou alterados, em ordem de versão"
+    )
+    removidos: list[str] = Field(..., description="IDs de produtos removidos")
+
+
+class FacetCountResponse(BaseModel):
+    id: str = Field(..., description="ID (slug) usado no filtro")
+    nome: str = Field(..., description="Nome para exibição")
+    total: int = Field(..., description="Produtos com este valor")
+
+
+class ProdutoFacetsResponse(BaseModel):
+    categorias: list[FacetCountResponse] = Field(
+        ..., description="Produtos por categoria (sob o filtro de marca)"
+    )
+    marcas: list[FacetCountResponse] = Field(
+        ..., description="Produtos por marca (sob o filtro de categoria)"
+    )
+
+    @classmethod
+    def from_facets(cls, facets):
+        def counts(items):
+            return [
+                FacetCountResponse(id=c.id, nome=c.nome, total=c.total) for c in items
+            ]
+
+        return cls(categorias=counts(facets.categorias), marcas=counts(facets.marcas))
+
+
+class ProdutoBatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, description="IDs dos produtos")
+
+
+class ProdutoBatchResponse(BaseModel):
+    produtos: list[ProdutoResponse] = Field(
+        ..., description="Produtos encontrados, na ordem dos ids pedidos"
+    )
+    missing: list[str] = Field(..., description="IDs que não existem")
+
+
+class ImportRowErrorResponse(BaseModel):
+    line: int = Field(..., description="Linha do arquivo")
+    message: str = Field(..., description="Motivo da rejeição")
+
+
+class ProdutoImportResponse(BaseModel):
+    rows_read: int = Field(..., description="Linhas lidas do arquivo")
+    inserted: int = Field(..., description="Produtos novos")
+    updated: int = Field(..., description="Produtos alterados")
+    unchanged: int = Field(..., description="Linhas válidas sem alteração")
+    error_count: int = Field(..., description="Linhas rejeitadas")
+    errors: list[ImportRowErrorResponse] = Field(
+        ..., description="Primeiros erros encontrados"
+    )
+    elapsed_seconds: float = Field(..., description="Duração da importação")
+    rows_per_second: float = Field(..., description="Vazão da importação")
+    cache_invalidated: bool = Field(
+        ..., description="Se o cache do catálogo deste processo foi invalidado"
+    )
+
+    @classmethod
+    def from_report(cls, report):
+        return cls(
+            rows_read=report.rows_read,
+            inserted=report.inserted,
+            updated=report.updated,
+            unchanged=report.unchanged,
+            error_count=report.error_count,
+            errors=[
+                ImportRowErrorResponse(line=e.line, message=e.message)
+                for e in report.errors
+            ],
+            elapsed_seconds=report.elapsed_seconds,
+            rows_per_second=report.rows_per_second,
+            cache_invalidated=report.cache_invalidated,
         )
@@ -18,7 +18,14 @@ class UserResponse(BaseModel):
     tipo: Literal["user", "admin"] = Field(..., description="Tipo de usuário")
 
 
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(..., description="Refresh token recebido no login")
+
+
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str
     user: UserResponse
+    refresh_token: str | None = Field(
+        None, description="Token opaco para renovar o access token sem senha"
+    )
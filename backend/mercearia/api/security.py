@@ -1,18 +1,84 @@
+import base64
+import hashlib
+import hmac
+import json
+import math
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Protocol
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from mercearia.api.metrics import register_metrics
 from mercearia.api.settings import settings
+from mercearia.infra.cache.ttl_cache import TTLCache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Custo bcrypt escolhido na calibração (None = padrão do passlib)
+_bcrypt_rounds: int | None = None
+_bcrypt_calibration: dict = {}
+
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+def get_password_hash(password, rounds: int | None = None):
+    # rounds explícito permite hashear com o custo calibrado em outro processo
+    if rounds is None:
+        return pwd_context.hash(password)
+    return pwd_context.handler("bcrypt").using(rounds=rounds).hash(password)
+
+
+def bcrypt_rounds() -> int | None:
+    return _bcrypt_rounds
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
+
+def configure_bcrypt_rounds(rounds: int) -> None:
+    # min = max = rounds faz needs_update() marcar qualquer hash com outro custo
+    global _bcrypt_rounds
+    pwd_context.update(
+        bcrypt__rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds
+    )
+    _bcrypt_rounds = rounds
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float, min_rounds: int, max_rounds: int, samples: int = 3
+) -> tuple[int, float]:
+    """Escolhe o maior custo cujo tempo estimado não passa de target_ms.
+
+    Mede o custo mínimo e extrapola: cada round a mais dobra o tempo do bcrypt.
+    """
+    handler = pwd_context.handler("bcrypt").using(rounds=min_rounds)
+    best = math.inf
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash("calibracao-bcrypt")
+        best = min(best, time.perf_counter() - start)
+
+    rounds, estimated_ms = min_rounds, best * 1000
+    while rounds < max_rounds and estimated_ms * 2 <= target_ms:
+        rounds += 1
+        estimated_ms *= 2
+
+    _bcrypt_calibration.update(
+        target_ms=target_ms,
+        measured_min_rounds_ms=best * 1000,
+        estimated_ms=estimated_ms,
+        rounds=rounds,
+    )
+    return rounds, estimated_ms
+
+
+register_metrics(
+    "bcrypt", lambda: {"rounds": _bcrypt_rounds, "calibration": _bcrypt_calibration}
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -22,11 +88,126 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def generate_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    # HMAC com a SECRET_KEY: um vazamento da tabela não expõe tokens utilizáveis
+    return hmac.new(
+        settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+class TokenVerifier(Protocol):
+    def decode(self, token: str) -> dict:
+        """Verifica assinatura e expiração; levanta JWTError se inválido"""
+        ...
+
+
+class JoseTokenVerifier:
+    def __init__(self, secret_key: str, algorithm: str):
+        self._secret_key = secret_key
+        self._algorithm = algorithm
+
+    def decode(self, token: str) -> dict:
+        return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+
+
+class HMACTokenVerifier:
+    """Verificador mínimo para HS256/384/512 usando apenas hmac da stdlib."""
+
+    _DIGESTS = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+
+    def __init__(self, secret_key: str, algorithm: str):
+        if algorithm not in self._DIGESTS:
+            raise ValueError(
+                f"Algoritmo não suportado pelo HMACTokenVerifier: {algorithm}"
+            )
+        self._secret_key = secret_key.encode()
+        self._algorithm = algorithm
+        self._digest = self._DIGESTS[algorithm]
+
+    @staticmethod
+    def _b64decode(segment: str) -> bytes:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+    def decode(self, token: str) -> dict:
+        try:
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            header = json.loads(self._b64decode(header_b64))
+            signature = self._b64decode(signature_b64)
+        except ValueError:
+            raise JWTError("Token malformado")
+        if not isinstance(header, dict) or header.get("alg") != self._algorithm:
+            raise JWTError("Algoritmo do token não permitido")
+
+        expected = hmac.new(
+            self._secret_key, f"{header_b64}.{payload_b64}".encode(), self._digest
+        ).digest()
+        if not hmac.compare_digest(expected, signature):
+            raise JWTError("Assinatura inválida")
+
+        try:
+            payload = json.loads(self._b64decode(payload_b64))
+        except ValueError:
+            raise JWTError("Payload inválido")
+        if not isinstance(payload, dict):
+            raise JWTError("Payload inválido")
+        exp = payload.get("exp")
+        if exp is not None and (
+            not isinstance(exp, (int, float)) or exp <= time.time()
+        ):
+            raise JWTError("Token expirado")
+        return payload
+
+
+def build_token_verifier(name: str) -> TokenVerifier:
+    if name == "hmac":
+        return HMACTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM)
+    if name == "jose":
+        return JoseTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM)
+    raise ValueError(f"TOKEN_VERIFIER desconhecido: {name}")
+
+
+_token_verifier: TokenVerifier = build_token_verifier(settings.TOKEN_VERIFIER)
+
+# Claims já verificadas, indexadas pelo digest do token e válidas até o "exp"
+_claims_cache: TTLCache[bytes, dict] = TTLCache(
+    max_size=settings.TOKEN_CACHE_SIZE,
+    ttl_seconds=settings.TOKEN_CACHE_DEFAULT_TTL_SECONDS,
+)
+register_metrics("token_cache", lambda: _claims_cache.stats.snapshot())
+
+
+def set_token_verifier(verifier: TokenVerifier) -> None:
+    global _token_verifier
+    _token_verifier = verifier
+    _claims_cache.clear()
+
+
+def decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _claims_cache.get(key)
+    if payload is None:
+        payload = _token_verifier.decode(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            # Converte o exp (relógio de parede) para o relógio monotônico do cache
+            _claims_cache.set(
+                key, payload, expires_at=time.monotonic() + exp - time.time()
+            )
+        else:
+            _claims_cache.set(key, payload)
+    return dict(payload)
+
+
 def verify_token(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        return payload
+        return decode_token(token)
     except JWTError:
         return None
@@ -1,4 +1,5 @@
 import os
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import ClassVar
 
@@ -24,6 +25,77 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    # Pool de hashing de senhas (bcrypt fora do event loop)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+
+    # Calibração do custo do bcrypt no startup (desligada quando None)
+    BCRYPT_TARGET_MS: float | None = None
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 15
+
+    # Limite de tentativas de login/troca de senha (token bucket)
+    LOGIN_RATE_LIMIT_IP_BURST: float = 30
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 30
+    LOGIN_RATE_LIMIT_EMAIL_BURST: float = 10
+    LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE: float = 5
+
+    # Autenticação só pelas claims do JWT (sem SELECT em users por requisição)
+    AUTH_CLAIMS_ONLY: bool = False
+    TOKEN_VERSION_CACHE_SIZE: int = 10_000
+    TOKEN_VERSION_CACHE_TTL_SECONDS: float = 30.0
+
+    # Verificação de JWT: backend ("jose" ou "hmac") e cache de claims
+    TOKEN_VERIFIER: str = "jose"
+    TOKEN_CACHE_SIZE: int = 10_000
+    TOKEN_CACHE_DEFAULT_TTL_SECONDS: float = 300.0
+
+    # Cache de registros de usuário no SQLAlchemyUserRepository
+    USER_CACHE_SIZE: int = 5_000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    # Revogação entre workers: login, refresh e a versão do token não leem o
+    # cache de usuários. Uma troca de senha feita em outro worker invalida
+    # tokens de acesso em até TOKEN_VERSION_CACHE_TTL_SECONDS (30 s);
+    # refresh tokens e a senha antiga, imediatamente. Nome e papel do
+    # usuário podem ficar até USER_CACHE_TTL_SECONDS desatualizados.
+
+    # Paginação de GET /produtos
+    PRODUTOS_PAGE_SIZE: int = 50
+    PRODUTOS_MAX_PAGE_SIZE: int = 200
+    CATALOG_CACHE_MAX_ENTRIES: int = 256
+    CATALOG_CACHE_TTL_SECONDS: float = 30.0
+
+    # Importação de catálogos (CLI e POST /produtos/import)
+    PRODUTOS_IMPORT_BATCH_SIZE: int = 5_000
+    PRODUTOS_IMPORT_MAX_ERRORS: int = 100
+    # Exportação (GET /produtos/export): linhas por bloco do cursor
+    PRODUTOS_EXPORT_CHUNK_SIZE: int = 1_000
+
+    # Aquecimento no startup e refresh da página padrão do catálogo
+    POOL_PREWARM_CONNECTIONS: int = 5
+    CATALOG_PREWARM: bool = True
+    CATALOG_REFRESH_SECONDS: float = 20.0  # 0 desliga; abaixo do TTL do cache
+    WARMUP_TIMEOUT_SECONDS: float = 30.0
+    # Nova tentativa de aquecimento enquanto o worker não estiver pronto
+    WARMUP_RETRY_SECONDS: float = 5.0
+
+    # Sincronização incremental (GET /produtos/changes)
+    PRODUTOS_CHANGES_MAX_LIMIT: int = 1_000
+
+    # Ranking GET /produtos/populares e reconciliação de produtos.favoritos_count
+    PRODUTOS_POPULARES_DEFAULT_LIMIT: int = 10
+    FAVORITOS_COUNT_RECONCILE_SECONDS: float = 3600.0  # 0 desliga
+
+    # Imagens de produto servidas pela API (desligado se IMAGES_DIR for None)
+    IMAGES_DIR: str | None = None
+    IMAGES_URL_PREFIX: str = "/imagens"
+    IMAGES_HASHED_URLS: bool = True
+    IMAGES_CACHE_MAX_FILE_BYTES: int = 64 * 1024
+    IMAGES_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
     # env_file = ".env"
     # extra = "forbid"
     # model_config = {
@@ -31,6 +103,18 @@ class Settings(BaseSettings):
     #     "extra": "ignore"
     # }
 
+    @model_validator(mode="after")
+    def _check_catalog_refresh(self) -> "Settings":
+        # Refresh depois do TTL deixaria a página padrão expirar entre um e outro
+        if self.CATALOG_REFRESH_SECONDS and not (
+            0 < self.CATALOG_REFRESH_SECONDS < self.CATALOG_CACHE_TTL_SECONDS
+        ):
+            raise ValueError(
+                "CATALOG_REFRESH_SECONDS deve ser 0 ou menor que "
+                "CATALOG_CACHE_TTL_SECONDS"
+            )
+        return self
+
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
         env_file=".env", extra="ignore"
     )
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from mercearia.api.metrics import register_metrics
+from mercearia.api.routes.produto_route import prewarm_catalog
+from mercearia.api.settings import settings
+from mercearia.infra.database import prewarm_pool
+from mercearia.infra.tasks.periodic_task import PeriodicTask
+
+
+class Readiness:
+    """Estado exposto em GET /health/ready.
+
+    Só fica pronto depois do aquecimento (pool e catálogo); volta a não
+    pronto no shutdown, para o balanceador parar de mandar tráfego antes.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.report: dict = {}
+
+    def mark_ready(self) -> None:
+        self.ready = True
+
+    def mark_not_ready(self) -> None:
+        self.ready = False
+
+    def snapshot(self) -> dict:
+        return {"ready": self.ready, **self.report}
+
+
+readiness = Readiness()
+
+
+async def _warm_up_steps(report: dict) -> None:
+    report["pool_connections"] = await prewarm_pool(settings.POOL_PREWARM_CONNECTIONS)
+    if settings.CATALOG_PREWARM:
+        await prewarm_catalog()
+        report["catalog"] = True
+
+
+async def warm_up() -> dict:
+    """Aquece o pool e o catálogo; falhas não impedem o startup."""
+    start = time.perf_counter()
+    report: dict = {"pool_connections": 0, "catalog": False, "error": None}
+    try:
+        await asyncio.wait_for(
+            _warm_up_steps(report), timeout=settings.WARMUP_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        # Sem aquecimento completo o worker segue não pronto;
+        # warm_up_retry_task tenta de novo até o banco responder
+        report["error"] = f"{type(e).__name__}: {e}"
+        print(f"Falha no aquecimento: {report['error']}")
+    else:
+        readiness.mark_ready()
+    report["duration_ms"] = (time.perf_counter() - start) * 1000
+    readiness.report = report
+    return report
+
+
+async def _retry_warm_up() -> None:
+    if not readiness.ready:
+        await warm_up()
+
+
+async def _refresh_catalog() -> None:
+    await prewarm_catalog()
+    readiness.mark_ready()
+
+
+catalog_refresh_task = PeriodicTask(
+    "catalog_refresh",
+    interval_seconds=settings.CATALOG_REFRESH_SECONDS or 20.0,
+    job=_refresh_catalog,
+)
+# Independente do refresh do catálogo, que pode estar desligado
+warm_up_retry_task = PeriodicTask(
+    "warm_up_retry",
+    interval_seconds=settings.WARMUP_RETRY_SECONDS,
+    job=_retry_warm_up,
+)
+register_metrics("readiness", readiness.snapshot)
+register_metrics("catalog_refresh", catalog_refresh_task.metrics_snapshot)
@@ -0,0 +1,75 @@
+"""Importa um catálogo de fornecedor (CSV ou NDJSON) para a tabela produtos.
+
+Uso: python -m mercearia.cli.import_produtos catalogo.csv [--format ndjson]
+
+Colunas/campos: id, nome, preco (obrigatórios), descricao, imagem, categoria,
+marca. Categoria e marca são nomes ("Bebidas Alcoólicas"); as que não existem
+são criadas com o slug do nome como id ("bebidas-alcoolicas"). Vazias mantêm
+as atuais do produto.
+
+O cache do catálogo é por processo: workers da API em execução passam a ver
+os produtos novos quando suas entradas expiram (CATALOG_CACHE_TTL_SECONDS).
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from mercearia.api.settings import settings
+from mercearia.infra.database import async_session, engine
+from mercearia.infra.importers.produto_importer import (
+    FORMATS,
+    ImportReport,
+    ProdutoImporter,
+)
+
+
+def print_report(report: ImportReport) -> None:
+    print(
+        f"{report.rows_read} linhas lidas em {report.elapsed_seconds:.2f}s "
+        f"({report.rows_per_second:,.0f} linhas/s)"
+    )
+    print(
+        f"inseridos: {report.inserted}  atualizados: {report.updated}  "
+        f"sem alteração: {report.unchanged}  com erro: {report.error_count}"
+    )
+    for error in report.errors:
+        print(f"  linha {error.line}: {error.message}", file=sys.stderr)
+    if report.error_count > len(report.errors):
+        print(
+            f"  ... e mais {report.error_count - len(report.errors)} erros",
+            file=sys.stderr,
+        )
+
+
+async def main(path: Path, format: str, batch_size: int) -> ImportReport:
+    try:
+        async with async_session() as session:
+            importer = ProdutoImporter(
+                session,
+                batch_size=batch_size,
+                max_errors=settings.PRODUTOS_IMPORT_MAX_ERRORS,
+            )
+            with path.open("rb") as binary:
+                return await importer.run(binary, format)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format", choices=FORMATS, help="padrão: deduzido da extensão do arquivo"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.PRODUTOS_IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+
+    format = args.format or (
+        "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    )
+    report = asyncio.run(main(args.path, format, args.batch_size))
+    print_report(report)
+    sys.exit(1 if report.error_count else 0)
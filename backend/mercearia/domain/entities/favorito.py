@@ -3,6 +3,8 @@ from mercearia.domain.entities.produto import Produto
 
 
 class Favorito:
+    __slots__ = ("_id", "user_id", "produto_id", "produto")
+
     def __init__(
         self,
         user_id: str,
@@ -10,11 +12,23 @@ class Favorito:
         id: str | None = None,
         produto: Produto | None = None,
     ):
-        self.id = id or str(uuid.uuid4())
+        # O id só é gerado se alguém precisar dele (ex.: ao persistir);
+        # favoritos usados apenas como chave de busca não pagam o uuid4
+        self._id = id
         self.user_id = user_id
         self.produto_id = produto_id
         self.produto = produto
 
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+
     def __eq__(self, other):
         return (
             isinstance(other, Favorito)
@@ -1,7 +1,32 @@
+from decimal import Decimal
+
+
 class Produto:
-    def __init__(self, id: str, nome: str, descricao: str, preco: float, imagem: str):
+    __slots__ = (
+        "id",
+        "nome",
+        "descricao",
+        "preco",
+        "imagem",
+        "categoria_id",
+        "marca_id",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        nome: str,
+        descricao: str,
+        preco: Decimal | float,
+        imagem: str,
+        categoria_id: str | None = None,
+        marca_id: str | None = None,
+    ):
         self.id = id
         self.nome = nome
         self.descricao = descricao
-        self.preco = preco
+        # Preço é sempre exato; floats são convertidos pela representação decimal
+        self.preco = preco if isinstance(preco, Decimal) else Decimal(str(preco))
         self.imagem = imagem
+        self.categoria_id = categoria_id
+        self.marca_id = marca_id
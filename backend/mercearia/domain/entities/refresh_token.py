@@ -0,0 +1,41 @@
+import uuid
+from datetime import datetime
+
+
+class RefreshToken:
+    __slots__ = (
+        "id",
+        "user_id",
+        "token_hash",
+        "family_id",
+        "expires_at",
+        "token_version",
+        "revoked_at",
+    )
+
+    def __init__(
+        self,
+        user_id: str,
+        token_hash: str,
+        family_id: str,
+        expires_at: datetime,
+        token_version: int = 0,
+        id: str | None = None,
+        revoked_at: datetime | None = None,
+    ):
+        self.id = id or str(uuid.uuid4())
+        self.user_id = user_id
+        # Só o HMAC do token é guardado; o valor original fica com o cliente
+        self.token_hash = token_hash
+        # Tokens rotacionados a partir do mesmo login compartilham a família
+        self.family_id = family_id
+        self.expires_at = expires_at
+        self.token_version = token_version
+        self.revoked_at = revoked_at
+
+    def is_expired(self, now: datetime) -> bool:
+        return self.expires_at <= now
+
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
@@ -1,9 +1,19 @@
 from mercearia.domain.value_objects.email_vo import Email
-from mercearia.domain.value_objects.password_vo import Password
+from mercearia.domain.value_objects.password_vo import Password, HashedPassword
 
 
 class User:
-    def __init__(self, id: str, name: str, email: Email, password: Password, role: str):
+    __slots__ = ("id", "name", "email", "password", "role", "token_version")
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        email: Email,
+        password: Password | HashedPassword | None,
+        role: str,
+        token_version: int = 0,
+    ):
         if role not in ["admin", "user"]:
             raise ValueError("Role must be 'admin' or 'user'.")
         self.id = id
@@ -11,3 +21,5 @@ class User:
         self.email = email
         self.password = password
         self.role = role
+        # Incrementado a cada troca de senha para revogar tokens antigos
+        self.token_version = token_version
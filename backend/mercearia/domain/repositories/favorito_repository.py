@@ -19,6 +19,12 @@ class FavoritoRepository(ABC):
         """Returns all favorites for a given user"""
         ...
 
+    @abstractmethod
+    async def get_version(self, user_id: str) -> tuple[int, int]:
+        """Returns (favorites version, catalog version): together they change
+        whenever the user's favorites or the products they show change"""
+        ...
+
     @abstractmethod
     async def exists(self, user_id: str, produto_id: str) -> bool:
         """Checks if a specific product is already favorited by the user"""
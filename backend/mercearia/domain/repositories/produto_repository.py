@@ -1,8 +1,61 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
 from mercearia.domain.entities.produto import Produto
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+from mercearia.domain.value_objects.produto_cursor import ProdutoCursor
+from mercearia.domain.value_objects.produto_facets import ProdutoFacets
 from typing import List
 
 
 class ProdutoRepository(ABC):
     @abstractmethod
     async def get_all(self) -> List[Produto]: ...
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        sort: str = "nome",
+        after: ProdutoCursor | None = None,
+        min_preco: Decimal | None = None,
+        max_preco: Decimal | None = None,
+        categoria: str | None = None,
+        marca: str | None = None,
+    ) -> List[Produto]:
+        """Até `limit` produtos ordenados por (sort, id), após o cursor,
+        dentro da faixa de preço e da categoria/marca"""
+        ...
+
+    @abstractmethod
+    async def facet_counts(
+        self, categoria: str | None = None, marca: str | None = None
+    ) -> ProdutoFacets:
+        """Contagem de produtos por categoria e por marca"""
+        ...
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int, after: ProdutoCursor | None = None
+    ) -> List[tuple[Produto, float]]:
+        """Produtos que casam com a busca, com a relevância, da maior para a
+        menor (empate pelo id)"""
+        ...
+
+    @abstractmethod
+    async def list_populares(self, limit: int) -> List[tuple[Produto, int]]:
+        """Os `limit` produtos mais favoritados, com o total de favoritos"""
+        ...
+
+    @abstractmethod
+    async def list_changes(self, since: int, limit: int) -> List[ProdutoChange]:
+        """Até `limit` alterações (upserts e remoções) com versão maior que
+        `since`, em ordem crescente de versão"""
+        ...
+
+    @abstractmethod
+    async def get_by_id(self, produto_id: str) -> Produto | None: ...
+
+    @abstractmethod
+    async def get_by_ids(self, produto_ids: List[str]) -> List[Produto]:
+        """Produtos encontrados entre os ids, em qualquer ordem"""
+        ...
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from mercearia.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository(ABC):
+    @abstractmethod
+    async def add(self, token: RefreshToken) -> None:
+        """Stores a newly issued refresh token"""
+        ...
+
+    @abstractmethod
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        """Finds a token (active or not) by its HMAC digest"""
+        ...
+
+    @abstractmethod
+    async def rotate(self, old: RefreshToken, new: RefreshToken) -> bool:
+        """Atomically revokes `old` and stores `new`; False if `old` was already revoked"""
+        ...
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str) -> None:
+        """Revokes every token issued from the same login"""
+        ...
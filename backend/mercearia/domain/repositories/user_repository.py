@@ -21,5 +21,11 @@ class UserRepository(ABC):
     async def update_password(self, email: Email, password: Password): ...
 
     @abstractmethod
-    async def get_by_id(self, user_id: str) -> User | None:
-        pass
+    async def get_by_id(self, user_id: str, fresh: bool = False) -> User | None:
+        """fresh=True ignora caches (checagens de revogação)"""
+        ...
+
+    @abstractmethod
+    async def get_token_version(self, user_id: str) -> int | None:
+        """Returns only the user's current token version (None if missing)"""
+        ...
@@ -1,15 +1,18 @@
 import re
 
+_EMAIL_PATTERN = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+
 
 class Email:
+    __slots__ = ("_value",)
+
     def __init__(self, value: str):
         if not self._is_valid(value):
             raise ValueError("Invalid email address.")
         self._value = value
 
     def _is_valid(self, email: str) -> bool:
-        pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
-        return re.match(pattern, email) is not None
+        return _EMAIL_PATTERN.match(email) is not None
 
     def value(self) -> str:
         return self._value
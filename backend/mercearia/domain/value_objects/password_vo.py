@@ -1,5 +1,10 @@
 import re
-from mercearia.api.security import get_password_hash, verify_password
+from mercearia.api.password_hasher import password_hasher
+
+_UPPERCASE = re.compile(r"[A-Z]")
+_LOWERCASE = re.compile(r"[a-z]")
+_DIGIT = re.compile(r"[0-9]")
+_SPECIAL = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
 
 
 class PasswordValidationError(Exception):
@@ -7,40 +12,71 @@ class PasswordValidationError(Exception):
 
 
 class Password:
-    def __init__(self, plain_password: str, hashed: bool = False):
+    """Senha candidata em texto puro (login ou nova senha).
+
+    A validação é feita na construção; o hash bcrypt só é calculado quando
+    realmente necessário, via ``await hash()``. Não há caminho síncrono: todo
+    hash e toda verificação passam pelo pool de bcrypt, fora do event loop.
+    """
+
+    __slots__ = ("_plain_password", "_hashed")
+
+    def __init__(self, plain_password: str):
+        self.validate(plain_password)
         self._plain_password = plain_password
-        if not hashed:
-            self.validate(plain_password)
-            self._hashed = get_password_hash(plain_password)
-        else:
-            self._hashed = plain_password
+        self._hashed: str | None = None
 
     def validate(self, password: str):
         if len(password) < 8:
             raise PasswordValidationError("A senha deve ter no mínimo 8 caracteres.")
-        if not re.search(r"[A-Z]", password):
+        if not _UPPERCASE.search(password):
             raise PasswordValidationError(
                 "A senha deve conter pelo menos uma letra maiúscula."
             )
-        if not re.search(r"[a-z]", password):
+        if not _LOWERCASE.search(password):
             raise PasswordValidationError(
                 "A senha deve conter pelo menos uma letra minúscula."
             )
-        if not re.search(r"[0-9]", password):
+        if not _DIGIT.search(password):
             raise PasswordValidationError("A senha deve conter pelo menos um número.")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+        if not _SPECIAL.search(password):
             raise PasswordValidationError(
                 "A senha deve conter pelo menos um caractere especial."
             )
 
-    def verify(self, db: str) -> bool:
-        return verify_password(self._plain_password, db)
+    @property
+    def plain(self) -> str:
+        return self._plain_password
+
+    async def hash(self) -> str:
+        # Calcula o hash no pool de bcrypt uma única vez
+        if self._hashed is None:
+            self._hashed = await password_hasher.hash(self._plain_password)
+        return self._hashed
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Password)
+            and self._plain_password == other._plain_password
+        )
+
+
+class HashedPassword:
+    """Hash bcrypt já armazenado; nunca executa bcrypt na construção."""
+
+    __slots__ = ("_hashed",)
+
+    def __init__(self, hashed: str):
+        self._hashed = hashed
+
+    async def verify(self, candidate: Password) -> bool:
+        return await password_hasher.verify(candidate.plain, self._hashed)
 
     def value(self) -> str:
         return self._hashed
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, Password) and self._hashed == other._hashed
+        return isinstance(other, HashedPassword) and self._hashed == other._hashed
 
     def __str__(self):
         return self._hashed
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from mercearia.domain.entities.produto import Produto
+
+
+@dataclass(frozen=True, slots=True)
+class ProdutoChange:
+    """Uma alteração do catálogo; ``produto`` é None quando foi removido."""
+
+    version: int
+    produto_id: str
+    produto: Produto | None
+
+    @property
+    def removed(self) -> bool:
+        return self.produto is None
@@ -0,0 +1,63 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Literal, get_args
+
+ProdutoSort = Literal["nome", "preco", "preco_desc", "id"]
+PRODUTO_SORTS: tuple[str, ...] = get_args(ProdutoSort)
+
+# Ordenação -> (campo da entidade, decrescente)
+SORT_FIELDS: dict[str, tuple[str, bool]] = {
+    "nome": ("nome", False),
+    "preco": ("preco", False),
+    "preco_desc": ("preco", True),
+    "id": ("id", False),
+}
+
+# Ordenação da busca textual: relevância decrescente, depois id
+SEARCH_SORT = "relevancia"
+
+
+@dataclass(frozen=True, slots=True)
+class ProdutoCursor:
+    """Posição opaca na listagem: o último item visto na ordenação pedida.
+
+    A ordem é sempre (campo, id), então o id desempata produtos com o mesmo
+    nome ou preço e a paginação fica estável.
+    """
+
+    sort: str
+    value: str | float | Decimal
+    id: str
+
+    def encode(self) -> str:
+        # Preço vai como texto para não perder a exatidão do Decimal
+        value = str(self.value) if isinstance(self.value, Decimal) else self.value
+        raw = json.dumps([self.sort, value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: str) -> "ProdutoCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            cursor_sort, value, id = json.loads(raw)
+        except (binascii.Error, ValueError, TypeError):
+            raise ValueError("Cursor inválido.")
+        if cursor_sort != sort:
+            raise ValueError("Cursor não corresponde à ordenação pedida.")
+        if not isinstance(id, str):
+            raise ValueError("Cursor inválido.")
+
+        field = SORT_FIELDS[sort][0] if sort in SORT_FIELDS else sort
+        if field == "preco":
+            try:
+                value = Decimal(value) if isinstance(value, str) else None
+            except InvalidOperation:
+                value = None
+            if value is None or not value.is_finite():
+                raise ValueError("Cursor inválido.")
+        elif not isinstance(value, float | int if sort == SEARCH_SORT else str):
+            raise ValueError("Cursor inválido.")
+        return cls(sort=sort, value=value, id=id)
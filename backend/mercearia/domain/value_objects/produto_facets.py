@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(frozen=True, slots=True)
+class FacetCount:
+    id: str
+    nome: str
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class ProdutoFacets:
+    """Produtos por categoria e por marca sob os filtros atuais.
+
+    Cada faceta ignora o próprio filtro (as categorias respeitam só o filtro
+    de marca e vice-versa), para o cliente poder trocar de opção.
+    """
+
+    categorias: List[FacetCount] = field(default_factory=list)
+    marcas: List[FacetCount] = field(default_factory=list)
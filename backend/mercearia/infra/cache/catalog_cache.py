@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Hashable
+from mercearia.api.metrics import register_metrics
+from mercearia.api.settings import settings
+from mercearia.infra.cache.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEntry:
+    """Página do catálogo já serializada em JSON, pronta para ser enviada."""
+
+    body: bytes
+    next_cursor: str | None
+    version: int
+    built_at: float
+    etag: str
+
+
+@dataclass
+class CatalogCacheMetrics:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    rebuilds: int = 0
+    rebuild_errors: int = 0
+    rebuild_total_ms: float = 0.0
+    rebuild_max_ms: float = 0.0
+    invalidations: int = 0
+
+
+Loader = Callable[[], Awaitable[tuple[bytes, str | None]]]
+
+
+class CatalogCache:
+    """Cache versionado das páginas de GET /produtos.
+
+    ``invalidate()`` incrementa a versão e descarta tudo; entradas montadas
+    com uma versão antiga nunca são servidas. Depois do TTL a entrada ainda é
+    servida enquanto uma tarefa em segundo plano a reconstrói, então só a
+    primeira requisição após uma invalidação espera pelo banco. O TTL também
+    limita quanto tempo outros workers demoram a ver uma alteração.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._entries: TTLCache[Hashable, CatalogEntry] = TTLCache(max_entries)
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._version = 0
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self.metrics = CatalogCacheMetrics()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: Hashable) -> CatalogEntry | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.version != self._version:
+            self.metrics.misses += 1
+            return None
+        if self.is_stale(entry):
+            self.metrics.stale_hits += 1
+        else:
+            self.metrics.hits += 1
+        return entry
+
+    def is_stale(self, entry: CatalogEntry) -> bool:
+        return self._clock() - entry.built_at >= self._ttl
+
+    async def load(self, key: Hashable, loader: Loader) -> CatalogEntry:
+        version = self._version
+        start = time.perf_counter()
+        try:
+            body, next_cursor = await loader()
+        except Exception:
+            self.metrics.rebuild_errors += 1
+            raise
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.metrics.rebuilds += 1
+        self.metrics.rebuild_total_ms += elapsed_ms
+        self.metrics.rebuild_max_ms = max(self.metrics.rebuild_max_ms, elapsed_ms)
+
+        # Digest do corpo: igual em todos os workers para o mesmo conteúdo
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        entry = CatalogEntry(body, next_cursor, version, self._clock(), etag)
+        # Uma invalidação durante o carregamento torna esta página obsoleta
+        if version == self._version:
+            self._entries.set(key, entry)
+        return entry
+
+    def refresh_in_background(self, key: Hashable, loader: Loader) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self.load(key, loader))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t: self._refresh_done(key, t))
+
+    def _refresh_done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled():
+            # Erro já contado em rebuild_errors; a entrada antiga segue valendo
+            task.exception()
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._entries.clear()
+        self.metrics.invalidations += 1
+
+    async def close(self) -> None:
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics_snapshot(self) -> dict:
+        data: dict = asdict(self.metrics)
+        data["version"] = self._version
+        data["size"] = len(self._entries)
+        data["rebuild_avg_ms"] = (
+            self.metrics.rebuild_total_ms / self.metrics.rebuilds
+            if self.metrics.rebuilds
+            else 0.0
+        )
+        return data
+
+
+catalog_cache = CatalogCache(
+    max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+register_metrics("catalog_cache", catalog_cache.metrics_snapshot)
@@ -0,0 +1,9 @@
+from mercearia.api.settings import settings
+from mercearia.infra.cache.ttl_cache import TTLCache
+
+# Versão de token por usuário; entradas curtas limitam a janela de revogação
+# entre workers diferentes
+token_version_cache: TTLCache[str, int] = TTLCache(
+    max_size=settings.TOKEN_VERSION_CACHE_SIZE,
+    ttl_seconds=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+)
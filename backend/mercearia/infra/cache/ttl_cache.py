@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict:
+        data: dict = asdict(self)
+        total = self.hits + self.misses
+        data["hit_ratio"] = self.hits / total if total else 0.0
+        return data
+
+
+class TTLCache(Generic[K, V]):
+    """Cache LRU limitado por tamanho com expiração por entrada.
+
+    Não é thread-safe: pensado para uso dentro de um único event loop.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size deve ser maior que zero")
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def peek(self, key: K) -> V | None:
+        # Leitura sem efeito em estatísticas nem na ordem LRU
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            return None
+        return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl_seconds: float | None = None,
+        expires_at: float | None = None,
+    ) -> None:
+        # expires_at usa o mesmo relógio do cache; ttl_seconds sobrepõe o padrão
+        if expires_at is None:
+            ttl = ttl_seconds if ttl_seconds is not None else self._ttl
+            expires_at = self._clock() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        if self._data.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._data.clear()
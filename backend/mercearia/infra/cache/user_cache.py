@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from typing import Callable
+from mercearia.api.metrics import register_metrics
+from mercearia.api.settings import settings
+from mercearia.domain.entities.user import User
+from mercearia.domain.value_objects.email_vo import Email
+from mercearia.domain.value_objects.password_vo import HashedPassword
+from mercearia.infra.cache.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class UserRecord:
+    """Cópia imutável de uma linha de users, independente da sessão."""
+
+    id: str
+    name: str
+    email: str
+    password: str
+    role: str
+    token_version: int
+
+    def to_entity(self) -> User:
+        return User(
+            id=self.id,
+            name=self.name,
+            email=Email(self.email),
+            password=HashedPassword(self.password),
+            role=self.role,
+            token_version=self.token_version,
+        )
+
+
+@dataclass(frozen=True)
+class UserInvalidation:
+    user_id: str | None
+    email: str | None
+
+
+InvalidationListener = Callable[[UserInvalidation], None]
+
+
+class UserCache:
+    """Cache de registros de usuário indexado por id e por email.
+
+    Invalidações locais são repassadas aos listeners registrados, que podem
+    publicá-las para outros workers (ex.: NOTIFY do Postgres). O worker que
+    recebe a mensagem chama ``invalidate(..., propagate=False)``.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._by_id: TTLCache[str, UserRecord] = TTLCache(max_size, ttl_seconds)
+        self._by_email: TTLCache[str, UserRecord] = TTLCache(max_size, ttl_seconds)
+        self._listeners: list[InvalidationListener] = []
+
+    def get_by_id(self, user_id: str) -> UserRecord | None:
+        return self._by_id.get(user_id)
+
+    def get_by_email(self, email: str) -> UserRecord | None:
+        return self._by_email.get(email)
+
+    def put(self, record: UserRecord) -> None:
+        self._by_id.set(record.id, record)
+        self._by_email.set(record.email, record)
+
+    def invalidate(
+        self,
+        user_id: str | None = None,
+        email: str | None = None,
+        propagate: bool = True,
+    ) -> None:
+        # Remove as duas chaves, mesmo conhecendo só uma delas
+        for record in (
+            self._by_id.peek(user_id) if user_id else None,
+            self._by_email.peek(email) if email else None,
+        ):
+            if record is not None:
+                self._by_id.invalidate(record.id)
+                self._by_email.invalidate(record.email)
+        if user_id:
+            self._by_id.invalidate(user_id)
+        if email:
+            self._by_email.invalidate(email)
+
+        if propagate:
+            event = UserInvalidation(user_id=user_id, email=email)
+            for listener in self._listeners:
+                listener(event)
+
+    def add_invalidation_listener(self, listener: InvalidationListener) -> None:
+        self._listeners.append(listener)
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._by_email.clear()
+
+    def metrics_snapshot(self) -> dict:
+        return {
+            "size": len(self._by_id),
+            "by_id": self._by_id.stats.snapshot(),
+            "by_email": self._by_email.stats.snapshot(),
+        }
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+register_metrics("user_cache", user_cache.metrics_snapshot)
@@ -1,6 +1,9 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.engine import URL
+from contextlib import AsyncExitStack
+import asyncio
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -13,3 +16,26 @@ engine = create_async_engine(DATABASE_URL, echo=True)
 async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 Base = declarative_base()
+
+
+async def prewarm_pool(connections: int) -> int:
+    """Abre conexões do pool antes do primeiro request; retorna quantas.
+
+    Todas ficam abertas ao mesmo tempo (senão o pool reusaria a primeira) e
+    voltam ao pool no fim. Acima de pool_size seriam descartadas na devolução.
+    """
+    connections = min(connections, engine.pool.size())  # type: ignore[attr-defined]
+    if connections < 1:
+        return 0
+    async with AsyncExitStack() as stack:
+        # return_exceptions: as que conectaram são fechadas pelo stack mesmo
+        # se outra falhar
+        results = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in results))
+    return len(results)
@@ -0,0 +1,103 @@
+import csv
+import io
+import zlib
+from typing import Any, AsyncIterator, Sequence
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from mercearia.infra.repositories.sqlalchemy.read_models import (
+    categorias,
+    marcas,
+    produtos,
+)
+
+FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+# Mesmas colunas aceitas pelo importador: o export pode ser reimportado
+EXPORT_COLUMNS = (
+    "id",
+    "nome",
+    "descricao",
+    "preco",
+    "imagem",
+    "categoria",
+    "marca",
+)
+
+
+def encode_ndjson(rows: Sequence[Sequence[Any]]) -> bytes:
+    # float de um NUMERIC(10, 2) volta exatamente ao mesmo Decimal na importação
+    return b"".join(
+        orjson.dumps(
+            {
+                "id": row[0],
+                "nome": row[1],
+                "descricao": row[2],
+                "preco": float(row[3]),
+                "imagem": row[4],
+                "categoria": row[5],
+                "marca": row[6],
+            }
+        )
+        + b"\n"
+        for row in rows
+    )
+
+
+def encode_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
+
+
+class ProdutoExporter:
+    """Exporta o catálogo em blocos de ``chunk_size`` linhas.
+
+    As linhas vêm de um cursor no servidor (``yield_per``): só um bloco fica
+    em memória por vez, seja qual for o tamanho da tabela. A sessão precisa
+    continuar aberta enquanto os blocos são consumidos.
+    """
+
+    def __init__(self, session: AsyncSession, chunk_size: int = 1_000):
+        self._session = session
+        self._chunk_size = chunk_size
+
+    async def iter_chunks(self, format: str) -> AsyncIterator[bytes]:
+        if format not in FORMATS:
+            raise ValueError(f"Formato não suportado: {format}")
+        encode = encode_csv if format == "csv" else encode_ndjson
+        if format == "csv":
+            yield encode_csv([EXPORT_COLUMNS])
+
+        stmt = (
+            # Na ordem de EXPORT_COLUMNS: as linhas vão direto para o CSV
+            select(
+                produtos.c.id,
+                produtos.c.nome,
+                produtos.c.descricao,
+                produtos.c.preco,
+                produtos.c.imagem,
+                categorias.c.nome,
+                marcas.c.nome,
+            )
+            .select_from(
+                produtos.outerjoin(
+                    categorias, produtos.c.categoria_id == categorias.c.id
+                ).outerjoin(marcas, produtos.c.marca_id == marcas.c.id)
+            )
+            .order_by(produtos.c.id)
+            .execution_options(yield_per=self._chunk_size)
+        )
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions():
+            yield encode(rows)
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Comprime os blocos em um único stream gzip, sem juntar o corpo."""
+    compressor = zlib.compressobj(wbits=31)  # 31: cabeçalho e trailer gzip
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
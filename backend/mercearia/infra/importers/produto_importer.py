@@ -0,0 +1,276 @@
+import asyncio
+import csv
+import io
+import json
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import IO, Any, Iterator
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from mercearia.infra.cache.catalog_cache import catalog_cache
+
+FORMATS = ("csv", "ndjson")
+STAGING_TABLE = "produtos_import"
+STAGING_COLUMNS = (
+    "seq",
+    "id",
+    "nome",
+    "descricao",
+    "preco",
+    "imagem",
+    "categoria_id",
+    "categoria_nome",
+    "marca_id",
+    "marca_nome",
+)
+
+_CREATE_STAGING = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    seq bigint NOT NULL,
+    id text NOT NULL,
+    nome text NOT NULL,
+    descricao text NOT NULL,
+    preco numeric(10, 2) NOT NULL,
+    imagem text NOT NULL,
+    categoria_id text,
+    categoria_nome text,
+    marca_id text,
+    marca_nome text
+) ON COMMIT DROP
+"""
+
+# Categorias e marcas novas antes dos produtos (que as referenciam por FK)
+_UPSERT_CATEGORIAS = f"""
+INSERT INTO categorias (id, nome)
+SELECT DISTINCT ON (categoria_id) categoria_id, categoria_nome
+FROM {STAGING_TABLE}
+WHERE categoria_id IS NOT NULL
+ORDER BY categoria_id, seq DESC
+ON CONFLICT (id) DO NOTHING
+"""
+
+_UPSERT_MARCAS = f"""
+INSERT INTO marcas (id, nome)
+SELECT DISTINCT ON (marca_id) marca_id, marca_nome
+FROM {STAGING_TABLE}
+WHERE marca_id IS NOT NULL
+ORDER BY marca_id, seq DESC
+ON CONFLICT (id) DO NOTHING
+"""
+
+# Uma linha por id (a última do arquivo vence). Linhas idênticas ao que já
+# está no banco não são regravadas. Quem favoritou um produto alterado tem a
+# versão dos favoritos incrementada, invalidando o ETag de GET /favoritos.
+# Categoria/marca vazias mantêm as atuais do produto.
+_UPSERT = f"""
+WITH upserted AS (
+    INSERT INTO produtos (id, nome, descricao, preco, imagem, categoria_id, marca_id)
+    SELECT DISTINCT ON (id) id, nome, descricao, preco, imagem, categoria_id, marca_id
+    FROM {STAGING_TABLE}
+    ORDER BY id, seq DESC
+    ON CONFLICT (id) DO UPDATE SET
+        nome = EXCLUDED.nome,
+        descricao = EXCLUDED.descricao,
+        preco = EXCLUDED.preco,
+        imagem = EXCLUDED.imagem,
+        categoria_id = coalesce(EXCLUDED.categoria_id, produtos.categoria_id),
+        marca_id = coalesce(EXCLUDED.marca_id, produtos.marca_id)
+    WHERE (
+        produtos.nome, produtos.descricao, produtos.preco, produtos.imagem,
+        produtos.categoria_id, produtos.marca_id
+    ) IS DISTINCT FROM (
+        EXCLUDED.nome, EXCLUDED.descricao, EXCLUDED.preco, EXCLUDED.imagem,
+        coalesce(EXCLUDED.categoria_id, produtos.categoria_id),
+        coalesce(EXCLUDED.marca_id, produtos.marca_id)
+    )
+    RETURNING id, (xmax = 0) AS inserted
+), bumped AS (
+    UPDATE users SET favoritos_version = favoritos_version + 1
+    WHERE id IN (
+        SELECT f.user_id FROM favoritos f
+        JOIN upserted u ON u.id = f.produto_id AND NOT u.inserted
+    )
+)
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM upserted
+"""
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    rows_valid: int = 0
+    inserted: int = 0
+    updated: int = 0
+    error_count: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    cache_invalidated: bool = False
+
+    @property
+    def unchanged(self) -> int:
+        # Inclui ids repetidos no arquivo, que contam uma vez só
+        return self.rows_valid - self.inserted - self.updated
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def parse_preco(value: Any) -> Decimal:
+    try:
+        preco = Decimal(str(value).strip().replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"preco inválido: {value!r}")
+    if not preco.is_finite() or preco <= 0:
+        raise ValueError(f"preco deve ser maior que zero: {value!r}")
+    if preco != preco.quantize(Decimal("0.01")):
+        raise ValueError(f"preco com mais de duas casas decimais: {value!r}")
+    if preco >= Decimal("100000000"):
+        raise ValueError(f"preco acima do máximo: {value!r}")
+    return preco
+
+
+def slugify(nome: str) -> str:
+    """Id de categoria/marca: "Bebidas Alcoólicas" -> "bebidas-alcoolicas"."""
+    text = unicodedata.normalize("NFKD", nome.lower())
+    text = "".join(
+        c if c.isalnum() else " " for c in text if not unicodedata.combining(c)
+    )
+    return "-".join(text.split())
+
+
+def parse_dimension(record: dict, field: str) -> tuple[str | None, str | None]:
+    # (slug, nome) de categoria/marca; ausente ou vazio vira (None, None)
+    nome = str(record.get(field) or "").strip()
+    if not nome:
+        return None, None
+    slug = slugify(nome)
+    if not slug:
+        raise ValueError(f"{field} inválida: {nome!r}")
+    return slug, nome
+
+
+def validate_record(record: Any) -> tuple:
+    if not isinstance(record, dict):
+        raise ValueError("registro deve ser um objeto")
+    id = str(record.get("id") or "").strip()
+    nome = str(record.get("nome") or "").strip()
+    if not id:
+        raise ValueError("id é obrigatório")
+    if not nome:
+        raise ValueError("nome é obrigatório")
+    if record.get("preco") in (None, ""):
+        raise ValueError("preco é obrigatório")
+    descricao = str(record.get("descricao") or "").strip()
+    imagem = str(record.get("imagem") or "").strip()
+    return (
+        id,
+        nome,
+        descricao,
+        parse_preco(record["preco"]),
+        imagem,
+        *parse_dimension(record, "categoria"),
+        *parse_dimension(record, "marca"),
+    )
+
+
+def iter_records(binary: IO[bytes], format: str) -> Iterator[tuple[int, Any]]:
+    """(número da linha, registro) sem carregar o arquivo em memória.
+
+    Registros que não podem ser decodificados saem como a exceção, para o
+    importador contá-los como erro da linha.
+    """
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+    if format == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+    elif format == "ndjson":
+        for line_num, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_num, json.loads(line)
+            except ValueError as e:
+                yield line_num, e
+    else:
+        raise ValueError(f"Formato não suportado: {format}")
+
+
+class ProdutoImporter:
+    """Importa catálogos via COPY para uma tabela temporária + upsert.
+
+    O arquivo é lido em lotes de ``batch_size`` linhas (em uma thread, para
+    não travar o event loop), então a memória usada não depende do tamanho
+    do arquivo. Tudo roda em uma transação: ou o catálogo inteiro entra, ou
+    nada muda.
+    """
+
+    def __init__(
+        self, session: AsyncSession, batch_size: int = 5_000, max_errors: int = 100
+    ):
+        self._session = session
+        self._batch_size = batch_size
+        self._max_errors = max_errors
+
+    def _read_batch(
+        self, records: Iterator[tuple[int, Any]], report: ImportReport
+    ) -> list[tuple]:
+        batch: list[tuple] = []
+        for line, record in records:
+            report.rows_read += 1
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(f"JSON inválido: {record}")
+                batch.append((report.rows_read, *validate_record(record)))
+            except ValueError as e:
+                report.error_count += 1
+                if len(report.errors) < self._max_errors:
+                    report.errors.append(ImportRowError(line, str(e)))
+                continue
+            if len(batch) >= self._batch_size:
+                break
+        report.rows_valid += len(batch)
+        return batch
+
+    async def run(self, binary: IO[bytes], format: str) -> ImportReport:
+        if format not in FORMATS:
+            raise ValueError(f"Formato não suportado: {format}")
+        report = ImportReport()
+        start = time.perf_counter()
+
+        try:
+            # Criada pelo SQLAlchemy para abrir a transação da sessão; o COPY
+            # usa a conexão asyncpg por baixo, dentro da mesma transação
+            connection = await self._session.connection()
+            await connection.execute(text(_CREATE_STAGING))
+            raw: Any = (await connection.get_raw_connection()).driver_connection
+            records = iter_records(binary, format)
+            while batch := await asyncio.to_thread(self._read_batch, records, report):
+                await raw.copy_records_to_table(
+                    STAGING_TABLE, records=batch, columns=STAGING_COLUMNS
+                )
+            await raw.execute(_UPSERT_CATEGORIAS)
+            await raw.execute(_UPSERT_MARCAS)
+            report.inserted, report.updated = await raw.fetchrow(_UPSERT)
+            await self._session.commit()
+        except BaseException:
+            await self._session.rollback()
+            raise
+
+        if report.inserted or report.updated:
+            catalog_cache.invalidate()
+            report.cache_invalidated = True
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
@@ -0,0 +1,11 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+from mercearia.infra.database import Base
+
+
+class CategoriaModel(Base):
+    __tablename__ = "categorias"
+
+    # Slug do nome (ex.: "bebidas-alcoolicas"), usado no filtro ?categoria=
+    id: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    nome: Mapped[str] = mapped_column(sa.String, nullable=False)
@@ -18,8 +18,8 @@ class FavoritoModel(Base):
         sa.String, sa.ForeignKey("produtos.id"), nullable=False
     )
 
-    produto = relationship("ProdutoModel", back_populates="favoritado")
-    user = relationship("UserModel", back_populates="favoritos")
+    produto = relationship("ProdutoModel", back_populates="favoritado", lazy="raise")
+    user = relationship("UserModel", back_populates="favoritos", lazy="raise")
 
     @classmethod
     def from_entity(cls, entity: Favorito) -> "FavoritoModel":
@@ -30,5 +30,5 @@ class FavoritoModel(Base):
             id=self.id,
             user_id=self.user_id,
             produto_id=self.produto_id,
-            produto=self.produto,
+            produto=self.produto.to_entity(),
         )
@@ -0,0 +1,11 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+from mercearia.infra.database import Base
+
+
+class MarcaModel(Base):
+    __tablename__ = "marcas"
+
+    # Slug do nome (ex.: "coca-cola"), usado no filtro ?marca=
+    id: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    nome: Mapped[str] = mapped_column(sa.String, nullable=False)
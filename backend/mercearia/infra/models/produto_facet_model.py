@@ -0,0 +1,91 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+from mercearia.infra.database import Base
+from mercearia.infra.models.produto_model import ProdutoModel
+
+
+class ProdutoFacetCountModel(Base):
+    """Quantidade de produtos por par (categoria, marca).
+
+    Mantida pelos triggers abaixo; as contagens de facetas somam estas linhas
+    em vez de varrer produtos. NULL representa "sem categoria/marca".
+    """
+
+    __tablename__ = "produto_facet_counts"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "categoria_id",
+            "marca_id",
+            name="uq_produto_facet_counts_par",
+            postgresql_nulls_not_distinct=True,
+        ),
+        sa.Index("ix_produto_facet_counts_marca_id", "marca_id"),
+    )
+
+    id: Mapped[int] = mapped_column(sa.BigInteger, sa.Identity(), primary_key=True)
+    categoria_id: Mapped[str | None] = mapped_column(sa.String, nullable=True)
+    marca_id: Mapped[str | None] = mapped_column(sa.String, nullable=True)
+    total: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+
+
+# Triggers por statement com tabelas de transição: uma importação de 100 mil
+# produtos faz um upsert por par, não 100 mil updates na mesma linha. Cada
+# operação só enxerga as suas tabelas de transição, daí os três ramos.
+FACET_COUNTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION produtos_facet_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+        SELECT categoria_id, marca_id, count(*) FROM new_rows
+        GROUP BY categoria_id, marca_id
+        ON CONFLICT (categoria_id, marca_id)
+        DO UPDATE SET total = f.total + EXCLUDED.total;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+        SELECT categoria_id, marca_id, -count(*) FROM old_rows
+        GROUP BY categoria_id, marca_id
+        ON CONFLICT (categoria_id, marca_id)
+        DO UPDATE SET total = f.total + EXCLUDED.total;
+    ELSE
+        -- Só produtos que trocaram de categoria ou marca
+        INSERT INTO produto_facet_counts AS f (categoria_id, marca_id, total)
+        SELECT categoria_id, marca_id, sum(delta)
+        FROM (
+            SELECT o.categoria_id, o.marca_id, -1 AS delta, n.categoria_id AS nc,
+                n.marca_id AS nm
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            UNION ALL
+            SELECT n.categoria_id, n.marca_id, 1, o.categoria_id, o.marca_id
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+        ) d
+        WHERE (categoria_id, marca_id) IS DISTINCT FROM (nc, nm)
+        GROUP BY categoria_id, marca_id
+        ON CONFLICT (categoria_id, marca_id)
+        DO UPDATE SET total = f.total + EXCLUDED.total;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+FACET_COUNTS_TRIGGERS = (
+    """
+    CREATE TRIGGER produtos_facets_insert AFTER INSERT ON produtos
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+    """,
+    """
+    CREATE TRIGGER produtos_facets_update AFTER UPDATE ON produtos
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+    """,
+    """
+    CREATE TRIGGER produtos_facets_delete AFTER DELETE ON produtos
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION produtos_facet_counts()
+    """,
+)
+
+# Triggers em produtos: criados junto com essa tabela no create_all
+for ddl in (FACET_COUNTS_FUNCTION, *FACET_COUNTS_TRIGGERS):
+    sa.event.listen(ProdutoModel.__table__, "after_create", sa.DDL(ddl))
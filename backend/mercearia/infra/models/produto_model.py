@@ -1,25 +1,126 @@
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from mercearia.domain.entities.produto import Produto
 from mercearia.infra.database import Base
 import uuid
+from datetime import datetime
+from decimal import Decimal
+
+# Nome pesa mais que a descrição no ranking (pesos A e B)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('portuguese', coalesce(nome, '')), 'A') || "
+    "setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'B')"
+)
+
+# Versão de alteração do catálogo (GET /produtos/changes). Atribuída pelos
+# triggers abaixo, inclusive para escritas em SQL puro como o importador.
+CHANGE_SEQUENCE = sa.Sequence("produtos_change_seq", metadata=Base.metadata)
+
+# O advisory lock enfileira os escritores do catálogo até o commit: uma versão
+# só é gerada depois que todas as menores já estão visíveis, então um cliente
+# que leu até N nunca perde uma alteração N-1 confirmada mais tarde.
+TRACK_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION produtos_track_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('produtos_change_seq'));
+    NEW.change_version := nextval('produtos_change_seq');
+    NEW.updated_at := now();
+    IF TG_OP = 'INSERT' THEN
+        DELETE FROM produtos_tombstones WHERE produto_id = NEW.id;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TRACK_DELETE_FUNCTION = """
+CREATE OR REPLACE FUNCTION produtos_track_delete() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('produtos_change_seq'));
+    INSERT INTO produtos_tombstones (produto_id, change_version, deleted_at)
+    VALUES (OLD.id, nextval('produtos_change_seq'), now())
+    ON CONFLICT (produto_id) DO UPDATE
+    SET change_version = EXCLUDED.change_version, deleted_at = EXCLUDED.deleted_at;
+    RETURN OLD;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TRACK_CHANGE_TRIGGERS = (
+    """
+    CREATE TRIGGER produtos_track_insert BEFORE INSERT ON produtos
+    FOR EACH ROW EXECUTE FUNCTION produtos_track_change()
+    """,
+    # Só alterações visíveis no catálogo (inclusive mudar de categoria/marca,
+    # que altera os filtros): favoritos_count não gera versão
+    """
+    CREATE TRIGGER produtos_track_update BEFORE UPDATE ON produtos
+    FOR EACH ROW
+    WHEN ((OLD.nome, OLD.descricao, OLD.preco, OLD.imagem,
+           OLD.categoria_id, OLD.marca_id)
+        IS DISTINCT FROM (NEW.nome, NEW.descricao, NEW.preco, NEW.imagem,
+                          NEW.categoria_id, NEW.marca_id))
+    EXECUTE FUNCTION produtos_track_change()
+    """,
+    """
+    CREATE TRIGGER produtos_track_delete AFTER DELETE ON produtos
+    FOR EACH ROW EXECUTE FUNCTION produtos_track_delete()
+    """,
+)
 
 
 class ProdutoModel(Base):
     __tablename__ = "produtos"
+    # Índices da paginação keyset: ordenação por (nome, id) e (preco, id)
+    __table_args__ = (
+        sa.Index("ix_produtos_nome_id", "nome", "id"),
+        sa.Index("ix_produtos_preco_id", "preco", "id"),
+        sa.Index("ix_produtos_search_vector", "search_vector", postgresql_using="gin"),
+        # Ranking de populares lido de trás para frente, só até o limit
+        sa.Index("ix_produtos_favoritos_count_id", "favoritos_count", "id"),
+        sa.Index("ix_produtos_change_version", "change_version"),
+        # Filtros por categoria/marca na ordenação padrão (nome, id)
+        sa.Index("ix_produtos_categoria_nome_id", "categoria_id", "nome", "id"),
+        sa.Index("ix_produtos_marca_nome_id", "marca_id", "nome", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     nome: Mapped[str] = mapped_column(sa.String, nullable=False)
     descricao: Mapped[str] = mapped_column(sa.String, nullable=False)
-    preco: Mapped[float] = mapped_column(sa.Float, nullable=False)
+    preco: Mapped[Decimal] = mapped_column(sa.Numeric(10, 2), nullable=False)
     imagem: Mapped[str] = mapped_column(sa.String, nullable=False)
-
-    favoritado = relationship(
-        "FavoritoModel", back_populates="produto", lazy="selectin"
+    categoria_id: Mapped[str | None] = mapped_column(
+        sa.String, sa.ForeignKey("categorias.id", ondelete="SET NULL"), nullable=True
+    )
+    marca_id: Mapped[str | None] = mapped_column(
+        sa.String, sa.ForeignKey("marcas.id", ondelete="SET NULL"), nullable=True
+    )
+    # Contador desnormalizado de favoritos; mantido pelo repositório de
+    # favoritos e reconciliado periodicamente com COUNT(*) (favoritos_count.py)
+    favoritos_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    # Preenchidos pelo trigger produtos_track_change
+    change_version: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    )
+    # Gerada pelo banco; deferred para não trafegar nas listagens
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
     )
 
+    # Relacionamentos nunca carregam sozinhos: cada query pede o que usa
+    # (ex.: joinedload) e um acesso esquecido falha em vez de virar N+1
+    favoritado = relationship("FavoritoModel", back_populates="produto", lazy="raise")
+
     @classmethod
     def from_entity(cls, entity: Produto) -> "ProdutoModel":
         return cls(
@@ -28,6 +129,8 @@ class ProdutoModel(Base):
             descricao=entity.descricao,
             preco=entity.preco,
             imagem=entity.imagem,
+            categoria_id=entity.categoria_id,
+            marca_id=entity.marca_id,
         )
 
     def to_entity(self) -> Produto:
@@ -37,4 +140,12 @@ class ProdutoModel(Base):
             descricao=self.descricao,
             preco=self.preco,
             imagem=self.imagem,
+            categoria_id=self.categoria_id,
+            marca_id=self.marca_id,
         )
+
+
+# create_all também cria as funções e os triggers (CREATE OR REPLACE: as
+# funções sobrevivem a um drop_all)
+for ddl in (TRACK_CHANGE_FUNCTION, TRACK_DELETE_FUNCTION, *TRACK_CHANGE_TRIGGERS):
+    sa.event.listen(ProdutoModel.__table__, "after_create", sa.DDL(ddl))
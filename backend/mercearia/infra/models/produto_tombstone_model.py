@@ -0,0 +1,21 @@
+import sqlalchemy as sa
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from mercearia.infra.database import Base
+
+
+class ProdutoTombstoneModel(Base):
+    """Produto removido, para GET /produtos/changes avisar os clientes.
+
+    Gravado pelo trigger produtos_track_delete; apagado se o id voltar.
+    """
+
+    __tablename__ = "produtos_tombstones"
+
+    produto_id: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    change_version: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, index=True
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False
+    )
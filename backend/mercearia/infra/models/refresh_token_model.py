@@ -0,0 +1,49 @@
+import sqlalchemy as sa
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from mercearia.domain.entities.refresh_token import RefreshToken
+from mercearia.infra.database import Base
+import uuid
+
+
+class RefreshTokenModel(Base):
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[str] = mapped_column(
+        sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        sa.String, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    token_hash: Mapped[str] = mapped_column(sa.String, nullable=False, unique=True)
+    family_id: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
+    token_version: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), nullable=True
+    )
+
+    @classmethod
+    def from_entity(cls, entity: RefreshToken) -> "RefreshTokenModel":
+        return cls(
+            id=entity.id,
+            user_id=entity.user_id,
+            token_hash=entity.token_hash,
+            family_id=entity.family_id,
+            token_version=entity.token_version,
+            expires_at=entity.expires_at,
+            revoked_at=entity.revoked_at,
+        )
+
+    def to_entity(self) -> RefreshToken:
+        return RefreshToken(
+            id=self.id,
+            user_id=self.user_id,
+            token_hash=self.token_hash,
+            family_id=self.family_id,
+            token_version=self.token_version,
+            expires_at=self.expires_at,
+            revoked_at=self.revoked_at,
+        )
@@ -3,7 +3,7 @@ import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from mercearia.domain.entities.user import User
 from mercearia.domain.value_objects.email_vo import Email
-from mercearia.domain.value_objects.password_vo import Password
+from mercearia.domain.value_objects.password_vo import HashedPassword
 from mercearia.infra.database import Base
 import uuid
 
@@ -18,17 +18,29 @@ class UserModel(Base):
     email: Mapped[str] = mapped_column(sa.String, unique=True, nullable=False)
     password: Mapped[str] = mapped_column(sa.String, nullable=False)
     role: Mapped[str] = mapped_column(sa.String, default="user")
+    token_version: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    # Incrementado a cada alteração nos favoritos; base do ETag de /favoritos
+    favoritos_version: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
 
-    favoritos = relationship("FavoritoModel", lazy="selectin", back_populates="user")
+    favoritos = relationship("FavoritoModel", lazy="raise", back_populates="user")
 
     @classmethod
     def from_entity(cls, entity: User) -> "UserModel":
+        # Só grava hashes prontos: o de uma senha candidata sai do pool de
+        # bcrypt (await Password.hash()), nunca do event loop
+        if not isinstance(entity.password, HashedPassword):
+            raise TypeError("password deve ser HashedPassword; use await hash()")
         return cls(
             id=entity.id,
             name=entity.name,
             email=str(entity.email),
-            password=str(entity.password),
+            password=entity.password.value(),
             role=entity.role,
+            token_version=entity.token_version,
         )
 
     def to_entity(self) -> User:
@@ -36,6 +48,7 @@ class UserModel(Base):
             id=self.id,
             name=self.name,
             email=Email(self.email),
-            password=Password(self.password),
+            password=HashedPassword(self.password),
             role=self.role,
+            token_version=self.token_version,
         )
@@ -1,19 +1,29 @@
 from mercearia.domain.repositories.favorito_repository import FavoritoRepository
 from mercearia.domain.entities.favorito import Favorito
-from typing import List
+from typing import Dict, List
 
 
 class InMemoryFavoritoRepository(FavoritoRepository):
     def __init__(self):
         self._favoritos: List[Favorito] = []
+        self._versions: Dict[str, int] = {}
 
     async def add(self, favorito: Favorito) -> None:
         if favorito not in self._favoritos:
             self._favoritos.append(favorito)
+            self._bump(favorito.user_id)
 
     async def remove(self, favorito: Favorito) -> None:
         if favorito in self._favoritos:
             self._favoritos.remove(favorito)
+            self._bump(favorito.user_id)
+
+    def _bump(self, user_id: str) -> None:
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    async def get_version(self, user_id: str) -> tuple[int, int]:
+        # Sem catálogo próprio: os produtos vêm prontos nas entidades
+        return self._versions.get(user_id, 0), 0
 
     async def list_by_user(self, user_id: str) -> List[Favorito]:
         return [f for f in self._favoritos if f.user_id == user_id]
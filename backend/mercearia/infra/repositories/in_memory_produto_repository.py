@@ -1,6 +1,29 @@
 from mercearia.domain.repositories.produto_repository import ProdutoRepository
 from mercearia.domain.entities.produto import Produto
-from typing import List
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+from mercearia.domain.value_objects.produto_cursor import ProdutoCursor, SORT_FIELDS
+from mercearia.domain.value_objects.produto_facets import FacetCount, ProdutoFacets
+from mercearia.infra.search.inverted_index import (
+    DESCRICAO_WEIGHT,
+    NOME_WEIGHT,
+    InvertedIndex,
+)
+from typing import Dict, List
+from decimal import Decimal
+import unicodedata
+
+
+def _collation_key(nome: str) -> tuple:
+    """Aproxima a ordem da collation linguística do Postgres (en_US.utf8).
+
+    Primeiro sem acentos e sem caixa, depois acentos, depois caixa
+    (minúscula antes), para "Água" ficar entre "agua" e "arroz" como no
+    ORDER BY do banco, e não depois de "Zebra" como na ordem de code point.
+    Bancos com collation "C" ordenam por code point; aí as duas divergem.
+    """
+    decomposed = unicodedata.normalize("NFD", nome)
+    base = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return (base.casefold(), decomposed.casefold(), nome.swapcase(), nome)
 
 
 class InMemoryProdutoRepository(ProdutoRepository):
@@ -35,6 +58,120 @@ class InMemoryProdutoRepository(ProdutoRepository):
                 imagem="cafe.jpg",
             ),
         ]
+        self._by_id = {p.id: p for p in self._produtos}
+        self.favoritos_count: Dict[str, int] = {}
+        # Versões de alteração (id -> versão) e remoções, como os triggers
+        self._versions = {p.id: v for v, p in enumerate(self._produtos, start=1)}
+        self.tombstones: Dict[str, int] = {}
+        # Nomes de categorias/marcas (id -> nome); a de cada produto fica na
+        # entidade (categoria_id/marca_id)
+        self.categorias: Dict[str, str] = {}
+        self.marcas: Dict[str, str] = {}
+        self._index = InvertedIndex()
+        for produto in self._produtos:
+            self._index.add(
+                produto.id,
+                [(produto.nome, NOME_WEIGHT), (produto.descricao, DESCRICAO_WEIGHT)],
+            )
 
     async def get_all(self) -> List[Produto]:
         return self._produtos
+
+    async def list_page(
+        self,
+        limit: int,
+        sort: str = "nome",
+        after: ProdutoCursor | None = None,
+        min_preco: Decimal | None = None,
+        max_preco: Decimal | None = None,
+        categoria: str | None = None,
+        marca: str | None = None,
+    ) -> List[Produto]:
+        field, descending = SORT_FIELDS[sort]
+
+        def key_of(value, id: str) -> tuple:
+            return (_collation_key(value) if field == "nome" else value, id)
+
+        def key(p: Produto) -> tuple:
+            return key_of(getattr(p, field), p.id)
+
+        produtos = [
+            p
+            for p in self._produtos
+            if (min_preco is None or p.preco >= min_preco)
+            and (max_preco is None or p.preco <= max_preco)
+            and (categoria is None or p.categoria_id == categoria)
+            and (marca is None or p.marca_id == marca)
+        ]
+        produtos.sort(key=key, reverse=descending)
+        if after is not None:
+            cursor = key_of(after.value, after.id)
+            produtos = [
+                p
+                for p in produtos
+                if (key(p) < cursor if descending else key(p) > cursor)
+            ]
+        return produtos[:limit]
+
+    async def search(
+        self, query: str, limit: int, after: ProdutoCursor | None = None
+    ) -> List[tuple[Produto, float]]:
+        def key(item: tuple[str, float]) -> tuple:
+            return (-item[1], item[0])
+
+        ranked = sorted(self._index.search(query).items(), key=key)
+        if after is not None:
+            cursor_key = (-float(after.value), after.id)
+            ranked = [item for item in ranked if key(item) > cursor_key]
+        return [(self._by_id[doc_id], score) for doc_id, score in ranked[:limit]]
+
+    async def list_populares(self, limit: int) -> List[tuple[Produto, int]]:
+        ranked = sorted(
+            ((count, produto_id) for produto_id, count in self.favoritos_count.items()),
+            reverse=True,
+        )
+        return [
+            (self._by_id[produto_id], count)
+            for count, produto_id in ranked
+            if count > 0 and produto_id in self._by_id
+        ][:limit]
+
+    async def list_changes(self, since: int, limit: int) -> List[ProdutoChange]:
+        changes = [
+            ProdutoChange(version, produto_id, self._by_id[produto_id])
+            for produto_id, version in self._versions.items()
+            if version > since
+        ] + [
+            ProdutoChange(version, produto_id, None)
+            for produto_id, version in self.tombstones.items()
+            if version > since
+        ]
+        changes.sort(key=lambda change: change.version)
+        return changes[:limit]
+
+    async def facet_counts(
+        self, categoria: str | None = None, marca: str | None = None
+    ) -> ProdutoFacets:
+        def counts(
+            field: str, names: Dict[str, str], other: str, other_value: str | None
+        ) -> List[FacetCount]:
+            totals: Dict[str, int] = {}
+            for produto in self._produtos:
+                value = getattr(produto, field)
+                if value is None:
+                    continue
+                if other_value is None or getattr(produto, other) == other_value:
+                    totals[value] = totals.get(value, 0) + 1
+            facets = [FacetCount(id, names[id], total) for id, total in totals.items()]
+            return sorted(facets, key=lambda c: (-c.total, c.nome))
+
+        return ProdutoFacets(
+            categorias=counts("categoria_id", self.categorias, "marca_id", marca),
+            marcas=counts("marca_id", self.marcas, "categoria_id", categoria),
+        )
+
+    async def get_by_id(self, produto_id: str) -> Produto | None:
+        return self._by_id.get(produto_id)
+
+    async def get_by_ids(self, produto_ids: List[str]) -> List[Produto]:
+        return [self._by_id[i] for i in produto_ids if i in self._by_id]
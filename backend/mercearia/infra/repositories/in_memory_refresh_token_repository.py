@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+from mercearia.domain.entities.refresh_token import RefreshToken
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+
+
+class InMemoryRefreshTokenRepository(RefreshTokenRepository):
+    def __init__(self):
+        self._tokens: dict[str, RefreshToken] = {}
+
+    async def add(self, token: RefreshToken) -> None:
+        self._tokens[token.token_hash] = token
+
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        return self._tokens.get(token_hash)
+
+    async def rotate(self, old: RefreshToken, new: RefreshToken) -> bool:
+        stored = self._tokens.get(old.token_hash)
+        if stored is None or stored.is_revoked:
+            return False
+        stored.revoked_at = datetime.now(timezone.utc)
+        self._tokens[new.token_hash] = new
+        return True
+
+    async def revoke_family(self, family_id: str) -> None:
+        now = datetime.now(timezone.utc)
+        for token in self._tokens.values():
+            if token.family_id == family_id and not token.is_revoked:
+                token.revoked_at = now
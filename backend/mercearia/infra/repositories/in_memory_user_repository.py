@@ -26,7 +26,7 @@ class InMemoryUserRepository(UserRepository):
 
     async def login(self, email: Email, password: Password) -> User:
         for user in self._users:
-            if user.email.value() == email and user.password.value() == password:
+            if user.email.value() == email and user.password == password:
                 self._current_user = user
                 return user
         raise ValueError("Credenciais inválidas")
@@ -39,3 +39,9 @@ class InMemoryUserRepository(UserRepository):
 
     async def set_current_user(self, user: User) -> None:
         self._current_user = user
+
+    async def get_token_version(self, user_id: str) -> int | None:
+        for user in self._users:
+            if user.id == user_id:
+                return user.token_version
+        return None
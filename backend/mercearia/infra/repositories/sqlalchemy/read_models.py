@@ -0,0 +1,54 @@
+from typing import Any, Sequence
+from sqlalchemy import Select, Table, select
+from mercearia.domain.entities.favorito import Favorito
+from mercearia.domain.entities.produto import Produto
+from mercearia.infra.models.categoria_model import CategoriaModel
+from mercearia.infra.models.favoritos_model import FavoritoModel
+from mercearia.infra.models.marca_model import MarcaModel
+from mercearia.infra.models.produto_facet_model import ProdutoFacetCountModel
+from mercearia.infra.models.produto_model import ProdutoModel
+from mercearia.infra.models.produto_tombstone_model import ProdutoTombstoneModel
+
+# Leituras das listagens quentes: só as colunas usadas, direto da tabela.
+# As linhas viram entidades sem passar por instâncias ORM, então não há
+# identity map, snapshot de atributos nem rastreamento de alterações.
+
+produtos: Table = ProdutoModel.__table__  # type: ignore[assignment]
+favoritos: Table = FavoritoModel.__table__  # type: ignore[assignment]
+tombstones: Table = ProdutoTombstoneModel.__table__  # type: ignore[assignment]
+categorias: Table = CategoriaModel.__table__  # type: ignore[assignment]
+marcas: Table = MarcaModel.__table__  # type: ignore[assignment]
+facet_counts: Table = ProdutoFacetCountModel.__table__  # type: ignore[assignment]
+
+# Mesma ordem dos parâmetros de Produto.__init__
+PRODUTO_COLUMNS = (
+    produtos.c.id,
+    produtos.c.nome,
+    produtos.c.descricao,
+    produtos.c.preco,
+    produtos.c.imagem,
+    produtos.c.categoria_id,
+    produtos.c.marca_id,
+)
+# Índice da primeira coluna extra passada a select_produtos
+PRODUTO_WIDTH = len(PRODUTO_COLUMNS)
+
+
+def select_produtos(*extra: Any) -> Select:
+    return select(*PRODUTO_COLUMNS, *extra)
+
+
+def produto_from_row(row: Sequence[Any]) -> Produto:
+    return Produto(row[0], row[1], row[2], row[3], row[4], row[5], row[6])
+
+
+def select_favoritos_com_produto() -> Select:
+    return select(
+        favoritos.c.id, favoritos.c.user_id, favoritos.c.produto_id, *PRODUTO_COLUMNS
+    ).join_from(favoritos, produtos, favoritos.c.produto_id == produtos.c.id)
+
+
+def favorito_from_row(row: Sequence[Any]) -> Favorito:
+    return Favorito(
+        id=row[0], user_id=row[1], produto_id=row[2], produto=produto_from_row(row[3:])
+    )
@@ -1,10 +1,18 @@
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, delete, update, func
 from mercearia.domain.entities.favorito import Favorito
 from mercearia.domain.repositories.favorito_repository import FavoritoRepository
 from mercearia.infra.models.favoritos_model import FavoritoModel
+from mercearia.infra.models.produto_model import ProdutoModel
+from mercearia.infra.models.user_model import UserModel
+from mercearia.infra.repositories.sqlalchemy.read_models import (
+    favorito_from_row,
+    favoritos,
+    produtos,
+    select_favoritos_com_produto,
+    tombstones,
+)
 
 
 class SQLAlchemyFavoritoRepository(FavoritoRepository):
@@ -18,25 +26,68 @@ class SQLAlchemyFavoritoRepository(FavoritoRepository):
             print(f"{db_favorito.user_id} : {db_favorito.produto_id}")
 
             self._session.add(db_favorito)
+            await self._bump_version(favorito.user_id)
+            await self._adjust_count(favorito.produto_id, 1)
             await self._session.commit()
 
     async def remove(self, favorito: Favorito) -> None:
         print(f"{favorito.user_id} : {favorito.produto_id}")
-        stmt = delete(FavoritoModel).where(
-            FavoritoModel.user_id == favorito.user_id,
-            FavoritoModel.produto_id == favorito.produto_id,
+        stmt = (
+            delete(FavoritoModel)
+            .where(
+                FavoritoModel.user_id == favorito.user_id,
+                FavoritoModel.produto_id == favorito.produto_id,
+            )
+            .returning(FavoritoModel.id)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        if result.first() is not None:
+            await self._bump_version(favorito.user_id)
+            await self._adjust_count(favorito.produto_id, -1)
         await self._session.commit()
 
-    async def list_by_user(self, user_id: str) -> List[Favorito]:
-        stmt = (
-            select(FavoritoModel)
-            .options(joinedload(FavoritoModel.produto))
-            .where(FavoritoModel.user_id == user_id)
+    async def _bump_version(self, user_id: str) -> None:
+        # Mesma transação da alteração: o ETag nunca fica à frente dos dados
+        await self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(favoritos_version=UserModel.favoritos_version + 1)
+        )
+
+    async def _adjust_count(self, produto_id: str, delta: int) -> None:
+        # Incremento relativo: transações concorrentes não se sobrescrevem
+        await self._session.execute(
+            update(ProdutoModel)
+            .where(ProdutoModel.id == produto_id)
+            .values(favoritos_count=ProdutoModel.favoritos_count + delta)
         )
+
+    async def get_version(self, user_id: str) -> tuple[int, int]:
+        # A lista também mostra dados dos produtos, que mudam sem tocar em
+        # favoritos_version (UPDATE direto, SET NULL de categoria/marca,
+        # remoção). Toda mudança do catálogo gera change_version;
+        # o maior entre produtos e remoções só cresce. MAX sai dos índices.
+        catalog = func.greatest(
+            select(
+                func.coalesce(func.max(produtos.c.change_version), 0)
+            ).scalar_subquery(),
+            select(
+                func.coalesce(func.max(tombstones.c.change_version), 0)
+            ).scalar_subquery(),
+        )
+        stmt = select(
+            select(UserModel.favoritos_version)
+            .where(UserModel.id == user_id)
+            .scalar_subquery(),
+            catalog,
+        )
+        favoritos_version, catalog_version = (await self._session.execute(stmt)).one()
+        return favoritos_version or 0, catalog_version
+
+    async def list_by_user(self, user_id: str) -> List[Favorito]:
+        stmt = select_favoritos_com_produto().where(favoritos.c.user_id == user_id)
         result = await self._session.execute(stmt)
-        return [f.to_entity() for f in result.scalars().all()]
+        return [favorito_from_row(row) for row in result]
 
     async def exists(self, user_id: str, produto_id: str) -> bool:
         print(f"{user_id} : {produto_id}")
@@ -1,9 +1,37 @@
+from decimal import Decimal
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    String,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from mercearia.domain.entities.produto import Produto
 from mercearia.domain.repositories.produto_repository import ProdutoRepository
-from mercearia.infra.models.produto_model import ProdutoModel
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+from mercearia.domain.value_objects.produto_cursor import ProdutoCursor, SORT_FIELDS
+from mercearia.domain.value_objects.produto_facets import FacetCount, ProdutoFacets
+from mercearia.infra.repositories.sqlalchemy.read_models import (
+    PRODUTO_COLUMNS,
+    PRODUTO_WIDTH,
+    categorias,
+    facet_counts,
+    marcas,
+    produto_from_row,
+    produtos,
+    select_produtos,
+    tombstones,
+)
 
 
 class SQLAlchemyProdutoRepository(ProdutoRepository):
@@ -11,6 +39,166 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         self._session = session
 
     async def get_all(self) -> List[Produto]:
-        stmt = select(ProdutoModel)
+        result = await self._session.execute(select_produtos())
+        return [produto_from_row(row) for row in result]
+
+    async def get_by_id(self, produto_id: str) -> Produto | None:
+        stmt = select_produtos().where(produtos.c.id == produto_id)
+        row = (await self._session.execute(stmt)).first()
+        return produto_from_row(row) if row else None
+
+    async def get_by_ids(self, produto_ids: List[str]) -> List[Produto]:
+        if not produto_ids:
+            return []
+        # Um único parâmetro array: o mesmo SQL preparado para qualquer quantidade
+        ids = bindparam("ids", produto_ids, type_=ARRAY(String))
+        stmt = select_produtos().where(produtos.c.id == any_(ids))
+        result = await self._session.execute(stmt)
+        return [produto_from_row(row) for row in result]
+
+    async def list_page(
+        self,
+        limit: int,
+        sort: str = "nome",
+        after: ProdutoCursor | None = None,
+        min_preco: Decimal | None = None,
+        max_preco: Decimal | None = None,
+        categoria: str | None = None,
+        marca: str | None = None,
+    ) -> List[Produto]:
+        # Keyset: "(coluna, id) > cursor" usa os índices (nome, id)/(preco, id)
+        # sem OFFSET, então o custo não cresce com a página. A ordem
+        # decrescente inverte as duas colunas para o índice ser lido de trás
+        # para frente.
+        field, descending = SORT_FIELDS[sort]
+        column = produtos.c[field]
+        if descending:
+            order_by = (column.desc(), produtos.c.id.desc())
+        else:
+            order_by = (column.asc(), produtos.c.id.asc())
+        stmt = select_produtos().order_by(*order_by).limit(limit)
+        if min_preco is not None:
+            stmt = stmt.where(produtos.c.preco >= min_preco)
+        if max_preco is not None:
+            stmt = stmt.where(produtos.c.preco <= max_preco)
+        if categoria is not None:
+            stmt = stmt.where(produtos.c.categoria_id == categoria)
+        if marca is not None:
+            stmt = stmt.where(produtos.c.marca_id == marca)
+        if after is not None:
+            if field == "id":
+                stmt = stmt.where(produtos.c.id > after.id)
+            else:
+                key = tuple_(column, produtos.c.id)
+                cursor = tuple_(after.value, after.id)
+                stmt = stmt.where(key < cursor if descending else key > cursor)
+        result = await self._session.execute(stmt)
+        return [produto_from_row(row) for row in result]
+
+    async def search(
+        self, query: str, limit: int, after: ProdutoCursor | None = None
+    ) -> List[tuple[Produto, float]]:
+        # websearch_to_tsquery aceita qualquer texto do usuário sem erro de sintaxe
+        tsquery = func.websearch_to_tsquery("portuguese", query)
+        rank = func.ts_rank_cd(produtos.c.search_vector, tsquery)
+        stmt = (
+            select_produtos(rank.label("rank"))
+            .where(produtos.c.search_vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), produtos.c.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                or_(
+                    rank < after.value,
+                    and_(rank == after.value, produtos.c.id > after.id),
+                )
+            )
+        result = await self._session.execute(stmt)
+        return [(produto_from_row(row), float(row[PRODUTO_WIDTH])) for row in result]
+
+    async def list_populares(self, limit: int) -> List[tuple[Produto, int]]:
+        # Lê o índice (favoritos_count, id) de trás para frente: O(limit),
+        # sem agregar a tabela de favoritos
+        count = produtos.c.favoritos_count
+        stmt = (
+            select_produtos(count)
+            .where(count > 0)
+            .order_by(count.desc(), produtos.c.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [(produto_from_row(row), row[PRODUTO_WIDTH]) for row in result]
+
+    async def list_changes(self, since: int, limit: int) -> List[ProdutoChange]:
+        # Um único statement (um snapshot) sobre os dois índices de
+        # change_version; remoções vêm com as colunas do produto nulas
+        changed = (
+            select_produtos(produtos.c.change_version.label("version"))
+            .where(produtos.c.change_version > since)
+            .order_by(produtos.c.change_version)
+            .limit(limit)
+        )
+        removed = (
+            select(
+                tombstones.c.produto_id,
+                *(cast(null(), c.type) for c in PRODUTO_COLUMNS[1:]),
+                tombstones.c.change_version,
+            )
+            .where(tombstones.c.change_version > since)
+            .order_by(tombstones.c.change_version)
+            .limit(limit)
+        )
+        stmt = union_all(changed, removed).order_by("version").limit(limit)
+        result = await self._session.execute(stmt)
+        return [
+            ProdutoChange(
+                version=row[PRODUTO_WIDTH],
+                produto_id=row[0],
+                produto=produto_from_row(row) if row[1] is not None else None,
+            )
+            for row in result
+        ]
+
+    async def facet_counts(
+        self, categoria: str | None = None, marca: str | None = None
+    ) -> ProdutoFacets:
+        # Soma a tabela de pares (categoria, marca) mantida por trigger, sem
+        # varrer produtos. Cada faceta aplica só o filtro da outra dimensão.
+        total = func.sum(facet_counts.c.total)
+
+        def facet(kind: str, dimension, column, other, other_value):
+            stmt = (
+                select(literal(kind), dimension.c.id, dimension.c.nome, total)
+                .join_from(facet_counts, dimension, column == dimension.c.id)
+                .group_by(dimension.c.id, dimension.c.nome)
+                .having(total > 0)
+            )
+            if other_value is not None:
+                stmt = stmt.where(other == other_value)
+            return stmt
+
+        stmt = union_all(
+            facet(
+                "categoria",
+                categorias,
+                facet_counts.c.categoria_id,
+                facet_counts.c.marca_id,
+                marca,
+            ),
+            facet(
+                "marca",
+                marcas,
+                facet_counts.c.marca_id,
+                facet_counts.c.categoria_id,
+                categoria,
+            ),
+        )
         result = await self._session.execute(stmt)
-        return [produto.to_entity() for produto in result.scalars().all()]
+        facets = ProdutoFacets()
+        for kind, id, nome, count in result:
+            target = facets.categorias if kind == "categoria" else facets.marcas
+            target.append(FacetCount(id=id, nome=nome, total=int(count)))
+        for counts in (facets.categorias, facets.marcas):
+            counts.sort(key=lambda c: (-c.total, c.nome))
+        return facets
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from mercearia.domain.entities.refresh_token import RefreshToken
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from mercearia.infra.models.refresh_token_model import RefreshTokenModel
+
+
+class SQLAlchemyRefreshTokenRepository(RefreshTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, token: RefreshToken) -> None:
+        self._session.add(RefreshTokenModel.from_entity(token))
+        await self._session.commit()
+
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        result = await self._session.execute(
+            select(RefreshTokenModel).where(RefreshTokenModel.token_hash == token_hash)
+        )
+        model = result.scalar_one_or_none()
+        return model.to_entity() if model else None
+
+    async def rotate(self, old: RefreshToken, new: RefreshToken) -> bool:
+        # A condição em revoked_at impede que dois refresh simultâneos
+        # com o mesmo token gerem dois sucessores
+        result = await self._session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.id == old.id,
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now(timezone.utc))
+            .returning(RefreshTokenModel.id)
+        )
+        if result.scalar_one_or_none() is None:
+            await self._session.rollback()
+            return False
+        self._session.add(RefreshTokenModel.from_entity(new))
+        await self._session.commit()
+        return True
+
+    async def revoke_family(self, family_id: str) -> None:
+        await self._session.execute(
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.family_id == family_id,
+                RefreshTokenModel.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        await self._session.commit()
@@ -4,9 +4,12 @@ from sqlalchemy import select, update
 from mercearia.domain.entities.user import User
 from mercearia.domain.repositories.user_repository import UserRepository
 from mercearia.domain.value_objects.email_vo import Email
-from mercearia.domain.value_objects.password_vo import Password
+from mercearia.domain.value_objects.password_vo import Password, HashedPassword
 from mercearia.infra.models.user_model import UserModel
-from mercearia.api.security import verify_token
+from mercearia.api.security import password_needs_rehash
+from mercearia.api.password_hasher import PasswordHasherSaturatedError
+from mercearia.infra.cache.token_version_cache import token_version_cache
+from mercearia.infra.cache.user_cache import UserRecord, user_cache
 
 
 class SQLAlchemyUserRepository(UserRepository):
@@ -15,32 +18,78 @@ class SQLAlchemyUserRepository(UserRepository):
         self._current_user: Optional[User] = None
 
     async def login(self, email: Email, password: Password) -> User:
-        stmt = select(UserModel).where(UserModel.email == str(email))
-        result = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
+        # Direto do banco: com o cache, a senha antiga valeria em outros
+        # workers até a entrada expirar
+        record = await self._get_record_by_email(email.value(), use_cache=False)
 
-        if user_model and password.verify(user_model.password):
-            self._current_user = user_model.to_entity()
+        # Único bcrypt do login: verificação da senha candidata contra o hash salvo
+        if record and await HashedPassword(record.password).verify(password):
+            if password_needs_rehash(record.password):
+                await self._rehash(record, password)
+            self._current_user = record.to_entity()
             return self._current_user
 
         raise ValueError("Credenciais inválidas")
 
+    async def _rehash(self, record: UserRecord, password: Password) -> None:
+        # Migra o hash para o custo atual do bcrypt aproveitando a senha do login
+        try:
+            new_hash = await password.hash()
+        except PasswordHasherSaturatedError:
+            return  # tenta de novo no próximo login
+        await self._session.execute(
+            update(UserModel)
+            # Só substitui se ninguém trocou a senha nesse meio tempo
+            .where(
+                UserModel.id == record.id, UserModel.password == record.password
+            ).values(password=new_hash)
+        )
+        await self._session.commit()
+        user_cache.invalidate(user_id=record.id, email=record.email)
+
     async def update_password(self, email: Email, password: Password):
         if await self._email_exist(email):
+            hashed = await password.hash()
             result = await self._session.execute(
                 update(UserModel)
                 .where(UserModel.email == email.value())
-                .values(password=str(password))
+                .values(password=hashed, token_version=UserModel.token_version + 1)
+                .returning(UserModel.id, UserModel.token_version)
             )
+            user_id, token_version = result.one()
             await self._session.commit()
+            user_cache.invalidate(user_id=user_id, email=email.value())
+            token_version_cache.set(user_id, token_version)
             return
         raise ValueError("Email não existente")
 
     async def _email_exist(self, email: Email):
-        result = await self._session.execute(
-            select(UserModel).where(UserModel.email == email.value())
+        return await self._get_record_by_email(email.value()) is not None
+
+    async def _get_record_by_email(
+        self, email: str, use_cache: bool = True
+    ) -> UserRecord | None:
+        record = user_cache.get_by_email(email) if use_cache else None
+        if record is None:
+            result = await self._session.execute(
+                select(UserModel).where(UserModel.email == email)
+            )
+            record = self._cache_model(result.scalar_one_or_none())
+        return record
+
+    def _cache_model(self, user_model: UserModel | None) -> UserRecord | None:
+        if user_model is None:
+            return None
+        record = UserRecord(
+            id=user_model.id,
+            name=user_model.name,
+            email=user_model.email,
+            password=user_model.password,
+            role=user_model.role,
+            token_version=user_model.token_version,
         )
-        return result.scalar_one_or_none() is not None
+        user_cache.put(record)
+        return record
 
     async def logout(self) -> None:
         self._current_user = None
@@ -51,11 +100,21 @@ class SQLAlchemyUserRepository(UserRepository):
     async def set_current_user(self, user: User) -> None:
         self._current_user = user
 
-    async def get_by_id(self, user_id: str) -> User:
+    async def get_by_id(self, user_id: str, fresh: bool = False) -> User:
+        record = None if fresh else user_cache.get_by_id(user_id)
+        if record is None:
+            result = await self._session.execute(
+                select(UserModel).where(UserModel.id == user_id)
+            )
+            record = self._cache_model(result.scalar_one_or_none())
+        if record is None:
+            raise ValueError("Usuário não encontrado")
+        return record.to_entity()
+
+    async def get_token_version(self, user_id: str) -> int | None:
+        # Nunca do user_cache: é a checagem de revogação, e o cache de outro
+        # worker não vê a troca de senha feita aqui
         result = await self._session.execute(
-            select(UserModel).where(UserModel.id == user_id)
+            select(UserModel.token_version).where(UserModel.id == user_id)
         )
-        user_model = result.scalar_one_or_none()
-        if user_model is None:
-            raise ValueError("Usuário não encontrado")
-        return user_model.to_entity()
+        return result.scalar_one_or_none()
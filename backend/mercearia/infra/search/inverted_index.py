@@ -0,0 +1,78 @@
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable
+
+_TOKEN = re.compile(r"\w+")
+
+# Stopwords mais comuns do português; a configuração 'portuguese' do
+# Postgres também as descarta
+_STOPWORDS = frozenset(
+    "a o as os de da do das dos e em no na nos nas um uma uns umas com sem "
+    "para por que se ao aos ou".split()
+)
+
+# Mesmos pesos relativos do setweight 'A'/'B' usado na coluna tsvector
+NOME_WEIGHT = 1.0
+DESCRICAO_WEIGHT = 0.4
+
+
+def normalize_terms(text: str) -> list[str]:
+    """Minúsculas, sem acentos, sem stopwords e com um stem simples de plural.
+
+    Aproxima o dicionário 'portuguese' do Postgres o suficiente para testes e
+    execução local; não é um stemmer completo.
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    terms = []
+    for token in _TOKEN.findall(text):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class InvertedIndex:
+    """Índice invertido termo -> {id: peso} para busca em memória."""
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._terms_by_id: dict[str, set[str]] = {}
+
+    def add(self, doc_id: str, fields: Iterable[tuple[str, float]]) -> None:
+        self.remove(doc_id)
+        terms: set[str] = set()
+        for text, weight in fields:
+            for term in normalize_terms(text):
+                postings = self._postings[term]
+                postings[doc_id] = postings.get(doc_id, 0.0) + weight
+                terms.add(term)
+        self._terms_by_id[doc_id] = terms
+
+    def remove(self, doc_id: str) -> None:
+        for term in self._terms_by_id.pop(doc_id, ()):
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str) -> dict[str, float]:
+        """Documentos com todos os termos da busca e sua pontuação."""
+        terms = normalize_terms(query)
+        if not terms:
+            return {}
+        # Começa pelo termo mais raro para reduzir a interseção
+        postings = sorted(
+            (self._postings.get(term, {}) for term in set(terms)), key=len
+        )
+        scores = dict(postings[0])
+        for other in postings[1:]:
+            scores = {
+                doc_id: score + other[doc_id]
+                for doc_id, score in scores.items()
+                if doc_id in other
+            }
+        return scores
@@ -0,0 +1,229 @@
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from mercearia.api.metrics import register_metrics
+from mercearia.api.settings import settings
+
+_HASHED_NAME = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+
+
+@dataclass(frozen=True, slots=True)
+class ImageInfo:
+    name: str
+    path: Path
+    digest: str
+    size: int
+    mtime_ns: int
+    media_type: str
+    stat: os.stat_result
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    @property
+    def hashed_name(self) -> str:
+        stem, ext = os.path.splitext(self.name)
+        return f"{stem}.{self.digest[:12]}{ext}"
+
+
+@dataclass
+class ImageCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bytes: int = 0
+    files: int = 0
+
+
+class ImageStore:
+    """Imagens de produto de um diretório, com manifesto de hashes.
+
+    O manifesto (nome -> digest do conteúdo) permite URLs com hash, que
+    nunca mudam de conteúdo e podem ser cacheadas como imutáveis. Arquivos
+    pequenos ficam em memória (LRU limitado em bytes); os demais são enviados
+    direto do disco.
+
+    ``info``/``resolve`` e ``read_small`` rodam em threads (fazem IO) enquanto
+    o event loop usa ``cached`` e ``url_name``: manifesto, LRU e contadores
+    só mudam sob ``_lock``. Hash e leitura de arquivo ficam fora dele.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_file_bytes: int, max_total_bytes: int
+    ):
+        self._directory = Path(directory).resolve()
+        self._max_file_bytes = max_file_bytes
+        self._max_total_bytes = max_total_bytes
+        self._manifest: dict[str, ImageInfo] = {}
+        self._contents: OrderedDict[str, tuple[int, bytes]] = OrderedDict()
+        self.stats = ImageCacheStats()
+        self._lock = threading.Lock()
+        # Muda a cada alteração do manifesto, ou seja, das URLs com hash
+        self.version = 0
+
+    def _path(self, name: str) -> Path | None:
+        # Só nomes simples dentro do diretório: nada de "../" ou subpastas
+        if not name or name != os.path.basename(name) or name.startswith("."):
+            return None
+        return self._directory / name
+
+    def _hash(self, path: Path) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def info(self, name: str) -> ImageInfo | None:
+        """Dados atuais do arquivo; recalcula o hash só se ele mudou."""
+        path = self._path(name)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                if self._manifest.pop(name, None) is not None:
+                    self.version += 1
+            return None
+        if not path.is_file():
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._manifest.get(name)
+        if cached and (cached.mtime_ns, cached.size) == key:
+            return cached
+        info = ImageInfo(
+            name=name,
+            path=path,
+            digest=self._hash(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            media_type=mimetypes.guess_type(name)[0] or "application/octet-stream",
+            stat=stat,
+        )
+        with self._lock:
+            # Outra thread pode ter registrado o mesmo arquivo enquanto este
+            # hash era calculado
+            current = self._manifest.get(name)
+            if current and (current.mtime_ns, current.size) == key:
+                return current
+            self._manifest[name] = info
+            self.version += 1
+        return info
+
+    def resolve(self, requested: str) -> tuple[ImageInfo | None, bool]:
+        """(imagem, se o pedido usou o hash atual do conteúdo)."""
+        match = _HASHED_NAME.match(requested)
+        if match:
+            name = match["stem"] + match["ext"]
+            info = self.info(name)
+            if info is not None:
+                return info, info.digest.startswith(match["digest"])
+        return self.info(requested), False
+
+    def scan(self) -> int:
+        """Monta o manifesto de todos os arquivos (chamado no startup)."""
+        if not self._directory.is_dir():
+            return 0
+        for entry in os.scandir(self._directory):
+            if entry.is_file():
+                self.info(entry.name)
+        return len(self._manifest)
+
+    def url_name(self, name: str) -> str | None:
+        # Só consulta o manifesto: não faz IO durante a serialização. Sem
+        # lock: um get em dict é atômico e ImageInfo é imutável
+        info = self._manifest.get(name)
+        return info.hashed_name if info else None
+
+    def cacheable(self, info: ImageInfo) -> bool:
+        return info.size <= self._max_file_bytes
+
+    def cached(self, info: ImageInfo) -> bytes | None:
+        """Conteúdo já em memória, sem IO (None se não está no cache)."""
+        with self._lock:
+            cached = self._contents.get(info.name)
+            if cached and cached[0] == info.mtime_ns:
+                self._contents.move_to_end(info.name)
+                self.stats.hits += 1
+                return cached[1]
+        return None
+
+    def read_small(self, info: ImageInfo) -> bytes | None:
+        """Conteúdo de arquivos pequenos, servido da memória quando possível.
+
+        Lê o disco numa falta de cache: no event loop, tente ``cached`` antes
+        e chame este em uma thread.
+        """
+        if not self.cacheable(info):
+            return None
+        cached = self.cached(info)
+        if cached is not None:
+            return cached
+
+        data = info.path.read_bytes()
+        with self._lock:
+            self.stats.misses += 1
+            self._evict(info.name)
+            self._contents[info.name] = (info.mtime_ns, data)
+            self.stats.bytes += len(data)
+            while self.stats.bytes > self._max_total_bytes and self._contents:
+                self._evict(next(iter(self._contents)))
+            self.stats.files = len(self._contents)
+        return data
+
+    def _evict(self, name: str) -> None:
+        # Chamado com _lock adquirido
+        removed = self._contents.pop(name, None)
+        if removed is not None:
+            self.stats.bytes -= len(removed[1])
+
+    def metrics_snapshot(self) -> dict:
+        with self._lock:
+            return {**asdict(self.stats), "manifest": len(self._manifest)}
+
+
+image_store: ImageStore | None = None
+
+
+def get_image_store() -> ImageStore | None:
+    return image_store
+
+
+def configure_image_store(directory: str | Path | None) -> ImageStore | None:
+    global image_store
+    image_store = (
+        ImageStore(
+            directory,
+            max_file_bytes=settings.IMAGES_CACHE_MAX_FILE_BYTES,
+            max_total_bytes=settings.IMAGES_CACHE_MAX_BYTES,
+        )
+        if directory
+        else None
+    )
+    return image_store
+
+
+def images_version() -> int:
+    """Versão das URLs geradas por ``image_url``, para compor ETags."""
+    return image_store.version if image_store is not None else 0
+
+
+def image_url(name: str) -> str:
+    """Valor de ``imagem`` nas respostas: URL com hash, se habilitado."""
+    if image_store is None or not settings.IMAGES_HASHED_URLS:
+        return name
+    hashed = image_store.url_name(name)
+    return f"{settings.IMAGES_URL_PREFIX}/{hashed}" if hashed else name
+
+
+configure_image_store(settings.IMAGES_DIR)
+register_metrics(
+    "image_cache", lambda: image_store.metrics_snapshot() if image_store else {}
+)
@@ -0,0 +1,48 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from mercearia.api.metrics import register_metrics
+from mercearia.api.settings import settings
+from mercearia.infra.database import async_session
+from mercearia.infra.tasks.periodic_task import PeriodicTask
+
+# Corrige só os produtos cujo contador divergiu do COUNT(*) real (ex.: escrita
+# fora do repositório ou corrida entre exists() e o insert). Linhas que já
+# batem não são regravadas: cada UPDATE em produtos dispara os triggers de
+# versão e de facetas.
+#
+# Corrida aceita: c.total vem do snapshot do início do statement. Um +1/-1
+# commitado por outra transação nesse meio tempo pode ser sobrescrito pelo
+# valor antigo; a próxima execução corrige.
+_RECONCILE = text(
+    """
+    UPDATE produtos p
+    SET favoritos_count = c.total
+    FROM (
+        SELECT p2.id, count(f.id) AS total
+        FROM produtos p2
+        LEFT JOIN favoritos f ON f.produto_id = p2.id
+        GROUP BY p2.id
+    ) c
+    WHERE c.id = p.id AND p.favoritos_count IS DISTINCT FROM c.total
+    """
+)
+
+
+async def reconcile_favoritos_count(session: AsyncSession) -> int:
+    """Recalcula os contadores divergentes; retorna quantos foram corrigidos."""
+    result = await session.execute(_RECONCILE)
+    await session.commit()
+    return result.rowcount  # type: ignore[attr-defined]
+
+
+async def _reconcile_job() -> int:
+    async with async_session() as session:
+        return await reconcile_favoritos_count(session)
+
+
+favoritos_count_task = PeriodicTask(
+    "favoritos_count",
+    interval_seconds=settings.FAVORITOS_COUNT_RECONCILE_SECONDS or 3600,
+    job=_reconcile_job,
+)
+register_metrics("favoritos_count_reconcile", favoritos_count_task.metrics_snapshot)
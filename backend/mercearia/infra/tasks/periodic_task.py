@@ -0,0 +1,82 @@
+import asyncio
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class PeriodicTaskMetrics:
+    runs: int = 0
+    failures: int = 0
+    last_duration_ms: float = 0.0
+    last_error: str | None = None
+    last_result: Any = None
+
+
+class PeriodicTask:
+    """Executa ``job`` a cada ``interval_seconds`` em segundo plano.
+
+    Supervisionada: uma execução que falha é contada e registrada, e o laço
+    segue para a próxima. Só ``stop()`` (ou o cancelamento) encerra a task.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        job: Callable[[], Awaitable[Any]],
+        run_at_start: bool = False,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds deve ser maior que zero")
+        self.name = name
+        self._interval = interval_seconds
+        self._job = job
+        self._run_at_start = run_at_start
+        self._task: asyncio.Task | None = None
+        self.metrics = PeriodicTaskMetrics()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self) -> Any:
+        start = time.perf_counter()
+        try:
+            result = await self._job()
+        except Exception as e:
+            self.metrics.failures += 1
+            self.metrics.last_error = f"{type(e).__name__}: {e}"
+            print(f"Falha na tarefa periódica {self.name}: {e}")
+            return None
+        finally:
+            self.metrics.runs += 1
+            self.metrics.last_duration_ms = (time.perf_counter() - start) * 1000
+        self.metrics.last_error = None
+        self.metrics.last_result = result
+        return result
+
+    async def _loop(self) -> None:
+        if self._run_at_start:
+            await self.run_once()
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.run_once()
+
+    def metrics_snapshot(self) -> dict:
+        return {
+            **asdict(self.metrics),
+            "interval_seconds": self._interval,
+            "running": self.running,
+        }
@@ -0,0 +1,9 @@
+from mercearia.domain.repositories.favorito_repository import FavoritoRepository
+
+
+class GetFavoritosVersion:
+    def __init__(self, favorito_repository: FavoritoRepository):
+        self.favorito_repository = favorito_repository
+
+    async def execute(self, user_id: str) -> tuple[int, int]:
+        return await self.favorito_repository.get_version(user_id)
@@ -0,0 +1,13 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.entities.produto import Produto
+
+
+class GetProduto:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(self, produto_id: str) -> Produto:
+        produto = await self._produto_repository.get_by_id(produto_id)
+        if produto is None:
+            raise ValueError("Produto não encontrado")
+        return produto
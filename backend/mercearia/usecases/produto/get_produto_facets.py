@@ -0,0 +1,12 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.value_objects.produto_facets import ProdutoFacets
+
+
+class GetProdutoFacets:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(
+        self, categoria: str | None = None, marca: str | None = None
+    ) -> ProdutoFacets:
+        return await self._produto_repository.facet_counts(categoria, marca)
@@ -0,0 +1,21 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.entities.produto import Produto
+from typing import List
+
+MAX_IDS = 200
+
+
+class GetProdutosByIds:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(self, produto_ids: List[str]) -> tuple[List[Produto], List[str]]:
+        """Produtos na ordem pedida (sem repetições) e os ids não encontrados."""
+        ids = list(dict.fromkeys(produto_ids))
+        if len(ids) > MAX_IDS:
+            raise ValueError(f"Informe no máximo {MAX_IDS} ids.")
+
+        found = {p.id: p for p in await self._produto_repository.get_by_ids(ids)}
+        produtos = [found[i] for i in ids if i in found]
+        missing = [i for i in ids if i not in found]
+        return produtos, missing
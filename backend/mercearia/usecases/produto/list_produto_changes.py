@@ -0,0 +1,24 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+from typing import List
+
+
+class ListProdutoChanges:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(
+        self, since: int, limit: int
+    ) -> tuple[List[ProdutoChange], int, bool]:
+        """Alterações após ``since``, a versão a pedir na próxima chamada e se
+        ainda há mais alterações pendentes."""
+        if since < 0:
+            raise ValueError("A versão deve ser maior ou igual a zero.")
+        if limit < 1:
+            raise ValueError("O limite deve ser maior que zero.")
+
+        changes = await self._produto_repository.list_changes(since, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        version = changes[-1].version if changes else since
+        return changes, version, has_more
@@ -0,0 +1,47 @@
+from decimal import Decimal
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.entities.produto import Produto
+from mercearia.domain.value_objects.produto_cursor import ProdutoCursor, SORT_FIELDS
+from typing import List
+
+
+class ListProdutos:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(
+        self,
+        limit: int,
+        sort: str = "nome",
+        after: str | None = None,
+        min_preco: Decimal | None = None,
+        max_preco: Decimal | None = None,
+        categoria: str | None = None,
+        marca: str | None = None,
+    ) -> tuple[List[Produto], str | None]:
+        """Retorna a página e o cursor da próxima (None na última página)."""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Ordenação inválida: {sort}")
+        if limit < 1:
+            raise ValueError("O limite deve ser maior que zero.")
+        if min_preco is not None and max_preco is not None and min_preco > max_preco:
+            raise ValueError("O preço mínimo não pode ser maior que o máximo.")
+        cursor = ProdutoCursor.decode(after, sort) if after else None
+
+        # Busca um item a mais só para saber se existe próxima página
+        produtos = await self._produto_repository.list_page(
+            limit + 1,
+            sort,
+            cursor,
+            min_preco=min_preco,
+            max_preco=max_preco,
+            categoria=categoria,
+            marca=marca,
+        )
+        if len(produtos) <= limit:
+            return produtos, None
+        produtos = produtos[:limit]
+        last = produtos[-1]
+        field, _ = SORT_FIELDS[sort]
+        next_cursor = ProdutoCursor(sort=sort, value=getattr(last, field), id=last.id)
+        return produtos, next_cursor.encode()
@@ -0,0 +1,14 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.entities.produto import Produto
+from typing import List
+
+
+class ListProdutosPopulares:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(self, limit: int) -> List[tuple[Produto, int]]:
+        """Produtos mais favoritados, com o total de favoritos de cada um."""
+        if limit < 1:
+            raise ValueError("O limite deve ser maior que zero.")
+        return await self._produto_repository.list_populares(limit)
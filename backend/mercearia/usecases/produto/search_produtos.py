@@ -0,0 +1,33 @@
+from mercearia.domain.repositories.produto_repository import ProdutoRepository
+from mercearia.domain.entities.produto import Produto
+from mercearia.domain.value_objects.produto_cursor import ProdutoCursor, SEARCH_SORT
+from typing import List
+
+MAX_QUERY_LENGTH = 200
+
+
+class SearchProdutos:
+    def __init__(self, produto_repository: ProdutoRepository):
+        self._produto_repository = produto_repository
+
+    async def execute(
+        self, query: str, limit: int, after: str | None = None
+    ) -> tuple[List[Produto], str | None]:
+        """Retorna a página por relevância e o cursor da próxima."""
+        query = query.strip()
+        if not query:
+            raise ValueError("Informe um termo de busca.")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(
+                f"A busca deve ter no máximo {MAX_QUERY_LENGTH} caracteres."
+            )
+        if limit < 1:
+            raise ValueError("O limite deve ser maior que zero.")
+        cursor = ProdutoCursor.decode(after, SEARCH_SORT) if after else None
+
+        results = await self._produto_repository.search(query, limit + 1, cursor)
+        produtos = [produto for produto, _ in results[:limit]]
+        if len(results) <= limit:
+            return produtos, None
+        last, rank = results[limit - 1]
+        return produtos, ProdutoCursor(SEARCH_SORT, rank, last.id).encode()
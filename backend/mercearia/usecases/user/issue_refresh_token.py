@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from mercearia.api.security import generate_refresh_token, hash_refresh_token
+from mercearia.domain.entities.refresh_token import RefreshToken
+from mercearia.domain.entities.user import User
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+
+
+class IssueRefreshToken:
+    def __init__(
+        self, refresh_token_repository: RefreshTokenRepository, expires_in: timedelta
+    ):
+        self.refresh_token_repository = refresh_token_repository
+        self.expires_in = expires_in
+
+    async def execute(self, user: User) -> str:
+        raw_token = generate_refresh_token()
+        await self.refresh_token_repository.add(
+            RefreshToken(
+                user_id=user.id,
+                token_hash=hash_refresh_token(raw_token),
+                family_id=str(uuid.uuid4()),
+                expires_at=datetime.now(timezone.utc) + self.expires_in,
+                token_version=user.token_version,
+            )
+        )
+        return raw_token
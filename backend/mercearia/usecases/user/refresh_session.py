@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+from mercearia.api.security import generate_refresh_token, hash_refresh_token
+from mercearia.domain.entities.refresh_token import RefreshToken
+from mercearia.domain.entities.user import User
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from mercearia.domain.repositories.user_repository import UserRepository
+
+
+class RefreshSession:
+    """Troca um refresh token válido por um novo (rotação), sem bcrypt."""
+
+    def __init__(
+        self,
+        refresh_token_repository: RefreshTokenRepository,
+        user_repository: UserRepository,
+        expires_in: timedelta,
+    ):
+        self.refresh_token_repository = refresh_token_repository
+        self.user_repository = user_repository
+        self.expires_in = expires_in
+
+    async def execute(self, raw_token: str) -> tuple[User, str]:
+        token = await self.refresh_token_repository.get_by_hash(
+            hash_refresh_token(raw_token)
+        )
+        if token is None:
+            raise ValueError("Refresh token inválido")
+
+        if token.is_revoked:
+            # Reuso de um token já rotacionado: possível roubo, derruba a família
+            await self.refresh_token_repository.revoke_family(token.family_id)
+            raise ValueError("Refresh token inválido")
+
+        now = datetime.now(timezone.utc)
+        if token.is_expired(now):
+            raise ValueError("Refresh token expirado")
+
+        user = await self.user_repository.get_by_id(token.user_id, fresh=True)
+        if user is None or user.token_version != token.token_version:
+            # Senha trocada depois da emissão
+            await self.refresh_token_repository.revoke_family(token.family_id)
+            raise ValueError("Refresh token inválido")
+
+        new_raw_token = generate_refresh_token()
+        rotated = await self.refresh_token_repository.rotate(
+            token,
+            RefreshToken(
+                user_id=user.id,
+                token_hash=hash_refresh_token(new_raw_token),
+                family_id=token.family_id,
+                expires_at=now + self.expires_in,
+                token_version=user.token_version,
+            ),
+        )
+        if not rotated:
+            await self.refresh_token_repository.revoke_family(token.family_id)
+            raise ValueError("Refresh token inválido")
+
+        await self.user_repository.set_current_user(user)
+        return user, new_raw_token
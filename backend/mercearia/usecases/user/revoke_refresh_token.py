@@ -0,0 +1,16 @@
+from mercearia.api.security import hash_refresh_token
+from mercearia.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+
+
+class RevokeRefreshToken:
+    def __init__(self, refresh_token_repository: RefreshTokenRepository):
+        self.refresh_token_repository = refresh_token_repository
+
+    async def execute(self, raw_token: str) -> None:
+        token = await self.refresh_token_repository.get_by_hash(
+            hash_refresh_token(raw_token)
+        )
+        if token is not None:
+            await self.refresh_token_repository.revoke_family(token.family_id)
@@ -0,0 +1,56 @@
+import pytest
+from starlette.requests import Request
+from mercearia.api.conditional import ConditionalRequest, make_etag
+from mercearia.domain.entities.favorito import Favorito
+from mercearia.infra.repositories.in_memory_favorito_repository import (
+    InMemoryFavoritoRepository,
+)
+
+
+def conditional(if_none_match: str | None = None) -> ConditionalRequest:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return ConditionalRequest(Request({"type": "http", "headers": headers}))
+
+
+def test_make_etag_is_strong_and_deterministic():
+    etag = make_etag("favoritos", "u1", 3)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("favoritos", "u1", 3)
+    assert etag != make_etag("favoritos", "u1", 4)
+
+
+@pytest.mark.parametrize(
+    "header",
+    ['"abc"', '"x", "abc"', 'W/"abc"', "*"],
+)
+def test_matches_if_none_match(header):
+    assert conditional(header).matches('"abc"')
+
+
+def test_without_header_never_matches():
+    assert not conditional().matches('"abc"')
+    assert not conditional('"outro"').matches('"abc"')
+
+
+def test_not_modified_carries_etag():
+    response = conditional('"abc"').not_modified('"abc"')
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+    assert "no-cache" in response.headers["cache-control"]
+
+
+@pytest.mark.asyncio
+async def test_favoritos_version_changes_only_on_real_changes():
+    repo = InMemoryFavoritoRepository()
+    favorito = Favorito(user_id="u1", produto_id="p1")
+
+    await repo.add(favorito)
+    await repo.add(favorito)
+    assert await repo.get_version("u1") == (1, 0)
+
+    await repo.remove(favorito)
+    await repo.remove(favorito)
+    assert await repo.get_version("u1") == (2, 0)
+    assert await repo.get_version("u2") == (0, 0)
@@ -0,0 +1,114 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import HTTPException
+from mercearia.api import deps
+from mercearia.api.principal import user_claims
+from mercearia.api.security import create_access_token
+from mercearia.api.settings import settings
+from mercearia.domain.entities.user import User
+from mercearia.domain.repositories.user_repository import UserRepository
+from mercearia.domain.value_objects.email_vo import Email
+from mercearia.domain.value_objects.password_vo import HashedPassword
+from mercearia.infra.cache.token_version_cache import token_version_cache
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        id="user1",
+        name="Miguel Ferrari",
+        email=Email("admin@merceariaferrari.com"),
+        password=HashedPassword("hash"),
+        role="admin",
+        token_version=2,
+    )
+
+
+@pytest.fixture
+def mock_user_repository(user: User) -> AsyncMock:
+    """Mock que devolve como usuário atual o que foi passado a set_current_user."""
+    repo = AsyncMock(spec=UserRepository)
+    repo.get_by_id.return_value = user
+    repo.get_token_version.return_value = user.token_version
+
+    async def set_current_user(u):
+        repo.get_current_user.return_value = u
+
+    repo.set_current_user.side_effect = set_current_user
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def clear_token_versions():
+    token_version_cache.clear()
+    yield
+    token_version_cache.clear()
+
+
+@pytest.fixture
+def claims_only(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_ONLY", True)
+
+
+@pytest.mark.asyncio
+async def test_default_mode_loads_user_from_repository(user, mock_user_repository):
+    token = create_access_token(data=user_claims(user))
+
+    current = await deps.get_current_user(token, mock_user_repository)
+
+    mock_user_repository.get_by_id.assert_called_once_with("user1")
+    assert current is user
+
+
+@pytest.mark.asyncio
+async def test_default_mode_rejects_token_revoked_on_other_worker(
+    user, mock_user_repository
+):
+    # O registro em cache ainda tem a versão 2, mas a senha já foi trocada
+    mock_user_repository.get_token_version.return_value = 3
+    token = create_access_token(data=user_claims(user))
+
+    with pytest.raises(HTTPException) as exc:
+        await deps.get_current_user(token, mock_user_repository)
+
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_claims_only_mode_skips_user_lookup(
+    claims_only, user, mock_user_repository
+):
+    mock_user_repository.get_token_version.return_value = 2
+    token = create_access_token(data=user_claims(user))
+
+    first = await deps.get_current_user(token, mock_user_repository)
+    second = await deps.get_current_user(token, mock_user_repository)
+
+    mock_user_repository.get_by_id.assert_not_called()
+    # A versão do token fica em cache entre requisições
+    mock_user_repository.get_token_version.assert_called_once_with("user1")
+    assert first.id == second.id == "user1"
+    assert first.role == "admin"
+    assert str(first.email) == "admin@merceariaferrari.com"
+
+
+@pytest.mark.asyncio
+async def test_claims_only_mode_rejects_revoked_token(
+    claims_only, user, mock_user_repository
+):
+    # A senha foi trocada: versão atual é 3, o token ainda carrega 2
+    mock_user_repository.get_token_version.return_value = 3
+    token = create_access_token(data=user_claims(user))
+
+    with pytest.raises(HTTPException) as exc:
+        await deps.get_current_user(token, mock_user_repository)
+    assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_default_mode_rejects_revoked_token(user, mock_user_repository):
+    token = create_access_token(data={**user_claims(user), "tv": 1})
+
+    with pytest.raises(HTTPException) as exc:
+        await deps.get_current_user(token, mock_user_repository)
+    assert exc.value.status_code == 401
@@ -0,0 +1,54 @@
+import json
+from mercearia.api.encoders import encode_changes, encode_favoritos, encode_produtos
+from mercearia.api.json_response import FastJSONResponse
+from mercearia.api.schemas.favorito_schema import FavoritoResponse
+from mercearia.api.schemas.produto_schema import (
+    ProdutoChangesResponse,
+    ProdutoResponse,
+)
+from mercearia.domain.entities.favorito import Favorito
+from mercearia.domain.entities.produto import Produto
+from mercearia.domain.value_objects.produto_change import ProdutoChange
+
+PRODUTOS = [
+    Produto(id="1", nome="Arroz", descricao="Tipo 1 5kg", preco=26.3, imagem="a.png"),
+    Produto(id="2", nome="Feijão", descricao="Carioca", preco=7.0, imagem="f.png"),
+]
+
+
+def test_encode_produtos_matches_pydantic_schema():
+    expected = [
+        ProdutoResponse.from_entity(p).model_dump(mode="json") for p in PRODUTOS
+    ]
+
+    assert json.loads(encode_produtos(PRODUTOS)) == expected
+
+
+def test_encode_favoritos_matches_pydantic_schema():
+    favoritos = [Favorito(user_id="u1", produto_id=p.id, produto=p) for p in PRODUTOS]
+    expected = [
+        FavoritoResponse.from_entity(f).model_dump(mode="json") for f in favoritos
+    ]
+
+    assert json.loads(encode_favoritos(favoritos)) == expected
+
+
+def test_encode_changes_matches_pydantic_schema():
+    changes = [
+        ProdutoChange(3, "1", PRODUTOS[0]),
+        ProdutoChange(4, "x", None),
+        ProdutoChange(5, "2", PRODUTOS[1]),
+    ]
+    expected = ProdutoChangesResponse(
+        version=5,
+        has_more=False,
+        produtos=[ProdutoResponse.from_entity(p) for p in PRODUTOS],
+        removidos=["x"],
+    ).model_dump(mode="json")
+
+    assert json.loads(encode_changes(changes, 5, False)) == expected
+
+
+def test_fast_json_response_passes_bytes_through():
+    assert FastJSONResponse(b"[1]").body == b"[1]"
+    assert FastJSONResponse({"a": 1}).body == b'{"a":1}'
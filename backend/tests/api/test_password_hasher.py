@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from mercearia.api.password_hasher import (
+    PasswordHasher,
+    PasswordHasherSaturatedError,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_run_in_pool():
+    hasher = PasswordHasher(max_workers=1, max_queue=4)
+    try:
+        hashed = await hasher.hash("Senha@123")
+
+        assert hashed != "Senha@123"
+        assert await hasher.verify("Senha@123", hashed) is True
+        assert await hasher.verify("Outra@123", hashed) is False
+
+        metrics = hasher.metrics_snapshot()
+        assert metrics["submitted"] == 3
+        assert metrics["completed"] == 3
+        assert metrics["rejected"] == 0
+        assert metrics["queue_depth"] == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    """Com um worker e fila zero, a segunda requisição simultânea é recusada."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    try:
+        results = await asyncio.gather(
+            hasher.hash("Senha@123"),
+            hasher.hash("Senha@456"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], PasswordHasherSaturatedError)
+        assert hasher.metrics.rejected == 1
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_measured():
+    hasher = PasswordHasher(max_workers=1, max_queue=4)
+    try:
+        await asyncio.gather(*(hasher.hash("Senha@123") for _ in range(3)))
+
+        # Os jobs 2 e 3 esperaram o primeiro terminar
+        assert hasher.metrics.queue_wait_max_ms > 0
+        assert hasher.metrics.queue_wait_total_ms >= hasher.metrics.queue_wait_max_ms
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,78 @@
+import pytest
+from mercearia.api.rate_limit import (
+    InMemoryRateLimitStore,
+    LoginThrottle,
+    RateLimitExceeded,
+    TokenBucketLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def throttle(clock) -> LoginThrottle:
+    store = InMemoryRateLimitStore(clock=clock)
+    return LoginThrottle(
+        store,
+        ip=TokenBucketLimiter(store, "ip", capacity=5, refill_per_second=1),
+        email=TokenBucketLimiter(store, "email", capacity=2, refill_per_second=0.5),
+    )
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_asks_to_wait(clock):
+    store = InMemoryRateLimitStore(clock=clock)
+
+    assert await store.take("k", capacity=2, refill_per_second=1) == 0
+    assert await store.take("k", capacity=2, refill_per_second=1) == 0
+    assert await store.take("k", capacity=2, refill_per_second=1) == pytest.approx(1)
+
+    clock.now = 1.0
+    assert await store.take("k", capacity=2, refill_per_second=1) == 0
+
+
+@pytest.mark.asyncio
+async def test_throttle_limits_per_email(throttle, clock):
+    await throttle.check("10.0.0.1", "a@b.com")
+    await throttle.check("10.0.0.2", "A@b.com")
+
+    with pytest.raises(RateLimitExceeded) as exc:
+        await throttle.check("10.0.0.3", "a@b.com")
+
+    assert exc.value.retry_after == pytest.approx(2)
+    assert throttle.metrics.throttled_email == 1
+    # Outro email segue liberado
+    await throttle.check("10.0.0.3", "c@d.com")
+
+
+@pytest.mark.asyncio
+async def test_throttle_limits_per_ip(throttle):
+    for i in range(5):
+        await throttle.check("10.0.0.1", f"user{i}@b.com")
+
+    with pytest.raises(RateLimitExceeded):
+        await throttle.check("10.0.0.1", "outro@b.com")
+
+    assert throttle.metrics.throttled_ip == 1
+    assert throttle.metrics.allowed == 5
+    assert "cpu_saved_ms_estimate" in throttle.metrics_snapshot()
+
+
+@pytest.mark.asyncio
+async def test_reset_refills_buckets(throttle):
+    await throttle.check("10.0.0.1", "a@b.com")
+    await throttle.check("10.0.0.1", "a@b.com")
+    await throttle.reset()
+
+    await throttle.check("10.0.0.1", "a@b.com")
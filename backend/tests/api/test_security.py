@@ -0,0 +1,110 @@
+import pytest
+from jose import JWTError
+from mercearia.api import security
+from mercearia.api.security import (
+    HMACTokenVerifier,
+    JoseTokenVerifier,
+    create_access_token,
+    decode_token,
+    set_token_verifier,
+    verify_token,
+)
+from mercearia.api.settings import settings
+
+
+class CountingVerifier:
+    def __init__(self):
+        self.calls = 0
+        self._inner = JoseTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM)
+
+    def decode(self, token: str) -> dict:
+        self.calls += 1
+        return self._inner.decode(token)
+
+
+@pytest.fixture
+def counting_verifier():
+    original = security._token_verifier
+    verifier = CountingVerifier()
+    set_token_verifier(verifier)
+    yield verifier
+    set_token_verifier(original)
+
+
+def test_decode_token_caches_verified_claims(counting_verifier):
+    token = create_access_token(data={"sub": "user1"})
+
+    assert decode_token(token)["sub"] == "user1"
+    assert decode_token(token)["sub"] == "user1"
+    assert counting_verifier.calls == 1
+
+
+def test_invalid_token_is_not_cached(counting_verifier):
+    assert verify_token("nao.e.token") is None
+    assert verify_token("nao.e.token") is None
+    assert counting_verifier.calls == 2
+
+
+def test_hmac_verifier_accepts_tokens_issued_by_jose():
+    token = create_access_token(data={"sub": "user1", "role": "admin"})
+    verifier = HMACTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM)
+
+    payload = verifier.decode(token)
+
+    assert payload == JoseTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM).decode(
+        token
+    )
+
+
+def test_hmac_verifier_rejects_tampered_signature():
+    token = create_access_token(data={"sub": "user1"})
+    header, payload, signature = token.split(".")
+    tampered = f"{header}.{payload}.{signature[:-2]}AA"
+
+    with pytest.raises(JWTError):
+        HMACTokenVerifier(settings.SECRET_KEY, settings.ALGORITHM).decode(tampered)
+
+
+def test_hmac_verifier_rejects_other_secret():
+    token = create_access_token(data={"sub": "user1"})
+
+    with pytest.raises(JWTError):
+        HMACTokenVerifier("outro_segredo", settings.ALGORITHM).decode(token)
+
+
+# ---------- Calibração do bcrypt ----------
+
+
+@pytest.fixture
+def fresh_pwd_context(monkeypatch):
+    from passlib.context import CryptContext
+
+    monkeypatch.setattr(
+        security, "pwd_context", CryptContext(schemes=["bcrypt"], deprecated="auto")
+    )
+    monkeypatch.setattr(security, "_bcrypt_rounds", None)
+
+
+def test_calibration_stays_within_bounds(fresh_pwd_context):
+    rounds, estimated_ms = security.calibrate_bcrypt_rounds(
+        target_ms=1, min_rounds=4, max_rounds=6, samples=1
+    )
+    assert rounds == 4
+
+    rounds, _ = security.calibrate_bcrypt_rounds(
+        target_ms=10_000, min_rounds=4, max_rounds=6, samples=1
+    )
+    assert rounds == 6
+
+
+def test_hash_with_other_cost_needs_rehash(fresh_pwd_context):
+    old_hash = security.get_password_hash("Senha@123", rounds=4)
+
+    security.configure_bcrypt_rounds(5)
+    new_hash = security.get_password_hash("Senha@123")
+
+    assert security.bcrypt_rounds() == 5
+    assert new_hash.startswith("$2b$05$")
+    assert security.password_needs_rehash(old_hash) is True
+    assert security.password_needs_rehash(new_hash) is False
+    assert security.verify_password("Senha@123", old_hash)
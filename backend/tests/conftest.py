@@ -2,6 +2,7 @@
 
 import os
 import pytest_asyncio
+import sqlalchemy as sa
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from mercearia.infra.database import Base
@@ -71,3 +72,29 @@ async def client(setup_engine):
             yield ac
 
     app.dependency_overrides.clear()
+
+
+class StatementRecorder:
+    """Coleta os SQL enviados ao banco, para testes de contagem de queries."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+
+@pytest_asyncio.fixture
+async def sql_statements(setup_engine):
+    """Registra cada statement executado no engine de teste."""
+    engine, _ = setup_engine
+    recorder = StatementRecorder()
+    sa.event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+    yield recorder
+    sa.event.remove(engine.sync_engine, "before_cursor_execute", recorder)
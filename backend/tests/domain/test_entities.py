@@ -1,4 +1,5 @@
 import pytest
+from decimal import Decimal
 from mercearia.domain.entities.user import User
 from mercearia.domain.entities.produto import Produto
 from mercearia.domain.entities.favorito import Favorito
@@ -38,10 +39,16 @@ def test_create_produto():
     assert produto.id == "10"
     assert produto.nome == "Arroz"
     assert produto.descricao == "Arroz tipo 1"
-    assert produto.preco == 5.99
+    assert produto.preco == Decimal("5.99")
     assert produto.imagem == "arroz.jpg"
 
 
+def test_produto_preco_is_exact():
+    produto = Produto(id="1", nome="Arroz", descricao="", preco=0.1, imagem="")
+
+    assert produto.preco + Decimal("0.2") == Decimal("0.3")
+
+
 # ---------- Favorito ----------
 
 
@@ -53,3 +60,24 @@ def test_create_favorito_and_compare():
     assert f1 == f2
     assert f1 != f3
     assert hash(f1) == hash(f2)
+
+
+def test_favorito_id_is_lazy_and_stable():
+    favorito = Favorito(user_id="1", produto_id="10")
+
+    assert favorito._id is None
+    assert favorito.id == favorito.id
+    assert Favorito(user_id="1", produto_id="10", id="abc").id == "abc"
+
+
+@pytest.mark.parametrize(
+    "entity",
+    [
+        Produto(id="1", nome="Arroz", descricao="", preco=1.0, imagem=""),
+        Favorito(user_id="1", produto_id="10"),
+        Email("user@example.com"),
+        Password("Senha@123"),
+    ],
+)
+def test_entities_use_slots(entity):
+    assert not hasattr(entity, "__dict__")
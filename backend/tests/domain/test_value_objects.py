@@ -1,6 +1,10 @@
 import pytest
 from mercearia.domain.value_objects.email_vo import Email
-from mercearia.domain.value_objects.password_vo import Password, PasswordValidationError
+from mercearia.domain.value_objects.password_vo import (
+    HashedPassword,
+    Password,
+    PasswordValidationError,
+)
 
 
 def test_valid_email():
@@ -35,5 +39,72 @@ def test_invalid_password_only_numbers():
 
 
 def test_password_equality():
-    assert Password("Abc@12345").verify(str(Password("Abc@12345")))
-    assert not Password("Abc@12345").verify(str(Password("Syz@98765")))
+    assert Password("Abc@12345") == Password("Abc@12345")
+    assert Password("Abc@12345") != Password("Syz@98765")
+
+
+# ---------- Contagem de bcrypt ----------
+
+
+@pytest.fixture
+def bcrypt_calls(monkeypatch):
+    """Conta as chamadas de hash/verify feitas ao passlib."""
+    from mercearia.api import security
+
+    calls = {"hash": 0, "verify": 0}
+    original_hash = security.pwd_context.hash
+    original_verify = security.pwd_context.verify
+
+    def counting_hash(*args, **kwargs):
+        calls["hash"] += 1
+        return original_hash(*args, **kwargs)
+
+    def counting_verify(*args, **kwargs):
+        calls["verify"] += 1
+        return original_verify(*args, **kwargs)
+
+    monkeypatch.setattr(security.pwd_context, "hash", counting_hash)
+    monkeypatch.setattr(security.pwd_context, "verify", counting_verify)
+    return calls
+
+
+def test_password_does_not_hash_on_construction(bcrypt_calls):
+    Password("Abc@12345")
+    assert bcrypt_calls == {"hash": 0, "verify": 0}
+
+
+def test_hashed_password_never_runs_bcrypt(bcrypt_calls):
+    stored = HashedPassword(
+        "$2b$12$abcdefghijklmnopqrstuuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0"
+    )
+    assert str(stored) == stored.value()
+    assert bcrypt_calls == {"hash": 0, "verify": 0}
+
+
+@pytest.mark.asyncio
+async def test_password_hash_is_lazy_and_cached(bcrypt_calls):
+    password = Password("Abc@12345")
+
+    first = await password.hash()
+    second = await password.hash()
+
+    assert first == second
+    assert bcrypt_calls["hash"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hashed_password_verify_uses_single_bcrypt(bcrypt_calls):
+    stored = HashedPassword(await Password("Abc@12345").hash())
+    bcrypt_calls["hash"] = 0
+
+    assert await stored.verify(Password("Abc@12345")) is True
+    assert await stored.verify(Password("Syz@98765")) is False
+    assert bcrypt_calls == {"hash": 0, "verify": 2}
+
+
+def test_password_has_no_sync_bcrypt_path(bcrypt_calls):
+    password = Password("Abc@12345")
+
+    assert not hasattr(password, "value") and not hasattr(password, "verify")
+    assert "Abc@12345" not in str(password)
+    assert bcrypt_calls == {"hash": 0, "verify": 0}
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from mercearia.infra.cache.catalog_cache import CatalogCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_loader(body: bytes, calls: list):
+    async def loader():
+        calls.append(body)
+        return body, None
+
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_load_then_hit_skips_loader():
+    cache = CatalogCache(max_entries=10, ttl_seconds=30)
+    calls: list = []
+
+    assert cache.get("k") is None
+    await cache.load("k", make_loader(b"[]", calls))
+    entry = cache.get("k")
+
+    assert entry is not None and entry.body == b"[]"
+    assert calls == [b"[]"]
+    assert cache.metrics.hits == 1
+    assert cache.metrics.misses == 1
+    assert cache.metrics.rebuilds == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_entries_and_bumps_version():
+    cache = CatalogCache(max_entries=10, ttl_seconds=30)
+    await cache.load("k", make_loader(b"[]", []))
+
+    cache.invalidate()
+
+    assert cache.version == 1
+    assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_load_racing_invalidation_is_not_stored():
+    cache = CatalogCache(max_entries=10, ttl_seconds=30)
+
+    async def loader():
+        cache.invalidate()
+        return b"velho", None
+
+    await cache.load("k", loader)
+
+    assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing():
+    clock = FakeClock()
+    cache = CatalogCache(max_entries=10, ttl_seconds=30, clock=clock)
+    await cache.load("k", make_loader(b"v1", []))
+
+    clock.now = 31
+    stale = cache.get("k")
+    assert stale is not None and cache.is_stale(stale)
+
+    calls: list = []
+    cache.refresh_in_background("k", make_loader(b"v2", calls))
+    cache.refresh_in_background("k", make_loader(b"v2", calls))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    fresh = cache.get("k")
+    assert calls == [b"v2"]
+    assert fresh is not None and fresh.body == b"v2"
+    assert cache.metrics.stale_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_entry():
+    clock = FakeClock()
+    cache = CatalogCache(max_entries=10, ttl_seconds=30, clock=clock)
+    await cache.load("k", make_loader(b"v1", []))
+
+    async def failing():
+        raise RuntimeError("banco fora")
+
+    clock.now = 31
+    cache.refresh_in_background("k", failing)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    entry = cache.get("k")
+    assert entry is not None and entry.body == b"v1"
+    assert cache.metrics.rebuild_errors == 1
@@ -0,0 +1,136 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import pytest
+from fastapi import FastAPI
+from mercearia.api.routes import imagem_route
+from mercearia.api.settings import settings
+from mercearia.infra.static import image_store as images
+from mercearia.infra.static.image_store import ImageStore, image_url
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "arroz.png").write_bytes(b"arroz" * 10)
+    (tmp_path / "grande.jpg").write_bytes(os.urandom(4096))
+    return ImageStore(tmp_path, max_file_bytes=1024, max_total_bytes=600)
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    monkeypatch.setattr(images, "image_store", store)
+    app = FastAPI()
+    app.include_router(imagem_route.router, prefix="/imagens")
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+def test_hashed_name_resolves_to_current_content(store):
+    info = store.info("arroz.png")
+    assert info is not None
+
+    resolved, versioned = store.resolve(info.hashed_name)
+
+    assert resolved == info and versioned
+    assert store.resolve("arroz.png") == (info, False)
+    assert store.resolve("arroz.000000000000.png") == (info, False)
+
+
+@pytest.mark.parametrize("nome", ["../segredo.png", ".env", "", "sub/arroz.png"])
+def test_rejects_names_outside_directory(store, nome):
+    assert store.info(nome) is None
+
+
+def test_changed_file_gets_new_digest(store, tmp_path):
+    before = store.info("arroz.png")
+    version = store.version
+    path = tmp_path / "arroz.png"
+    path.write_bytes(b"outro conteudo")
+    os.utime(path, ns=(before.mtime_ns + 10**9, before.mtime_ns + 10**9))
+
+    assert store.info("arroz.png") is not None
+    assert store.version == version + 1
+    after = store.info("arroz.png")
+
+    assert store.version == version + 1  # sem mudança, sem nova versão
+    assert after.digest != before.digest
+    assert store.resolve(before.hashed_name)[1] is False
+
+
+def test_small_files_cached_within_byte_budget(store, tmp_path):
+    info = store.info("arroz.png")
+
+    assert store.cached(info) is None
+    assert store.read_small(info) == b"arroz" * 10
+    assert store.cached(info) == b"arroz" * 10
+    assert store.read_small(info) == b"arroz" * 10
+    assert store.stats.hits == 2 and store.stats.misses == 1
+    assert store.read_small(store.info("grande.jpg")) is None
+
+    for i in range(20):
+        (tmp_path / f"p{i}.png").write_bytes(b"x" * 100)
+        store.read_small(store.info(f"p{i}.png"))
+    assert store.stats.bytes <= 600
+
+
+def test_concurrent_reads_keep_byte_accounting(store, tmp_path):
+    for i in range(20):
+        (tmp_path / f"p{i}.png").write_bytes(b"x" * (50 + i))
+    infos = [store.info(f"p{i}.png") for i in range(20)]
+
+    def worker(offset):
+        for i in range(200):
+            info = infos[(i + offset) % len(infos)]
+            store.cached(info) or store.read_small(info)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    assert store.stats.bytes == sum(len(v[1]) for v in store._contents.values())
+    assert store.stats.bytes <= 600
+
+
+def test_image_url_uses_manifest(store, monkeypatch):
+    monkeypatch.setattr(images, "image_store", store)
+    store.scan()
+
+    assert image_url("arroz.png") == (
+        f"{settings.IMAGES_URL_PREFIX}/{store.info('arroz.png').hashed_name}"
+    )
+    assert image_url("nao-existe.png") == "nao-existe.png"
+
+
+@pytest.mark.asyncio
+async def test_route_caching_headers(store, client):
+    info = store.info("arroz.png")
+    async with client:
+        versioned = await client.get(f"/imagens/{info.hashed_name}")
+        plain = await client.get("/imagens/arroz.png")
+        revalidated = await client.get(
+            "/imagens/arroz.png", headers={"If-None-Match": info.etag}
+        )
+        missing = await client.get("/imagens/nao-existe.png")
+
+    assert versioned.status_code == 200
+    assert versioned.content == b"arroz" * 10
+    assert versioned.headers["cache-control"] == imagem_route.IMMUTABLE
+    assert versioned.headers["etag"] == info.etag
+    assert plain.headers["cache-control"] == imagem_route.REVALIDATE
+    assert revalidated.status_code == 304
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_route_range_and_large_files_from_disk(store, client, tmp_path):
+    content = (tmp_path / "grande.jpg").read_bytes()
+    async with client:
+        full = await client.get("/imagens/grande.jpg")
+        partial = await client.get(
+            "/imagens/grande.jpg", headers={"Range": "bytes=0-99"}
+        )
+
+    assert full.content == content
+    assert full.headers["etag"] == store.info("grande.jpg").etag
+    assert partial.status_code == 206
+    assert partial.content == content[:100]
@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy.orm import configure_mappers
+from mercearia.domain.entities.user import User
+from mercearia.domain.value_objects.email_vo import Email
+from mercearia.domain.value_objects.password_vo import HashedPassword, Password
+from mercearia.infra.database import Base
+from mercearia.infra.models.favoritos_model import FavoritoModel  # noqa: F401
+from mercearia.infra.models.produto_model import ProdutoModel  # noqa: F401
+from mercearia.infra.models.user_model import UserModel
+
+
+def test_relationships_never_load_implicitly():
+    configure_mappers()
+    lazy = {
+        f"{mapper.class_.__name__}.{rel.key}": rel.lazy
+        for mapper in Base.registry.mappers
+        for rel in mapper.relationships
+    }
+
+    assert lazy
+    assert all(strategy == "raise" for strategy in lazy.values()), lazy
+
+
+def test_user_model_rejects_candidate_password():
+    user = User("1", "Ana", Email("ana@example.com"), Password("Abc@12345"), "user")
+
+    with pytest.raises(TypeError):
+        UserModel.from_entity(user)
+
+    user.password = HashedPassword("$2b$12$hash")
+    assert UserModel.from_entity(user).password == "$2b$12$hash"
@@ -0,0 +1,43 @@
+import asyncio
+import pytest
+from mercearia.infra.tasks.periodic_task import PeriodicTask
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_and_loop_continues():
+    calls: list[int] = []
+
+    async def job():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("falhou")
+        return len(calls)
+
+    task = PeriodicTask("teste", interval_seconds=0.01, job=job, run_at_start=True)
+    task.start()
+    while len(calls) < 3:
+        await asyncio.sleep(0.01)
+    await task.stop()
+
+    assert not task.running
+    assert task.metrics.failures == 1
+    assert task.metrics.runs >= 3
+    assert task.metrics.last_error is None
+    assert task.metrics.last_result >= 3
+
+
+@pytest.mark.asyncio
+async def test_run_once_records_error():
+    async def job():
+        raise ValueError("sem banco")
+
+    task = PeriodicTask("teste", interval_seconds=60, job=job)
+
+    assert await task.run_once() is None
+    assert task.metrics.last_error == "ValueError: sem banco"
+    await task.stop()
+
+
+def test_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        PeriodicTask("teste", interval_seconds=0, job=lambda: None)  # type: ignore
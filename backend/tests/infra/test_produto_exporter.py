@@ -0,0 +1,62 @@
+import csv
+import gzip
+import io
+import orjson
+import pytest
+from decimal import Decimal
+from mercearia.infra.exporters.produto_exporter import (
+    EXPORT_COLUMNS,
+    encode_csv,
+    encode_ndjson,
+    gzip_chunks,
+)
+from mercearia.infra.importers.produto_importer import iter_records, validate_record
+
+ROWS = [
+    ("p1", "Arroz", "Tipo 1, 5kg", Decimal("26.30"), "arroz.png", "Grãos", "Tio João"),
+    ("p2", 'Feijão "Carioca"', "", Decimal("7.00"), "feijao.png", None, None),
+]
+
+
+@pytest.mark.parametrize(
+    "format, encode",
+    [("ndjson", encode_ndjson), ("csv", encode_csv)],
+)
+def test_exported_rows_round_trip_through_importer(format, encode):
+    header = encode_csv([EXPORT_COLUMNS]) if format == "csv" else b""
+    data = header + encode(ROWS)
+
+    records = [validate_record(r) for _, r in iter_records(io.BytesIO(data), format)]
+
+    assert records == [
+        ("p1", "Arroz", "Tipo 1, 5kg", Decimal("26.30"), "arroz.png")
+        + ("graos", "Grãos", "tio-joao", "Tio João"),
+        ("p2", 'Feijão "Carioca"', "", Decimal("7.00"), "feijao.png")
+        + (None, None, None, None),
+    ]
+
+
+def test_ndjson_has_one_object_per_line():
+    lines = encode_ndjson(ROWS).splitlines()
+
+    assert [orjson.loads(line)["preco"] for line in lines] == [26.3, 7.0]
+
+
+def test_csv_quotes_separators():
+    rows = list(csv.reader(io.StringIO(encode_csv(ROWS).decode())))
+
+    assert rows[0][2] == "Tipo 1, 5kg"
+    assert rows[1][1] == 'Feijão "Carioca"'
+
+
+@pytest.mark.asyncio
+async def test_gzip_chunks_produce_single_stream():
+    async def chunks():
+        for i in range(100):
+            yield f"linha {i}\n".encode()
+
+    body = b"".join([chunk async for chunk in gzip_chunks(chunks())])
+
+    assert gzip.decompress(body) == b"".join(
+        f"linha {i}\n".encode() for i in range(100)
+    )
@@ -0,0 +1,95 @@
+import io
+import pytest
+from decimal import Decimal
+from mercearia.infra.importers.produto_importer import (
+    ImportReport,
+    ProdutoImporter,
+    iter_records,
+    parse_preco,
+    validate_record,
+)
+
+
+def read_all(data: bytes, format: str, batch_size: int = 2):
+    importer = ProdutoImporter(session=None, batch_size=batch_size, max_errors=2)  # type: ignore[arg-type]
+    report = ImportReport()
+    records = iter_records(io.BytesIO(data), format)
+    batches = []
+    while batch := importer._read_batch(records, report):
+        batches.append(batch)
+    return batches, report
+
+
+def test_csv_is_read_in_bounded_batches():
+    data = "id,nome,descricao,preco,imagem\n" + "".join(
+        f"p{i},Produto {i},,{i + 1}.50,p{i}.png\n" for i in range(5)
+    )
+
+    batches, report = read_all(data.encode(), "csv")
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert batches[0][0][:6] == (1, "p0", "Produto 0", "", Decimal("1.50"), "p0.png")
+    assert report.rows_read == report.rows_valid == 5
+
+
+def test_invalid_rows_are_reported_with_line_numbers():
+    data = (
+        b'{"id": "a", "nome": "Arroz", "preco": "5.99"}\n'
+        b"nao-e-json\n"
+        b'{"id": "b", "nome": "", "preco": 1}\n'
+        b"\n"
+        b'{"id": "c", "nome": "Cafe", "preco": "-1"}\n'
+    )
+
+    batches, report = read_all(data, "ndjson")
+
+    assert [row[1] for batch in batches for row in batch] == ["a"]
+    assert report.error_count == 3
+    # Só os primeiros max_errors são guardados
+    assert [e.line for e in report.errors] == [2, 3]
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "1.999", "abc", "NaN"])
+def test_parse_preco_rejects_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_preco(value)
+
+
+def test_parse_preco_accepts_comma_decimal_separator():
+    assert parse_preco("7,71") == Decimal("7.71")
+
+
+def test_validate_record_fills_optional_fields():
+    assert validate_record({"id": " x ", "nome": "Sal", "preco": 2}) == (
+        "x",
+        "Sal",
+        "",
+        Decimal("2"),
+        "",
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+def test_validate_record_slugs_categoria_and_marca():
+    record = {
+        "id": "x",
+        "nome": "Cerveja",
+        "preco": "5.99",
+        "categoria": " Bebidas Alcoólicas ",
+        "marca": "Brahma",
+    }
+
+    assert validate_record(record)[5:] == (
+        "bebidas-alcoolicas",
+        "Bebidas Alcoólicas",
+        "brahma",
+        "Brahma",
+    )
+
+
+def test_validate_record_rejects_categoria_without_letters():
+    with pytest.raises(ValueError):
+        validate_record({"id": "x", "nome": "Sal", "preco": 1, "categoria": "!!!"})
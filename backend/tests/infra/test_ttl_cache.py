@@ -0,0 +1,63 @@
+from mercearia.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_and_set_count_hits_and_misses():
+    cache: TTLCache[str, int] = TTLCache(max_size=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_explicit_expiration_overrides_default_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.set("a", 1, expires_at=2.0)
+
+    clock.now = 2.0
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" passa a ser o menos usado
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_removes_entry():
+    cache: TTLCache[str, int] = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+    assert cache.stats.invalidations == 1
@@ -0,0 +1,55 @@
+from mercearia.infra.cache.user_cache import UserCache, UserInvalidation, UserRecord
+
+
+def make_record(**overrides) -> UserRecord:
+    data = dict(
+        id="1",
+        name="Miguel Ferrari",
+        email="admin@merceariaferrari.com",
+        password="hash",
+        role="admin",
+        token_version=0,
+    )
+    data.update(overrides)
+    return UserRecord(**data)
+
+
+def test_record_is_reachable_by_id_and_email():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    record = make_record()
+    cache.put(record)
+
+    assert cache.get_by_id("1") is record
+    assert cache.get_by_email("admin@merceariaferrari.com") is record
+
+
+def test_invalidate_by_email_also_drops_id_entry():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    cache.put(make_record())
+
+    cache.invalidate(email="admin@merceariaferrari.com")
+
+    assert cache.get_by_id("1") is None
+    assert cache.get_by_email("admin@merceariaferrari.com") is None
+
+
+def test_invalidation_is_published_to_listeners():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    received: list[UserInvalidation] = []
+    cache.add_invalidation_listener(received.append)
+
+    cache.invalidate(user_id="1", email="admin@merceariaferrari.com")
+    # Invalidação vinda de outro worker não é republicada
+    cache.invalidate(user_id="2", propagate=False)
+
+    assert received == [
+        UserInvalidation(user_id="1", email="admin@merceariaferrari.com")
+    ]
+
+
+def test_record_to_entity_does_not_rehash_password():
+    user = make_record().to_entity()
+
+    assert user.id == "1"
+    assert user.password is not None
+    assert user.password.value() == "hash"
@@ -1,6 +1,9 @@
 import pytest
 from httpx import AsyncClient
 import json
+import sqlalchemy as sa
+from mercearia.infra.models.produto_model import ProdutoModel
+from mercearia.infra.tasks.favoritos_count import reconcile_favoritos_count
 
 
 @pytest.mark.asyncio
@@ -48,3 +51,87 @@ async def test_adicionar_listar_remover_favorito(client: AsyncClient):
     list_after = await client.get("/favoritos/", headers=headers)
     assert list_after.status_code == 200
     assert all(f["produto"]["id"] != produto_id for f in list_after.json())
+
+
+@pytest.mark.asyncio
+async def test_listar_favoritos_etag_muda_com_alteracao(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    etag = (await client.get("/favoritos/", headers=headers)).headers["ETag"]
+    cached = await client.get("/favoritos/", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    produto_id = (await client.get("/produtos/", headers=headers)).json()[0]["id"]
+    await client.post("/favoritos/", json={"produto_id": produto_id}, headers=headers)
+
+    changed = await client.get(
+        "/favoritos/", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_etag_dos_favoritos_muda_com_o_produto(client: AsyncClient, db_session):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    produto_id = (await client.get("/produtos/", headers=headers)).json()[0]["id"]
+    await client.post("/favoritos/", json={"produto_id": produto_id}, headers=headers)
+    etag = (await client.get("/favoritos/", headers=headers)).headers["ETag"]
+
+    # UPDATE direto no banco: favoritos_version do usuário não muda
+    await db_session.execute(
+        sa.update(ProdutoModel)
+        .where(ProdutoModel.id == produto_id)
+        .values(preco=123.45)
+    )
+    await db_session.commit()
+
+    changed = await client.get(
+        "/favoritos/", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["produto"]["preco"] == 123.45
+
+
+@pytest.mark.asyncio
+async def test_populares_acompanha_favoritos(client: AsyncClient, db_session):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    produto_id = (await client.get("/produtos/", headers=headers)).json()[0]["id"]
+
+    assert (await client.get("/produtos/populares", headers=headers)).json() == []
+
+    await client.post("/favoritos/", json={"produto_id": produto_id}, headers=headers)
+    populares = (await client.get("/produtos/populares", headers=headers)).json()
+    assert [(p["id"], p["favoritos"]) for p in populares] == [(produto_id, 1)]
+
+    # Contador divergente (escrita fora do repositório) volta ao COUNT(*) real
+    await db_session.execute(
+        sa.update(ProdutoModel).values(favoritos_count=ProdutoModel.favoritos_count + 5)
+    )
+    await db_session.commit()
+    assert await reconcile_favoritos_count(db_session) > 0
+    # Contadores já corretos não são regravados
+    assert await reconcile_favoritos_count(db_session) == 0
+    populares = (await client.get("/produtos/populares", headers=headers)).json()
+    assert [(p["id"], p["favoritos"]) for p in populares] == [(produto_id, 1)]
+
+    await client.request(
+        "DELETE",
+        "/favoritos/",
+        headers={**headers, "Content-Type": "application/json"},
+        content=json.dumps({"produto_id": produto_id}),
+    )
+    assert (await client.get("/produtos/populares", headers=headers)).json() == []
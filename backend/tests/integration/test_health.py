@@ -0,0 +1,56 @@
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+from mercearia.api.routes.produto_route import DEFAULT_PAGE
+from mercearia.api.settings import Settings, settings
+from mercearia.api.warmup import readiness, warm_up, warm_up_retry_task
+from mercearia.infra.cache.catalog_cache import catalog_cache
+
+
+@pytest.mark.asyncio
+async def test_ready_after_warm_up(client: AsyncClient):
+    live = await client.get("/health/live")
+    ready = await client.get("/health/ready")
+
+    assert live.status_code == 200
+    assert ready.status_code == 200
+    assert ready.json()["catalog"] is True
+    assert ready.json()["pool_connections"] > 0
+    # Página padrão já no cache antes do primeiro GET /produtos
+    assert catalog_cache.get(DEFAULT_PAGE) is not None
+
+
+@pytest.mark.asyncio
+async def test_not_ready_returns_503(client: AsyncClient):
+    readiness.mark_not_ready()
+    try:
+        response = await client.get("/health/ready")
+    finally:
+        readiness.mark_ready()
+
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+
+@pytest.mark.asyncio
+async def test_retry_recovers_readiness_without_catalog_refresh(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(settings, "CATALOG_REFRESH_SECONDS", 0)
+    monkeypatch.setattr(settings, "WARMUP_TIMEOUT_SECONDS", 0)
+    # Boot com o banco fora do ar: o aquecimento estoura o timeout
+    readiness.mark_not_ready()
+    await warm_up()
+    assert (await client.get("/health/ready")).status_code == 503
+
+    monkeypatch.setattr(settings, "WARMUP_TIMEOUT_SECONDS", 30)
+    await warm_up_retry_task.run_once()
+
+    assert (await client.get("/health/ready")).status_code == 200
+
+
+def test_catalog_refresh_must_be_below_cache_ttl():
+    with pytest.raises(ValidationError):
+        Settings(CATALOG_REFRESH_SECONDS=60, CATALOG_CACHE_TTL_SECONDS=30)
+
+    assert Settings(CATALOG_REFRESH_SECONDS=0).CATALOG_REFRESH_SECONDS == 0
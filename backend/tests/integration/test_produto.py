@@ -1,5 +1,9 @@
 import pytest
+import json
+import sqlalchemy as sa
 from httpx import AsyncClient
+from mercearia.infra.models.categoria_model import CategoriaModel
+from mercearia.infra.models.produto_model import ProdutoModel
 
 
 @pytest.mark.asyncio
@@ -38,3 +42,413 @@ async def test_listar_produtos_unauthenticated(client: AsyncClient):
     assert response.status_code == 403
     assert "detail" in response.json()
     assert response.json()["detail"] == "Not authenticated"
+
+
+@pytest.mark.asyncio
+async def test_listar_produtos_paginado(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    todos = (await client.get("/produtos/", headers=headers)).json()
+
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"after": cursor} if cursor else {})}
+        response = await client.get("/produtos/", headers=headers, params=params)
+        assert response.status_code == 200
+        ids.extend(p["id"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert ids == [p["id"] for p in todos]
+
+    invalido = await client.get(
+        "/produtos/", headers=headers, params={"after": "invalido"}
+    )
+    assert invalido.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_listar_produtos_etag(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    first = await client.get("/produtos/", headers=headers)
+    etag = first.headers["ETag"]
+
+    cached = await client.get("/produtos/", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_buscar_produtos(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    response = await client.get(
+        "/produtos/search", headers=headers, params={"q": "cervejas"}
+    )
+    assert response.status_code == 200
+    nomes = {p["nome"] for p in response.json()}
+    assert nomes == {"Latão Brahma Chopp 473ml", "Long Neck Heineken 330ml"}
+
+    response = await client.get(
+        "/produtos/search", headers=headers, params={"q": "feijão carioca"}
+    )
+    assert [p["nome"] for p in response.json()] == ["Feijão Camil 1kg"]
+
+
+@pytest.mark.asyncio
+async def test_obter_produtos_por_id(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    ids = [p["id"] for p in (await client.get("/produtos/", headers=headers)).json()]
+
+    one = await client.get(f"/produtos/{ids[2]}", headers=headers)
+    assert one.status_code == 200
+    assert one.json()["id"] == ids[2]
+    assert (
+        await client.get("/produtos/nao-existe", headers=headers)
+    ).status_code == 404
+
+    batch = await client.post(
+        "/produtos/batch",
+        json={"ids": [ids[3], "nao-existe", ids[0]]},
+        headers=headers,
+    )
+    assert batch.status_code == 200
+    assert [p["id"] for p in batch.json()["produtos"]] == [ids[3], ids[0]]
+    assert batch.json()["missing"] == ["nao-existe"]
+
+
+@pytest.mark.asyncio
+async def test_listar_produtos_por_faixa_de_preco(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    precos, cursor = [], None
+    while True:
+        params = {
+            "limit": 2,
+            "ordenar": "preco_desc",
+            "min_preco": "5.99",
+            "max_preco": "7.71",
+            **({"after": cursor} if cursor else {}),
+        }
+        response = await client.get("/produtos/", headers=headers, params=params)
+        assert response.status_code == 200
+        precos.extend(p["preco"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert precos == [7.71, 7.0, 7.0, 6.99, 5.99]
+
+
+@pytest.mark.asyncio
+async def test_importar_produtos(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    antes = len((await client.get("/produtos/", headers=headers)).json())
+
+    csv = (
+        "id,nome,descricao,preco,imagem\n"
+        "sku-1,Sal Cisne 1kg,Sal refinado,3.49,sal.png\n"
+        "sku-2,Açúcar União 1kg,Açúcar refinado,4.99,acucar.png\n"
+        "sku-3,,Sem nome,1.00,x.png\n"
+        "sku-1,Sal Cisne 1kg,Sal refinado iodado,3.59,sal.png\n"
+    )
+    response = await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("catalogo.csv", csv.encode(), "text/csv")},
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["error_count"] == 1
+    assert report["errors"][0]["line"] == 4
+    assert report["cache_invalidated"] is True
+
+    produtos = (await client.get("/produtos/", headers=headers)).json()
+    assert len(produtos) == antes + 2
+    sal = next(p for p in produtos if p["id"] == "sku-1")
+    assert sal["preco"] == 3.59
+
+    # Reimportar o mesmo arquivo não altera nada
+    again = await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("catalogo.csv", csv.encode(), "text/csv")},
+    )
+    assert again.json()["inserted"] == again.json()["updated"] == 0
+    assert again.json()["cache_invalidated"] is False
+
+
+@pytest.mark.asyncio
+async def test_importar_produtos_exige_admin(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "jucelinofreitas@gmail.com", "password": "Juce@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    response = await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("catalogo.csv", b"id,nome,preco\n", "text/csv")},
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_exportar_produtos(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    produtos = (await client.get("/produtos/", headers=headers)).json()
+
+    # httpx pede gzip por padrão e descomprime a resposta
+    ndjson = await client.get("/produtos/export", headers=headers)
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-encoding"] == "gzip"
+    linhas = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert sorted(p["id"] for p in linhas) == sorted(p["id"] for p in produtos)
+
+    csv = await client.get(
+        "/produtos/export",
+        headers={**headers, "Accept-Encoding": "identity"},
+        params={"formato": "csv"},
+    )
+    assert "content-encoding" not in csv.headers
+    assert csv.text.startswith("id,nome,descricao,preco,imagem,categoria,marca\n")
+
+    # O export é reimportável sem alterar nada
+    reimport = await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("produtos.csv", csv.content, "text/csv")},
+    )
+    assert reimport.json()["rows_read"] == len(produtos)
+    assert reimport.json()["error_count"] == 0
+    assert reimport.json()["inserted"] == reimport.json()["updated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_exportar_produtos_exige_admin(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "jucelinofreitas@gmail.com", "password": "Juce@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    response = await client.get("/produtos/export", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_alteracoes_do_catalogo(client: AsyncClient, db_session):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    inicial = (await client.get("/produtos/changes", headers=headers)).json()
+    assert inicial["has_more"] is False
+    assert inicial["removidos"] == []
+    produtos = inicial["produtos"]
+    version = inicial["version"]
+
+    # Paginação por versão cobre o catálogo inteiro
+    ids, since = [], 0
+    while True:
+        page = (
+            await client.get(
+                "/produtos/changes",
+                headers=headers,
+                params={"since": since, "limit": 2},
+            )
+        ).json()
+        ids.extend(p["id"] for p in page["produtos"])
+        since = page["version"]
+        if not page["has_more"]:
+            break
+    assert ids == [p["id"] for p in produtos]
+
+    # Favoritar não altera o catálogo
+    await client.post(
+        "/favoritos/", json={"produto_id": produtos[0]["id"]}, headers=headers
+    )
+    vazio = (
+        await client.get(
+            "/produtos/changes", headers=headers, params={"since": version}
+        )
+    ).json()
+    assert vazio == {
+        "version": version,
+        "has_more": False,
+        "produtos": [],
+        "removidos": [],
+    }
+
+    # Alteração pelo importador e remoção direta no banco
+    alterado, removido = produtos[1], produtos[2]
+    csv = (
+        "id,nome,descricao,preco,imagem\n"
+        f"{alterado['id']},{alterado['nome']},Nova descrição,"
+        f"{alterado['preco']},{alterado['imagem']}\n"
+    )
+    await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("catalogo.csv", csv.encode(), "text/csv")},
+    )
+    await db_session.execute(
+        sa.delete(ProdutoModel).where(ProdutoModel.id == removido["id"])
+    )
+    await db_session.commit()
+
+    delta = (
+        await client.get(
+            "/produtos/changes", headers=headers, params={"since": version}
+        )
+    ).json()
+    assert [p["id"] for p in delta["produtos"]] == [alterado["id"]]
+    assert delta["produtos"][0]["descricao"] == "Nova descrição"
+    assert delta["removidos"] == [removido["id"]]
+    assert delta["version"] > version
+
+
+@pytest.mark.asyncio
+async def test_filtros_e_facetas_por_categoria_e_marca(client: AsyncClient, db_session):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    csv = (
+        "id,nome,descricao,preco,imagem,categoria,marca\n"
+        "c-1,Cerveja A,,5.00,a.png,Bebidas,Brahma\n"
+        "c-2,Cerveja B,,6.00,b.png,Bebidas,Heineken\n"
+        "c-3,Arroz,,20.00,c.png,Grãos,Camil\n"
+        "c-4,Feijão,,8.00,d.png,Grãos,Camil\n"
+    )
+    response = await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={"arquivo": ("catalogo.csv", csv.encode(), "text/csv")},
+    )
+    assert response.json()["inserted"] == 4
+
+    async def facetas(**params):
+        body = (
+            await client.get("/produtos/facets", headers=headers, params=params)
+        ).json()
+        return (
+            {c["id"]: c["total"] for c in body["categorias"]},
+            {m["id"]: m["total"] for m in body["marcas"]},
+        )
+
+    assert await facetas() == (
+        {"bebidas": 2, "graos": 2},
+        {"brahma": 1, "heineken": 1, "camil": 2},
+    )
+    assert await facetas(categoria="graos") == (
+        {"bebidas": 2, "graos": 2},
+        {"camil": 2},
+    )
+
+    filtrados = await client.get(
+        "/produtos/", headers=headers, params={"categoria": "bebidas"}
+    )
+    assert [p["id"] for p in filtrados.json()] == ["c-1", "c-2"]
+
+    # Reimportar com outra marca e remover um produto atualizam o agregado
+    await client.post(
+        "/produtos/import",
+        headers=headers,
+        files={
+            "arquivo": (
+                "catalogo.csv",
+                b"id,nome,descricao,preco,imagem,marca\n"
+                b"c-2,Cerveja B,,6.00,b.png,Brahma\n",
+                "text/csv",
+            )
+        },
+    )
+    await db_session.execute(sa.delete(ProdutoModel).where(ProdutoModel.id == "c-4"))
+    await db_session.commit()
+
+    assert await facetas(categoria="bebidas") == (
+        {"bebidas": 2, "graos": 1},
+        {"brahma": 2},
+    )
+
+
+@pytest.mark.asyncio
+async def test_mudanca_de_categoria_e_marca_gera_alteracao(
+    client: AsyncClient, db_session
+):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    async def importar(csv: str):
+        await client.post(
+            "/produtos/import",
+            headers=headers,
+            files={"arquivo": ("catalogo.csv", csv.encode(), "text/csv")},
+        )
+
+    await importar(
+        "id,nome,descricao,preco,imagem,categoria,marca\n"
+        "c-1,Cerveja,,5.00,a.png,Bebidas,Brahma\n"
+        "c-2,Arroz,,20.00,c.png,Grãos,Camil\n"
+    )
+    version = (await client.get("/produtos/changes", headers=headers)).json()["version"]
+
+    # Só a marca muda; e remover a categoria zera categoria_id (SET NULL)
+    await importar(
+        "id,nome,descricao,preco,imagem,marca\nc-1,Cerveja,,5.00,a.png,Skol\n"
+    )
+    await db_session.execute(
+        sa.delete(CategoriaModel).where(CategoriaModel.id == "graos")
+    )
+    await db_session.commit()
+
+    delta = (
+        await client.get(
+            "/produtos/changes", headers=headers, params={"since": version}
+        )
+    ).json()
+    assert [(p["id"], p["categoria_id"], p["marca_id"]) for p in delta["produtos"]] == [
+        ("c-1", "bebidas", "skol"),
+        ("c-2", None, "camil"),
+    ]
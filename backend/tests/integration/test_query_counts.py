@@ -0,0 +1,119 @@
+import json
+import pytest
+from httpx import AsyncClient
+from mercearia.infra.repositories.sqlalchemy.sqlalchemy_favorito_repository import (
+    SQLAlchemyFavoritoRepository,
+)
+from mercearia.infra.repositories.sqlalchemy.sqlalchemy_produto_repository import (
+    SQLAlchemyProdutoRepository,
+)
+
+# Número exato de statements SQL por endpoint. Relacionamentos usam
+# lazy="raise"; se um destes números subir, alguma query passou a carregar
+# (ou a buscar um a um) dados que o endpoint não usa.
+
+
+async def login(client: AsyncClient) -> dict:
+    response = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_login_queries(client: AsyncClient, sql_statements):
+    sql_statements.clear()
+    await login(client)
+
+    # SELECT do usuário + INSERT do refresh token
+    assert len(sql_statements) == 2, sql_statements.statements
+
+
+@pytest.mark.asyncio
+async def test_listar_produtos_queries(client: AsyncClient, sql_statements):
+    headers = await login(client)
+
+    # Página padrão aquecida no startup: nenhuma query já na primeira chamada
+    sql_statements.clear()
+    await client.get("/produtos/", headers=headers)
+    assert len(sql_statements) == 0, sql_statements.statements
+
+    sql_statements.clear()
+    await client.get("/produtos/?limit=2", headers=headers)
+    assert len(sql_statements) == 1, sql_statements.statements
+
+    # Segunda chamada sai do cache do catálogo
+    sql_statements.clear()
+    await client.get("/produtos/?limit=2", headers=headers)
+    assert len(sql_statements) == 0, sql_statements.statements
+
+
+@pytest.mark.asyncio
+async def test_favoritos_queries(client: AsyncClient, sql_statements):
+    headers = await login(client)
+    produtos = (await client.get("/produtos/", headers=headers)).json()
+    for produto in produtos[:3]:
+        await client.post(
+            "/favoritos/", json={"produto_id": produto["id"]}, headers=headers
+        )
+
+    # Usuário vem do cache; versão dos favoritos + favoritos com produtos
+    sql_statements.clear()
+    response = await client.get("/favoritos/", headers=headers)
+    assert len(response.json()) == 3
+    assert len(sql_statements) == 2, sql_statements.statements
+
+    sql_statements.clear()
+    await client.get(
+        "/favoritos/", headers={**headers, "If-None-Match": response.headers["ETag"]}
+    )
+    assert len(sql_statements) == 1, sql_statements.statements
+
+    # exists + INSERT + incremento da versão + contador do produto
+    sql_statements.clear()
+    await client.post(
+        "/favoritos/", json={"produto_id": produtos[3]["id"]}, headers=headers
+    )
+    assert len(sql_statements) == 4, sql_statements.statements
+
+    # exists + DELETE ... RETURNING + incremento da versão + contador do produto
+    sql_statements.clear()
+    await client.request(
+        "DELETE",
+        "/favoritos/",
+        headers={**headers, "Content-Type": "application/json"},
+        content=json.dumps({"produto_id": produtos[3]["id"]}),
+    )
+    assert len(sql_statements) == 4, sql_statements.statements
+
+
+@pytest.mark.asyncio
+async def test_batch_produtos_queries(client: AsyncClient, sql_statements):
+    headers = await login(client)
+    ids = [p["id"] for p in (await client.get("/produtos/", headers=headers)).json()]
+
+    sql_statements.clear()
+    await client.post("/produtos/batch", json={"ids": ids}, headers=headers)
+    assert len(sql_statements) == 1, sql_statements.statements
+
+
+@pytest.mark.asyncio
+async def test_listagens_nao_populam_identity_map(client: AsyncClient, db_session):
+    headers = await login(client)
+    produtos = (await client.get("/produtos/", headers=headers)).json()
+    await client.post(
+        "/favoritos/", json={"produto_id": produtos[0]["id"]}, headers=headers
+    )
+    user_id = (await client.get("/favoritos/", headers=headers)).json()[0]["id"]
+
+    produto_repo = SQLAlchemyProdutoRepository(db_session)
+    favorito_repo = SQLAlchemyFavoritoRepository(db_session)
+    assert len(await produto_repo.get_all()) == len(produtos)
+    await produto_repo.list_page(limit=3)
+    await produto_repo.get_by_ids([p["id"] for p in produtos])
+    favoritos = await favorito_repo.list_by_user(user_id)
+
+    assert favoritos[0].produto.id == produtos[0]["id"]
+    assert len(db_session.identity_map) == 0
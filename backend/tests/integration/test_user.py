@@ -1,5 +1,8 @@
 import pytest
+import sqlalchemy as sa
 from httpx import AsyncClient
+from mercearia.api.password_hasher import password_hasher
+from mercearia.infra.models.user_model import UserModel
 
 
 @pytest.mark.asyncio
@@ -47,3 +50,54 @@ async def test_login_user_with_wrong_password(client: AsyncClient):
         "Senha inválida",
         "Usuário ou senha incorretos",
     ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_renews_session_and_rotates(client: AsyncClient):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    assert login.status_code == 200
+    refresh_token = login.json()["refresh_token"]
+    assert refresh_token
+
+    renewed = await client.post("/user/refresh", json={"refresh_token": refresh_token})
+    assert renewed.status_code == 200, renewed.text
+    data = renewed.json()
+    assert data["access_token"]
+    assert data["refresh_token"] != refresh_token
+    assert data["user"]["email"] == "admin@merceariaferrari.com"
+
+    # O token antigo já foi rotacionado e não pode ser reutilizado
+    reused = await client.post("/user/refresh", json={"refresh_token": refresh_token})
+    assert reused.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_password_changed_on_other_worker_revokes_sessions(
+    client: AsyncClient, db_session
+):
+    login = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    refresh_token = login.json()["refresh_token"]
+
+    # Outro worker troca a senha: o cache de usuários deste não é invalidado
+    new_hash = await password_hasher.hash("Nova@1234")
+    await db_session.execute(
+        sa.update(UserModel)
+        .where(UserModel.email == "admin@merceariaferrari.com")
+        .values(password=new_hash, token_version=UserModel.token_version + 1)
+    )
+    await db_session.commit()
+
+    old_password = await client.post(
+        "/user/login",
+        json={"email": "admin@merceariaferrari.com", "password": "Admin@123"},
+    )
+    refresh = await client.post("/user/refresh", json={"refresh_token": refresh_token})
+
+    assert old_password.status_code == 401
+    assert refresh.status_code == 401
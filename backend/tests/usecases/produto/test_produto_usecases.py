@@ -1,4 +1,5 @@
 import pytest
+from decimal import Decimal
 from unittest.mock import AsyncMock
 
 # Importe a classe do caso de uso
@@ -6,6 +7,17 @@ from mercearia.usecases.produto.get_all_produtos import (
     GetAllProdutos,
 )  # Ajustado o path
 
+from mercearia.usecases.produto.list_produtos import ListProdutos
+from mercearia.usecases.produto.search_produtos import SearchProdutos
+from mercearia.usecases.produto.get_produto import GetProduto
+from mercearia.usecases.produto.get_produtos_by_ids import GetProdutosByIds
+from mercearia.usecases.produto.list_produtos_populares import ListProdutosPopulares
+from mercearia.usecases.produto.list_produto_changes import ListProdutoChanges
+from mercearia.usecases.produto.get_produto_facets import GetProdutoFacets
+from mercearia.infra.repositories.in_memory_produto_repository import (
+    InMemoryProdutoRepository,
+)
+
 # Importe a entidade Produto
 from mercearia.domain.entities.produto import Produto
 
@@ -108,3 +120,291 @@ class TestGetAllProdutos:
         mock_produto_repository.get_all.assert_called_once()
         assert produtos == []
         assert len(produtos) == 0
+
+
+class TestListProdutos:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort", ["nome", "preco", "id"])
+    async def test_pages_cover_catalog_without_gaps(self, sort: str):
+        repo = InMemoryProdutoRepository()
+        usecase = ListProdutos(repo)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await usecase.execute(limit=3, sort=sort, after=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        expected = sorted(await repo.get_all(), key=lambda p: (getattr(p, sort), p.id))
+        assert [p.id for p in seen] == [p.id for p in expected]
+
+    @pytest.mark.asyncio
+    async def test_nome_pages_in_linguistic_order(self):
+        repo = InMemoryProdutoRepository()
+        produtos = await repo.get_all()
+        for id, nome in [("5", "Água"), ("6", "açúcar"), ("7", "Zebra")]:
+            produtos.append(
+                Produto(id=id, nome=nome, descricao="", preco=1.0, imagem="x.png")
+            )
+        usecase = ListProdutos(repo)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await usecase.execute(limit=1, sort="nome", after=cursor)
+            seen.extend(p.nome for p in page)
+            if cursor is None:
+                break
+
+        # Como no ORDER BY nome do Postgres com collation en_US.utf8
+        assert seen == [
+            "açúcar",
+            "Água",
+            "Arroz",
+            "Café",
+            "Feijão",
+            "Macarrão",
+            "Zebra",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self):
+        produtos, cursor = await ListProdutos(InMemoryProdutoRepository()).execute(
+            limit=10
+        )
+
+        assert len(produtos) == 4
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_cursor_from_other_sort(self):
+        usecase = ListProdutos(InMemoryProdutoRepository())
+        _, cursor = await usecase.execute(limit=1, sort="nome")
+
+        with pytest.raises(ValueError):
+            await usecase.execute(limit=1, sort="preco", after=cursor)
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_cursor(self):
+        with pytest.raises(ValueError):
+            await ListProdutos(InMemoryProdutoRepository()).execute(
+                limit=1, after="nao-e-um-cursor"
+            )
+
+
+class TestSearchProdutos:
+    @pytest.mark.asyncio
+    async def test_matches_ignoring_case_accents_and_plural(self):
+        usecase = SearchProdutos(InMemoryProdutoRepository())
+
+        produtos, _ = await usecase.execute("FEIJAO", limit=10)
+        assert [p.nome for p in produtos] == ["Feijão"]
+
+        produtos, _ = await usecase.execute("cafés torrados", limit=10)
+        assert [p.nome for p in produtos] == ["Café"]
+
+    @pytest.mark.asyncio
+    async def test_requires_all_terms(self):
+        usecase = SearchProdutos(InMemoryProdutoRepository())
+
+        produtos, _ = await usecase.execute("arroz espaguete", limit=10)
+
+        assert produtos == []
+
+    @pytest.mark.asyncio
+    async def test_name_matches_rank_above_description_matches(self):
+        repo = InMemoryProdutoRepository()
+        repo._index.add("9", [("Biscoito", 1.0), ("Sabor arroz doce", 0.4)])
+        repo._by_id["9"] = Produto(
+            id="9", nome="Biscoito", descricao="Sabor arroz doce", preco=3, imagem=""
+        )
+
+        produtos, _ = await SearchProdutos(repo).execute("arroz", limit=10)
+
+        assert [p.id for p in produtos] == ["1", "9"]
+
+    @pytest.mark.asyncio
+    async def test_paginates_with_cursor(self):
+        repo = InMemoryProdutoRepository()
+        for i in range(5):
+            produto = Produto(
+                id=f"m{i}", nome="Macarrão", descricao="", preco=1, imagem=""
+            )
+            repo._by_id[produto.id] = produto
+            repo._index.add(produto.id, [(produto.nome, 1.0)])
+        usecase = SearchProdutos(repo)
+
+        ids, cursor = [], None
+        while True:
+            page, cursor = await usecase.execute("macarrao", limit=2, after=cursor)
+            ids.extend(p.id for p in page)
+            if cursor is None:
+                break
+
+        assert len(ids) == len(set(ids)) == 6
+
+    @pytest.mark.asyncio
+    async def test_rejects_blank_query(self):
+        with pytest.raises(ValueError):
+            await SearchProdutos(InMemoryProdutoRepository()).execute("  ", limit=5)
+
+
+class TestGetProdutos:
+    @pytest.mark.asyncio
+    async def test_get_produto_by_id(self):
+        produto = await GetProduto(InMemoryProdutoRepository()).execute("2")
+
+        assert produto.nome == "Feijão"
+
+    @pytest.mark.asyncio
+    async def test_get_produto_missing_raises(self):
+        with pytest.raises(ValueError):
+            await GetProduto(InMemoryProdutoRepository()).execute("nao-existe")
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_request_order_and_reports_missing(self):
+        usecase = GetProdutosByIds(InMemoryProdutoRepository())
+
+        produtos, missing = await usecase.execute(["4", "x", "1", "4", "y"])
+
+        assert [p.id for p in produtos] == ["4", "1"]
+        assert missing == ["x", "y"]
+
+    @pytest.mark.asyncio
+    async def test_batch_issues_single_repository_call(
+        self, mock_produto_repository: AsyncMock
+    ):
+        mock_produto_repository.get_by_ids.return_value = []
+
+        await GetProdutosByIds(mock_produto_repository).execute(["1", "2", "1"])
+
+        mock_produto_repository.get_by_ids.assert_called_once_with(["1", "2"])
+
+
+class TestListProdutosPorPreco:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort", ["preco", "preco_desc"])
+    async def test_price_sort_pages_are_ordered_and_complete(self, sort: str):
+        usecase = ListProdutos(InMemoryProdutoRepository())
+
+        precos, cursor = [], None
+        while True:
+            page, cursor = await usecase.execute(limit=1, sort=sort, after=cursor)
+            precos.extend(p.preco for p in page)
+            if cursor is None:
+                break
+
+        assert precos == sorted(precos, reverse=sort == "preco_desc")
+        assert len(precos) == 4
+
+    @pytest.mark.asyncio
+    async def test_filters_by_price_range(self):
+        usecase = ListProdutos(InMemoryProdutoRepository())
+
+        produtos, _ = await usecase.execute(
+            limit=10, sort="preco", min_preco=Decimal("5"), max_preco=Decimal("6.49")
+        )
+
+        assert [p.nome for p in produtos] == ["Arroz", "Feijão"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_inverted_range(self):
+        with pytest.raises(ValueError):
+            await ListProdutos(InMemoryProdutoRepository()).execute(
+                limit=10, min_preco=Decimal("10"), max_preco=Decimal("1")
+            )
+
+
+class TestListProdutosPopulares:
+    @pytest.mark.asyncio
+    async def test_orders_by_favoritos_and_skips_zero(self):
+        repo = InMemoryProdutoRepository()
+        repo.favoritos_count.update({"1": 2, "3": 7, "4": 0})
+
+        ranking = await ListProdutosPopulares(repo).execute(limit=5)
+
+        assert [(p.nome, total) for p, total in ranking] == [
+            ("Macarrão", 7),
+            ("Arroz", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self):
+        repo = InMemoryProdutoRepository()
+        repo.favoritos_count.update({"1": 2, "3": 7})
+
+        ranking = await ListProdutosPopulares(repo).execute(limit=1)
+
+        assert [p.id for p, _ in ranking] == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_limit(self):
+        with pytest.raises(ValueError):
+            await ListProdutosPopulares(InMemoryProdutoRepository()).execute(limit=0)
+
+
+class TestListProdutoChanges:
+    @pytest.mark.asyncio
+    async def test_pages_through_changes_in_version_order(self):
+        repo = InMemoryProdutoRepository()
+        repo.tombstones["9"] = 5
+        usecase = ListProdutoChanges(repo)
+
+        changes, version, has_more = await usecase.execute(since=0, limit=3)
+        assert [c.produto_id for c in changes] == ["1", "2", "3"]
+        assert (version, has_more) == (3, True)
+
+        changes, version, has_more = await usecase.execute(since=version, limit=3)
+        assert [(c.produto_id, c.removed) for c in changes] == [
+            ("4", False),
+            ("9", True),
+        ]
+        assert (version, has_more) == (5, False)
+
+    @pytest.mark.asyncio
+    async def test_no_changes_keeps_version(self):
+        usecase = ListProdutoChanges(InMemoryProdutoRepository())
+
+        assert await usecase.execute(since=10, limit=5) == ([], 10, False)
+
+    @pytest.mark.asyncio
+    async def test_rejects_negative_version(self):
+        with pytest.raises(ValueError):
+            await ListProdutoChanges(InMemoryProdutoRepository()).execute(-1, 5)
+
+
+@pytest.fixture
+def repo_com_categorias() -> InMemoryProdutoRepository:
+    repo = InMemoryProdutoRepository()
+    repo.categorias.update({"graos": "Grãos", "bebidas": "Bebidas"})
+    repo.marcas.update({"camil": "Camil", "pilao": "Pilão"})
+    for id, categoria, marca in [
+        ("1", "graos", "camil"),
+        ("2", "graos", "camil"),
+        ("4", "bebidas", "pilao"),
+    ]:
+        repo._by_id[id].categoria_id = categoria
+        repo._by_id[id].marca_id = marca
+    return repo
+
+
+class TestFiltrosPorCategoria:
+    @pytest.mark.asyncio
+    async def test_lists_only_selected_categoria_and_marca(self, repo_com_categorias):
+        usecase = ListProdutos(repo_com_categorias)
+
+        graos, _ = await usecase.execute(limit=10, categoria="graos")
+        pilao, _ = await usecase.execute(limit=10, marca="pilao")
+
+        assert [p.nome for p in graos] == ["Arroz", "Feijão"]
+        assert [p.nome for p in pilao] == ["Café"]
+
+    @pytest.mark.asyncio
+    async def test_facets_ignore_their_own_filter(self, repo_com_categorias):
+        facets = await GetProdutoFacets(repo_com_categorias).execute(categoria="graos")
+
+        assert [(c.id, c.total) for c in facets.categorias] == [
+            ("graos", 2),
+            ("bebidas", 1),
+        ]
+        assert [(m.id, m.total) for m in facets.marcas] == [("camil", 2)]
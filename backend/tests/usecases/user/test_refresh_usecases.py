@@ -0,0 +1,117 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from mercearia.domain.entities.user import User
+from mercearia.domain.repositories.user_repository import UserRepository
+from mercearia.domain.value_objects.email_vo import Email
+from mercearia.domain.value_objects.password_vo import HashedPassword
+from mercearia.infra.repositories.in_memory_refresh_token_repository import (
+    InMemoryRefreshTokenRepository,
+)
+from mercearia.usecases.user.issue_refresh_token import IssueRefreshToken
+from mercearia.usecases.user.refresh_session import RefreshSession
+from mercearia.usecases.user.revoke_refresh_token import RevokeRefreshToken
+
+TTL = timedelta(days=1)
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        id="user1",
+        name="Miguel Ferrari",
+        email=Email("admin@merceariaferrari.com"),
+        password=HashedPassword("hash"),
+        role="admin",
+    )
+
+
+@pytest.fixture
+def mock_user_repository(user: User) -> AsyncMock:
+    repo = AsyncMock(spec=UserRepository)
+    repo.get_by_id.return_value = user
+    return repo
+
+
+@pytest.fixture
+def refresh_repository() -> InMemoryRefreshTokenRepository:
+    return InMemoryRefreshTokenRepository()
+
+
+class TestRefreshSession:
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_token(
+        self, user, mock_user_repository, refresh_repository
+    ):
+        """Um refresh válido devolve o usuário e um novo token diferente."""
+        first = await IssueRefreshToken(refresh_repository, TTL).execute(user)
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+
+        refreshed_user, second = await usecase.execute(first)
+
+        assert refreshed_user is user
+        assert second != first
+        # Versão do token conferida no banco, não no cache de usuários
+        mock_user_repository.get_by_id.assert_called_once_with("user1", fresh=True)
+        mock_user_repository.set_current_user.assert_called_once_with(user)
+
+    @pytest.mark.asyncio
+    async def test_reusing_rotated_token_revokes_family(
+        self, user, mock_user_repository, refresh_repository
+    ):
+        """Reapresentar um token já trocado derruba também o sucessor."""
+        first = await IssueRefreshToken(refresh_repository, TTL).execute(user)
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+        _, second = await usecase.execute(first)
+
+        with pytest.raises(ValueError, match="Refresh token inválido"):
+            await usecase.execute(first)
+        with pytest.raises(ValueError, match="Refresh token inválido"):
+            await usecase.execute(second)
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_rejected(
+        self, user, mock_user_repository, refresh_repository
+    ):
+        token = await IssueRefreshToken(
+            refresh_repository, timedelta(seconds=-1)
+        ).execute(user)
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+
+        with pytest.raises(ValueError, match="Refresh token expirado"):
+            await usecase.execute(token)
+
+    @pytest.mark.asyncio
+    async def test_password_change_invalidates_token(
+        self, user, mock_user_repository, refresh_repository
+    ):
+        token = await IssueRefreshToken(refresh_repository, TTL).execute(user)
+        user.token_version += 1
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+
+        with pytest.raises(ValueError, match="Refresh token inválido"):
+            await usecase.execute(token)
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_is_rejected(
+        self, mock_user_repository, refresh_repository
+    ):
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+
+        with pytest.raises(ValueError, match="Refresh token inválido"):
+            await usecase.execute("token-inexistente")
+        mock_user_repository.get_by_id.assert_not_called()
+
+
+class TestRevokeRefreshToken:
+    @pytest.mark.asyncio
+    async def test_revoked_token_cannot_refresh(
+        self, user, mock_user_repository, refresh_repository
+    ):
+        token = await IssueRefreshToken(refresh_repository, TTL).execute(user)
+
+        await RevokeRefreshToken(refresh_repository).execute(token)
+
+        usecase = RefreshSession(refresh_repository, mock_user_repository, TTL)
+        with pytest.raises(ValueError):
+            await usecase.execute(token)